@@ -1,523 +1,3015 @@
-import openpyxl
 import sqlite3
 import os
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from tkinter.scrolledtext import ScrolledText
+import sys
+import json
+import argparse
+import datetime
+import re
+import itertools
+import hashlib
+import pathlib
+import time
+import io
+import cProfile
+import pstats
+import tracemalloc
+import multiprocessing
+import queue
+import threading
+import csv
+import zipfile
+import posixpath
+import importlib.util
+from xml.etree import ElementTree
+from concurrent.futures import ProcessPoolExecutor
 
-def excel_to_sqlite(excel_configs, db_file='test.db', log_callback=None):
+# 진행 로그 출력 간격 (행 수)
+PROGRESS_LOG_INTERVAL = 1000
+
+# 병렬 변환 시 워커당 이벤트 큐에 쌓아 둘 수 있는 최대 배치 수
+QUEUE_BATCHES_PER_WORKER = 4
+
+# 변환 원본 파일 정보를 기록하는 테이블 이름
+MANIFEST_TABLE = '_conversion_manifest'
+
+# 변환 결과(컬럼 타입, 기본 키, 인덱스, 읽은 값)에 영향을 주는 테이블 설정. 바뀌면 원본이 같아도 다시 변환
+CONVERSION_OPTION_KEYS = ('reader', 'delimiter', 'encoding', 'infer_types', 'type_sample_rows', 'column_types',
+                          'primary_key', 'index_columns', 'key_column')
+
+# 검색용으로 해석한 컬럼 정보를 저장하는 테이블 이름
+SCHEMA_TABLE = '_resolved_schema'
+
+# 컬럼별 엑셀 원래 헤더 텍스트를 기록하는 테이블 이름
+HEADER_TABLE = '_column_headers'
+
+# 대량 적재(bulk load) 프로파일의 SQLite 설정: 페이지 크기(바이트)와 페이지 캐시 크기(KB)
+BULK_PAGE_SIZE = 16384
+BULK_CACHE_SIZE_KB = 256 * 1024
+
+# 기본 데이터베이스 파일
+DEFAULT_DB_FILE = "mgui2.db"
+
+# 인터페이스 전문 검색 인덱스(FTS5) 테이블 이름과 검색 결과 최대 건수
+SEARCH_INDEX_TABLE = 'interface_search'
+SEARCH_RESULT_LIMIT = 50
+
+# trigram 토크나이저로 찾을 수 있는 최소 검색어 길이 (더 짧으면 LIKE로 비교)
+TRIGRAM_MIN_LENGTH = 3
+
+# 매핑SEQ별 상세 정보를 미리 계산해 두는 테이블 이름
+INTERFACE_VIEW_TABLE = 'interface_view'
+
+# 테이블별 프로파일 결과에 남길 함수 수와 메모리 할당 위치 수
+PROFILE_TOP_FUNCTIONS = 30
+MEMORY_TOP_ALLOCATIONS = 10
+
+# 작업공간 변환 순서 (같은 우선순위 안에서 오래된 순서, 원본이 작은 순서)와 자동 새로 고침 기본 주기(초)
+SCHEDULE_ORDERS = ('stale', 'size')
+DEFAULT_REFRESH_INTERVAL = 30
+
+# 스냅샷 형식 (auto는 pyarrow가 있으면 Parquet, 없으면 열 청크 형식)
+SNAPSHOT_FORMATS = ('auto', 'parquet', 'columns')
+
+# 읽기 전용 연결에서 재사용할 준비된 문장(prepared statement) 수
+STATEMENT_CACHE_SIZE = 256
+
+# 정리 결과를 기억해 둘 최대 헤더 텍스트 수와 헤더 행 수
+HEADER_CACHE_SIZE = 4096
+HEADER_ROW_CACHE_SIZE = 256
+
+# 컬럼 이름 정리에 사용하는 정규식 (특수문자, 연속된 공백)
+COLUMN_SPECIAL_CHAR_RE = re.compile(r'[^\w\s]')
+COLUMN_WHITESPACE_RE = re.compile(r'\s+')
+
+# 컬럼 이름으로 쓰면 뒤에 '_col'을 붙이는 SQLite 예약어
+SQLITE_RESERVED_WORDS = frozenset([
+    'add', 'all', 'alter', 'and', 'as', 'autoincrement', 'between', 'case', 'check', 'collate',
+    'commit', 'constraint', 'create', 'default', 'deferrable', 'delete', 'distinct', 'drop',
+    'else', 'escape', 'except', 'exists', 'foreign', 'from', 'group', 'having', 'if', 'in',
+    'index', 'insert', 'intersect', 'into', 'is', 'isnull', 'join', 'limit', 'not', 'notnull',
+    'null', 'on', 'or', 'order', 'primary', 'references', 'select', 'set', 'table', 'then',
+    'to', 'transaction', 'union', 'unique', 'update', 'using', 'values', 'when', 'where',
+])
+
+
+class ConversionCancelled(Exception):
+    """사용자 요청으로 변환이 중단되었을 때 발생합니다."""
+
+
+class HeaderNormalizer:
     """
-    엑셀 파일의 데이터를 SQLite 데이터베이스로 변환합니다.
+    엑셀 헤더를 SQLite 컬럼 이름으로 정리하는 구성 요소입니다.
     
-    Args:
-        excel_configs (dict): 엑셀 파일 구성 정보를 담은 딕셔너리
-        db_file (str): SQLite 데이터베이스 파일 경로
-        log_callback (function): 로그 메시지를 표시하기 위한 콜백 함수
+    같은 헤더 텍스트는 여러 시트와 반복되는 변환에서 계속 나오므로 원래 텍스트 -> 정리한 이름과
+    헤더 행 -> 해석 결과를 기억해 둡니다. 변환(read_excel_table)과 검색 쪽 컬럼 판별(find_header_column)이
+    모듈의 HEADER_NORMALIZER를 함께 사용하므로 두 쪽의 이름 규칙이 항상 같습니다.
     """
-    def log(message):
-        if log_callback:
-            log_callback(message)
-        else:
-            print(message)
     
-    def clean_column_name(name):
+    def __init__(self, cache_size=HEADER_CACHE_SIZE, row_cache_size=HEADER_ROW_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.row_cache_size = row_cache_size
+        self._names = {}  # 원래 헤더 텍스트 -> 컬럼 이름
+        self._rows = {}  # 헤더 행 튜플 -> resolve 결과
+    
+    def clean(self, name):
         """컬럼 이름에서 공백과 특수문자를 제거하고 SQLite에 적합한 이름으로 변환합니다."""
         if name is None:
             return ""
-        
-        # 문자열로 변환
-        name = str(name).strip()
+        text = str(name)
+        cleaned = self._names.get(text)
+        if cleaned is None:
+            cleaned = self._clean_text(text)
+            if len(self._names) >= self.cache_size:
+                self._names.clear()
+            self._names[text] = cleaned
+        return cleaned
+    
+    @staticmethod
+    def _clean_text(text):
+        name = text.strip()
         
         # 빈 이름 처리
         if not name:
             return ""
         
         # 공백과 특수문자를 언더스코어로 대체
-        import re
-        name = re.sub(r'[^\w\s]', '_', name)  # 특수문자를 언더스코어로 변환
-        name = re.sub(r'\s+', '_', name)      # 공백을 언더스코어로 변환
+        name = COLUMN_SPECIAL_CHAR_RE.sub('_', name)  # 특수문자를 언더스코어로 변환
+        name = COLUMN_WHITESPACE_RE.sub('_', name)    # 공백을 언더스코어로 변환
         
         # SQLite 예약어 처리
-        reserved_words = ['add', 'all', 'alter', 'and', 'as', 'autoincrement', 'between', 'case', 'check', 'collate', 
-                         'commit', 'constraint', 'create', 'default', 'deferrable', 'delete', 'distinct', 'drop', 
-                         'else', 'escape', 'except', 'exists', 'foreign', 'from', 'group', 'having', 'if', 'in', 
-                         'index', 'insert', 'intersect', 'into', 'is', 'isnull', 'join', 'limit', 'not', 'notnull', 
-                         'null', 'on', 'or', 'order', 'primary', 'references', 'select', 'set', 'table', 'then', 
-                         'to', 'transaction', 'union', 'unique', 'update', 'using', 'values', 'when', 'where']
-        
-        if name.lower() in reserved_words:
+        if name.lower() in SQLITE_RESERVED_WORDS:
             name = name + '_col'
         
         # 숫자로 시작하는 경우 앞에 'col_' 추가
         if name and name[0].isdigit():
             name = 'col_' + name
-            
+        
         return name
     
-    # SQLite 데이터베이스 연결
-    conn = sqlite3.connect(db_file)
-    cursor = conn.cursor()
-    
-    # 각 엑셀 설정에 대해 처리
-    for table_name, config in excel_configs.items():
-        log(f"테이블 '{table_name}' 처리 중...")
-        
-        # 엑셀 파일 열기
-        try:
-            log(f"엑셀 파일 '{config['path']}' 열기...")
-            workbook = openpyxl.load_workbook(config['path'], read_only=True, data_only=True)
-            sheet = workbook[config['sheet_name']]
-            log(f"시트 '{config['sheet_name']}' 로드 완료")
-        except Exception as e:
-            log(f"엑셀 파일 '{config['path']}' 열기 실패: {e}")
-            continue
+    def resolve(self, header_row):
+        """
+        헤더 행을 컬럼 목록으로 해석합니다. 이름이 빈 헤더는 건너뛰고, 중복된 이름에는 _1, _2, ...를 붙입니다.
         
-        # 헤더 행 결정 (book2는 두 번째 행을 헤더로 사용)
-        header_row_num = 1  # 기본값은 첫 번째 행
-        if 'header_row' in config:
-            header_row_num = config['header_row']
+        Args:
+            header_row (tuple): 헤더 행의 값
         
-        # 헤더 행에서 컬럼 이름 가져오기
-        header_row = next(sheet.iter_rows(min_row=header_row_num, max_row=header_row_num))
-        column_names = []
-        column_indices = []  # 유효한 컬럼의 인덱스를 저장
-        column_name_counts = {}  # 중복 컬럼 이름 처리를 위한 딕셔너리
+        Returns:
+            tuple: (원본 열 인덱스, 컬럼 이름, 원래 헤더 텍스트) 튜플의 튜플
+        """
+        # 1과 1.0, True처럼 값은 같아도 이름이 달라지는 헤더가 있으므로 문자열로 바꾼 행을 키로 사용
+        key = tuple(None if value is None else str(value) for value in header_row)
+        columns = self._rows.get(key)
+        if columns is not None:
+            return columns
         
-        for idx, cell in enumerate(header_row):
-            col_name = clean_column_name(cell.value)
+        columns = []
+        column_name_counts = {}  # 중복 컬럼 이름 처리를 위한 딕셔너리 (이름 -> 마지막으로 붙인 번호)
+        used_names = set()
+        for idx, header_value in enumerate(key):
+            col_name = self.clean(header_value)
             
             # 빈 컬럼 이름은 무시
             if not col_name:
                 continue
-                
-            # 중복 컬럼 이름 처리
-            if col_name in column_name_counts:
-                column_name_counts[col_name] += 1
-                col_name = f"{col_name}_{column_name_counts[col_name]}"
-            else:
-                column_name_counts[col_name] = 0
-                
-            column_names.append(col_name)
-            column_indices.append(idx)  # 유효한 컬럼의 인덱스 저장
+            
+            # 중복 컬럼 이름 처리 (번호를 붙인 이름이 다른 헤더와 같아지는 경우도 피함)
+            base_name = col_name
+            while col_name in used_names:
+                column_name_counts[base_name] = column_name_counts.get(base_name, 0) + 1
+                col_name = f"{base_name}_{column_name_counts[base_name]}"
+            used_names.add(col_name)
+            
+            columns.append((idx, col_name, header_value.strip()))
         
-        log(f"컬럼: {', '.join(column_names)}")
+        columns = tuple(columns)
+        if len(self._rows) >= self.row_cache_size:
+            self._rows.clear()
+        self._rows[key] = columns
+        return columns
+
+
+# 변환과 검색이 함께 사용하는 헤더 정리기
+HEADER_NORMALIZER = HeaderNormalizer()
+
+
+def clean_column_name(name):
+    """컬럼 이름에서 공백과 특수문자를 제거하고 SQLite에 적합한 이름으로 변환합니다."""
+    return HEADER_NORMALIZER.clean(name)
+
+
+class OpenpyxlSheetReader:
+    """openpyxl 읽기 전용 모드로 시트를 읽는 리더입니다. 셀마다 객체를 만들므로 큰 시트에서는 느립니다."""
+    
+    backend = 'openpyxl'
+    
+    def __init__(self, config):
+        # 불러오는 데 시간이 걸리고 xlsx 스트리밍 리더와 CSV 리더는 필요 없으므로 사용할 때만 불러옴
+        try:
+            import openpyxl
+        except ImportError:
+            raise RuntimeError("openpyxl 리더를 사용하려면 openpyxl 패키지가 필요합니다.")
+        self._workbook = openpyxl.load_workbook(config['path'], read_only=True, data_only=True)
+        try:
+            self._sheet = self._workbook[config['sheet_name']]
+        except Exception:
+            self._workbook.close()
+            raise
+    
+    def iter_rows(self, min_row=1, max_row=None):
+        return self._sheet.iter_rows(min_row=min_row, max_row=max_row, values_only=True)
+    
+    def close(self):
+        self._workbook.close()
+
+
+# 관계 파일에 없을 때 사용하는 xlsx 패키지 기본 경로와 openpyxl이 날짜로 읽는 기본 표시 형식 번호
+XLSX_RELATIONSHIP_TYPES = {
+    'officeDocument': 'xl/workbook.xml',
+    'sharedStrings': 'xl/sharedStrings.xml',
+    'styles': 'xl/styles.xml',
+}
+XLSX_BUILTIN_DATE_FORMATS = {14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47}
+XLSX_BUILTIN_TIMEDELTA_FORMATS = {46}
+XLSX_WINDOWS_EPOCH = datetime.datetime(1899, 12, 30)
+XLSX_MAC_EPOCH = datetime.datetime(1904, 1, 1)
+
+# 날짜 판별 전에 표시 형식에서 지울 부분 ([h]/[m]/[s]를 제외한 대괄호, 따옴표 문자열, 이스케이프 문자 등)
+DATE_FORMAT_STRIP_RE = re.compile(r'\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]|"[^"]*"|\\.|_.|\*.')
+DATE_FORMAT_CHAR_RE = re.compile(r'(?<![_\\])[dmhysDMHYS]')
+TIMEDELTA_FORMAT_RE = re.compile(r'\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?', re.IGNORECASE)
+
+
+def _xml_local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _xml_text_content(element):
+    # 서식 있는 문자열(<r><t>)도 이어 붙이고, 윗주(<rPh>)는 제외 (openpyxl과 같은 규칙)
+    texts = []
+    for child in element:
+        name = _xml_local_name(child.tag)
+        if name == 't':
+            texts.append(child.text or "")
+        elif name == 'r':
+            texts.extend(grandchild.text or "" for grandchild in child if _xml_local_name(grandchild.tag) == 't')
+    return "".join(texts)
+
+
+_COLUMN_INDEXES = {}
+
+
+def _column_index(reference, cache=_COLUMN_INDEXES):
+    # 'AB12' 같은 셀 주소의 열 번호(1부터)
+    letters = reference.rstrip('0123456789')
+    index = cache.get(letters)
+    if index is None:
+        index = 0
+        for letter in letters.upper():
+            index = index * 26 + ord(letter) - 64
+        cache[letters] = index
+    return index
+
+
+def _excel_serial_to_datetime(value, epoch, timedelta=False):
+    # openpyxl.utils.datetime.from_excel과 같은 방식으로 엑셀 일련번호를 변환
+    if timedelta:
+        result = datetime.timedelta(days=value)
+        if result.microseconds:
+            result = datetime.timedelta(seconds=result.total_seconds() // 1,
+                                        microseconds=round(result.microseconds, -3))
+        return result
+    day, fraction = divmod(value, 1)
+    diff = datetime.timedelta(milliseconds=round(fraction * 86400 * 1000))
+    if 0 <= value < 1 and diff.days == 0:
+        minutes, seconds = divmod(diff.seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return datetime.time(hours, minutes, seconds, diff.microseconds)
+    if 0 < value < 60 and epoch == XLSX_WINDOWS_EPOCH:
+        day += 1
+    return epoch + datetime.timedelta(days=day) + diff
+
+
+class XlsxSheetReader:
+    """
+    xlsx 파일의 시트 XML과 공유 문자열 표를 iterparse로 직접 스트리밍해 읽는 리더입니다.
+    
+    셀 객체를 만들지 않고 값 튜플만 생성하므로 openpyxl 리더보다 빠르며, 표준 라이브러리만 사용합니다.
+    값 해석(숫자, 공유 문자열, 날짜 형식, 1904 날짜 체계 등)은 openpyxl의 data_only 읽기와 같게 맞춥니다.
+    """
+    
+    backend = 'xlsx'
+    
+    def __init__(self, config):
+        self._archive = zipfile.ZipFile(config['path'])
+        try:
+            names = set(self._archive.namelist())
+            package_rels = self._read_relationships('', '_rels/.rels')
+            workbook_path = next((path for _, rel_type, path in package_rels if rel_type == 'officeDocument'),
+                                 XLSX_RELATIONSHIP_TYPES['officeDocument'])
+            workbook_dir = posixpath.dirname(workbook_path)
+            workbook_rels = self._read_relationships(
+                workbook_dir, posixpath.join(workbook_dir, '_rels', posixpath.basename(workbook_path) + '.rels'))
+            targets = {rel_id: path for rel_id, _, path in workbook_rels}
+            parts = {}
+            for _, rel_type, path in workbook_rels:
+                parts.setdefault(rel_type, path)
+            
+            # 시트 이름으로 시트 XML 경로 찾기, 1904 날짜 체계 여부 확인
+            self._epoch = XLSX_WINDOWS_EPOCH
+            sheet_path = None
+            root = ElementTree.fromstring(self._archive.read(workbook_path))
+            self._namespace = root.tag[:root.tag.index('}') + 1] if root.tag.startswith('{') else ''  # 시트도 같은 이름공간
+            for element in root.iter():
+                name = _xml_local_name(element.tag)
+                if name == 'workbookPr' and element.get('date1904', '').lower() in ('1', 'true'):
+                    self._epoch = XLSX_MAC_EPOCH
+                elif name == 'sheet' and element.get('name') == str(config['sheet_name']):
+                    rel_id = next((value for key, value in element.attrib.items() if key.endswith('}id')), None)
+                    sheet_path = targets.get(rel_id)
+            if sheet_path is None or sheet_path not in names:
+                raise KeyError(f"Worksheet {config['sheet_name']} does not exist.")
+            self._sheet_path = sheet_path
+            
+            self._shared_strings = self._read_shared_strings(
+                parts.get('sharedStrings', XLSX_RELATIONSHIP_TYPES['sharedStrings']))
+            self._date_styles, self._timedelta_styles = self._read_date_styles(
+                parts.get('styles', XLSX_RELATIONSHIP_TYPES['styles']))
+        except Exception:
+            self._archive.close()
+            raise
+    
+    def _read_relationships(self, base_dir, rels_path):
+        # 관계 파일의 (관계 ID, 관계 종류, 패키지 안 경로) 목록
+        if rels_path not in self._archive.namelist():
+            return []
+        relationships = []
+        for element in ElementTree.fromstring(self._archive.read(rels_path)):
+            if element.get('TargetMode') == 'External':
+                continue
+            target = element.get('Target', '')
+            path = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join(base_dir, target))
+            relationships.append((element.get('Id'), element.get('Type', '').rsplit('/', 1)[-1], path))
+        return relationships
+    
+    def _read_shared_strings(self, path):
+        if not path or path not in self._archive.namelist():
+            return []
+        strings = []
+        with self._archive.open(path) as source:
+            for _, element in ElementTree.iterparse(source):
+                if _xml_local_name(element.tag) == 'si':
+                    strings.append(_xml_text_content(element).replace('x005F_', ''))
+                    element.clear()
+        return strings
+    
+    def _read_date_styles(self, path):
+        # 날짜/시간 표시 형식이 적용된 셀 스타일 번호 집합
+        date_styles, timedelta_styles = set(), set()
+        if not path or path not in self._archive.namelist():
+            return date_styles, timedelta_styles
         
-        # 테이블이 존재하면 삭제
-        cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+        root = ElementTree.fromstring(self._archive.read(path))
+        custom_formats = {}
+        cell_formats = []
+        for element in root:
+            name = _xml_local_name(element.tag)
+            if name == 'numFmts':
+                custom_formats = {int(fmt.get('numFmtId')): fmt.get('formatCode', '') for fmt in element}
+            elif name == 'cellXfs':
+                cell_formats = [int(xf.get('numFmtId', 0)) for xf in element]
         
-        # 테이블 생성
-        create_table_sql = f"CREATE TABLE {table_name} ({', '.join([f'{col} TEXT' for col in column_names])})"
-        cursor.execute(create_table_sql)
-        log(f"테이블 '{table_name}' 생성 완료")
+        for style_id, format_id in enumerate(cell_formats):
+            if format_id in custom_formats:
+                format_code = custom_formats[format_id].split(';')[0]
+                if DATE_FORMAT_CHAR_RE.search(DATE_FORMAT_STRIP_RE.sub('', format_code)):
+                    date_styles.add(style_id)
+                if TIMEDELTA_FORMAT_RE.match(format_code):
+                    timedelta_styles.add(style_id)
+            else:
+                if format_id in XLSX_BUILTIN_DATE_FORMATS:
+                    date_styles.add(style_id)
+                if format_id in XLSX_BUILTIN_TIMEDELTA_FORMATS:
+                    timedelta_styles.add(style_id)
+        return date_styles, timedelta_styles
+    
+    def _iter_sheet_rows(self):
+        """시트 XML의 (행 번호, 값 튜플)을 차례로 생성합니다. 값이 없는 행은 XML에 없으므로 생성되지 않습니다."""
+        shared_strings = self._shared_strings
+        date_styles = self._date_styles
+        timedelta_styles = self._timedelta_styles
+        epoch = self._epoch
         
-        # 데이터 시작 행 결정
-        data_start_row = header_row_num + 1
+        namespace = self._namespace
+        row_tag, cell_tag, value_tag, inline_tag = f'{namespace}row', f'{namespace}c', f'{namespace}v', f'{namespace}is'
         
-        # 데이터 삽입
-        rows = []
-        row_count = 0
-        for row in sheet.iter_rows(min_row=data_start_row):  # 헤더 다음 행부터 시작
-            row_data = []
-            for idx in column_indices:  # 유효한 컬럼만 처리
-                cell_value = row[idx].value
-                row_data.append(str(cell_value) if cell_value is not None else "")
-            
-            if any(row_data):  # 빈 행은 건너뜀
-                rows.append(row_data)
-                row_count += 1
+        # 행이 끝날 때만 처리하고 읽은 행의 셀은 바로 비움 (openpyxl과 같은 방식이며 start 이벤트는 받지 않음)
+        with self._archive.open(self._sheet_path) as source:
+            row_number = 0
+            for _, element in ElementTree.iterparse(source):
+                if element.tag != row_tag:
+                    continue
                 
-                # 1000행마다 데이터베이스에 삽입하고 로그 출력
-                if row_count % 1000 == 0:
-                    log(f"{row_count}행 처리 중...")
+                row_ref = element.get('r')
+                row_number = int(float(row_ref)) if row_ref else row_number + 1
+                values = []
+                column_counter = 0
+                for cell in element:
+                    if cell.tag != cell_tag:
+                        continue
+                    cell_type = cell.get('t', 'n')
+                    value_element = cell.find(value_tag)
+                    text = value_element.text if value_element is not None and cell_type != 'inlineStr' else None
+                    value = None
+                    if text:
+                        if cell_type == 'n':
+                            value = float(text) if '.' in text or 'E' in text or 'e' in text else int(text)
+                            style_id = int(cell.get('s') or 0)
+                            if style_id in date_styles:
+                                try:
+                                    value = _excel_serial_to_datetime(value, epoch, style_id in timedelta_styles)
+                                except (OverflowError, ValueError):
+                                    value = "#VALUE!"
+                        elif cell_type == 's':
+                            value = shared_strings[int(text)]
+                        elif cell_type == 'b':
+                            value = bool(int(text))
+                        elif cell_type == 'd':
+                            value = datetime.datetime.fromisoformat(text.rstrip('Z'))
+                        else:  # str(수식 문자열 결과), e(오류 값)
+                            value = text
+                    elif cell_type == 'inlineStr':
+                        inline = cell.find(inline_tag)
+                        if inline is not None:
+                            value = _xml_text_content(inline)
+                    
+                    # 셀 주소가 있으면 그 열에, 없으면 다음 열에 놓음
+                    cell_ref = cell.get('r')
+                    if cell_ref:
+                        column = _column_index(cell_ref)
+                    else:
+                        column_counter += 1
+                        column = column_counter
+                    if column > len(values):
+                        values.extend([None] * (column - len(values) - 1))
+                        values.append(value)
+                    else:
+                        values[column - 1] = value
+                
+                element.clear()
+                yield row_number, tuple(values)
+    
+    def iter_rows(self, min_row=1, max_row=None):
+        """min_row부터 max_row까지의 값 튜플을 생성합니다. 중간에 빠진 행은 빈 튜플로 채웁니다."""
+        expected = min_row
+        for row_number, values in self._iter_sheet_rows():
+            if max_row is not None and row_number > max_row:
+                break
+            if row_number < expected:
+                continue
+            while expected < row_number:
+                yield ()
+                expected += 1
+            yield values
+            expected += 1
+        if max_row is not None:
+            while expected <= max_row:
+                yield ()
+                expected += 1
+    
+    def close(self):
+        self._archive.close()
+
+
+class CsvSheetReader:
+    """
+    CSV/TSV 파일을 시트처럼 읽는 리더입니다. 모든 값은 문자열이며 빈 칸은 빈 문자열입니다.
+    
+    config의 delimiter(기본값: 확장자가 .tsv면 탭, 아니면 쉼표)와 encoding(기본값: UTF-8을 시도하고
+    실패하면 cp949)을 사용합니다. sheet_name은 사용하지 않습니다.
+    """
+    
+    backend = 'csv'
+    
+    def __init__(self, config):
+        self._path = config['path']
+        self._delimiter = config.get('delimiter') or ('\t' if self._path.lower().endswith('.tsv') else ',')
+        self._encoding = config.get('encoding') or detect_text_encoding(self._path)
+        self._file = None
+    
+    def iter_rows(self, min_row=1, max_row=None):
+        # 헤더 행과 데이터 행을 각각 읽을 수 있도록 호출할 때마다 파일을 새로 엶
+        with open(self._path, encoding=self._encoding, newline='') as f:
+            rows = csv.reader(f, delimiter=self._delimiter)
+            for row in itertools.islice(rows, min_row - 1, max_row):
+                yield tuple(row)
+    
+    def close(self):
+        pass
+
+
+def detect_text_encoding(path, sample_size=1024 * 1024):
+    """텍스트 파일 앞부분이 UTF-8로 읽히면 'utf-8-sig', 아니면 'cp949'를 반환합니다."""
+    with open(path, 'rb') as f:
+        sample = f.read(sample_size)
+    try:
+        sample.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # 표본 끝에서 잘린 멀티바이트 문자는 UTF-8로 봄
+        if e.start < len(sample) - 3:
+            return 'cp949'
+    return 'utf-8-sig'
+
+
+# 원본 리더 (config의 reader로 선택)
+SHEET_READERS = {
+    'openpyxl': OpenpyxlSheetReader,
+    'xlsx': XlsxSheetReader,
+    'csv': CsvSheetReader,
+}
+
+# 확장자별 자동 선택 순서 (앞의 리더로 열지 못하면 다음 리더로 시도)
+AUTO_SHEET_READERS = {
+    '.csv': ['csv'],
+    '.tsv': ['csv'],
+    '.txt': ['csv'],
+    '.xlsx': ['xlsx', 'openpyxl'],
+    '.xlsm': ['xlsx', 'openpyxl'],
+}
+
+
+def open_sheet_reader(config):
+    """
+    config의 reader(auto, openpyxl, xlsx, csv)에 맞는 시트 리더를 엽니다.
+    
+    auto(기본값)이면 확장자에 따라 가장 빠른 리더를 고릅니다. xlsx 파일은 스트리밍 리더로 먼저 열고,
+    열 수 없는 구조이면 openpyxl 리더로 다시 엽니다.
+    
+    Returns:
+        iter_rows(min_row, max_row)로 값 튜플을 생성하고 close()로 닫는 리더
+    """
+    reader = config.get('reader', 'auto')
+    if reader != 'auto':
+        if reader not in SHEET_READERS:
+            raise ValueError(f"지원하지 않는 리더입니다: {reader} (사용 가능: auto, {', '.join(SHEET_READERS)})")
+        return SHEET_READERS[reader](config)
+    
+    candidates = AUTO_SHEET_READERS.get(os.path.splitext(config['path'])[1].lower(), ['openpyxl'])
+    error = None
+    for candidate in candidates:
+        if candidate == 'openpyxl' and error is not None and importlib.util.find_spec('openpyxl') is None:
+            raise error  # 대신 열 리더가 없으면 처음 오류를 그대로 전달
+        try:
+            return SHEET_READERS[candidate](config)
+        except Exception as e:
+            if candidate == candidates[-1]:
+                raise
+            error = e
+
+
+def is_text_source(config):
+    """config의 원본을 CSV/TSV 리더로 읽는지 여부를 반환합니다. 텍스트 원본에는 sheet_name이 필요 없습니다."""
+    reader = config.get('reader', 'auto')
+    if reader != 'auto':
+        return reader == 'csv'
+    return AUTO_SHEET_READERS.get(os.path.splitext(config.get('path', ''))[1].lower()) == ['csv']
+
+
+def compare_sheet_readers(config, backends=('openpyxl', 'xlsx'), max_differences=20):
+    """
+    두 리더가 같은 시트에서 같은 행을 읽는지 비교합니다 (리더 동등성 점검).
+    
+    행 끝의 빈 칸(None)은 리더마다 채우는 방식이 달라 제외하고, 값은 타입까지 비교합니다.
+    
+    Args:
+        config (dict): 테이블 하나의 엑셀 설정
+        backends (tuple): 비교할 두 리더 이름
+        max_differences (int): 기록할 최대 차이 수
+    
+    Returns:
+        dict: rows(비교한 행 수), differences([(행 번호, 첫 리더 값, 둘째 리더 값), ...]), difference_count
+    """
+    def normalized(row):
+        row = list(row)
+        while row and row[-1] is None:
+            row.pop()
+        return [(type(value).__name__, value) for value in row]
+    
+    readers = [SHEET_READERS[backend](config) for backend in backends]
+    try:
+        differences = []
+        difference_count = 0
+        row_count = 0
+        for row_number, (first, second) in enumerate(itertools.zip_longest(
+                readers[0].iter_rows(), readers[1].iter_rows(), fillvalue=()), start=1):
+            row_count += 1
+            first, second = normalized(first), normalized(second)
+            if first != second:
+                difference_count += 1
+                if len(differences) < max_differences:
+                    differences.append((row_number, [value for _, value in first], [value for _, value in second]))
+        return {'rows': row_count, 'differences': differences, 'difference_count': difference_count}
+    finally:
+        for reader in readers:
+            reader.close()
+
+
+def iter_counted_rows(rows, stats):
+    """시트 행 이터레이터를 감싸 읽은 행 수(rows_read)와 리더가 행을 읽는 데 쓴 시간(sheet_read_s)을 누적합니다."""
+    rows = iter(rows)
+    perf_counter = time.perf_counter
+    while True:
+        started = perf_counter()
+        row = next(rows, None)
+        stats['sheet_read_s'] += perf_counter() - started
+        if row is None:
+            return
+        stats['rows_read'] += 1
+        yield row
+
+
+def iter_data_rows(sheet, data_start_row, column_indices, stats=None):
+    """
+    시트의 데이터 행을 하나씩 읽어 유효한 컬럼 값만 담은 리스트로 생성합니다.
+    
+    전체 행을 메모리에 모으지 않고 값 튜플을 한 행씩 흘려보내며, 빈 행은 건너뜁니다.
+    
+    Args:
+        sheet: 시트 리더 (open_sheet_reader 참고)
+        data_start_row (int): 데이터가 시작되는 행 번호
+        column_indices (list): 유효한 컬럼의 인덱스 목록
+        stats (dict): 지정하면 읽은 행 수, 건너뛴 빈 행 수(rows_empty), 시트 읽기 시간을 누적
+    """
+    rows = sheet.iter_rows(min_row=data_start_row)
+    if stats is not None:
+        rows = iter_counted_rows(rows, stats)
+    for row in rows:
+        row_data = []
+        for idx in column_indices:  # 유효한 컬럼만 처리
+            cell_value = row[idx] if idx < len(row) else None
+            row_data.append(str(cell_value) if cell_value is not None else "")
         
-        # 데이터 일괄 삽입
-        placeholders = ', '.join(['?' for _ in column_names])
-        insert_sql = f"INSERT INTO {table_name} ({', '.join(column_names)}) VALUES ({placeholders})"
-        cursor.executemany(insert_sql, rows)
-        log(f"총 {len(rows)}행 삽입 완료")
+        if any(row_data):  # 빈 행은 건너뜀
+            yield row_data
+        elif stats is not None:
+            stats['rows_empty'] += 1
+
+
+def iter_row_values(sheet, data_start_row, column_indices, stats=None):
+    """
+    유효한 컬럼의 원래 값(숫자, 날짜 등)을 문자열로 바꾸지 않고 한 행씩 생성합니다. 빈 행은 건너뜁니다.
+    
+    Args:
+        sheet: 시트 리더 (open_sheet_reader 참고)
+        data_start_row (int): 데이터가 시작되는 행 번호
+        column_indices (list): 유효한 컬럼의 인덱스 목록
+        stats (dict): 지정하면 읽은 행 수, 건너뛴 빈 행 수(rows_empty), 시트 읽기 시간을 누적
+    """
+    rows = sheet.iter_rows(min_row=data_start_row)
+    if stats is not None:
+        rows = iter_counted_rows(rows, stats)
+    for row in rows:
+        values = [row[idx] if idx < len(row) else None for idx in column_indices]
+        if any(value is not None and value != "" for value in values):  # 빈 행은 건너뜀
+            yield values
+        elif stats is not None:
+            stats['rows_empty'] += 1
+
+
+def infer_column_types(sample_rows, column_count):
+    """
+    표본 행의 값으로 컬럼별 SQLite 타입을 추론합니다.
+    
+    비어 있지 않은 값이 모두 정수이면 INTEGER, 정수/실수이면 REAL, 모두 날짜/시각이면 DATE(ISO 문자열),
+    그 외에는 TEXT를 사용합니다. 숫자처럼 보이는 문자열은 앞자리 0 등이 사라지지 않도록 TEXT로 둡니다.
+    
+    Args:
+        sample_rows (list): iter_row_values()가 생성한 표본 행 목록
+        column_count (int): 컬럼 수
+    
+    Returns:
+        list: 컬럼별 타입 ('INTEGER', 'REAL', 'DATE', 'TEXT')
+    """
+    column_types = []
+    for idx in range(column_count):
+        kinds = set()
+        for row in sample_rows:
+            value = row[idx]
+            if value is None or (isinstance(value, str) and not value.strip()):
+                continue
+            if isinstance(value, bool) or isinstance(value, int):
+                kinds.add('INTEGER')
+            elif isinstance(value, float):
+                kinds.add('INTEGER' if value.is_integer() else 'REAL')
+            elif isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+                kinds.add('DATE')
+            else:
+                kinds.add('TEXT')
+                break
         
-        # 워크북 닫기
-        workbook.close()
+        if kinds == {'INTEGER'}:
+            column_types.append('INTEGER')
+        elif kinds and kinds <= {'INTEGER', 'REAL'}:
+            column_types.append('REAL')
+        elif kinds == {'DATE'}:
+            column_types.append('DATE')
+        else:
+            column_types.append('TEXT')
+    return column_types
+
+
+def _to_integer(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value  # 변환할 수 없는 값은 그대로 저장
+    return _to_storable(value)
+
+
+def _to_real(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return _to_storable(value)
+
+
+def _to_date(value):
+    if isinstance(value, datetime.datetime):
+        if value.time() == datetime.time():
+            return value.date().isoformat()
+        return value.isoformat(sep=' ')
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return _to_storable(value)
+
+
+def _to_storable(value):
+    # 표본에 없던 종류의 값(시각, 기간 등)도 SQLite에 저장할 수 있는 값으로 바꿈
+    if isinstance(value, (int, float, str, bytes)):
+        return value
+    if isinstance(value, (datetime.date, datetime.time)):
+        return _to_date(value)
+    return str(value)
+
+
+def _to_text(value):
+    return value if isinstance(value, str) else str(value)
+
+
+# 컬럼 타입별 값 변환 함수
+COLUMN_TYPE_CONVERTERS = {
+    'INTEGER': _to_integer,
+    'REAL': _to_real,
+    'DATE': _to_date,
+    'TEXT': _to_text,
+}
+
+
+def iter_typed_rows(rows, column_types):
+    """
+    원래 값 행을 컬럼 타입에 맞는 값으로 변환합니다. 빈 값은 NULL로 저장합니다.
     
-    # 변경사항 저장 및 연결 종료
-    conn.commit()
-    conn.close()
+    Args:
+        rows: iter_row_values()가 생성하는 행 이터레이터
+        column_types (list): 컬럼별 타입
+    """
+    converters = [COLUMN_TYPE_CONVERTERS[column_type] for column_type in column_types]
+    for values in rows:
+        yield [None if value is None or value == "" else convert(value) for convert, value in zip(converters, values)]
+
+
+def iter_batches(rows, batch_size):
+    """
+    행 이터레이터를 batch_size 크기의 리스트 묶음으로 나눕니다.
     
-    log(f"데이터베이스 '{db_file}'에 성공적으로 데이터를 저장했습니다.")
-    return True
+    Args:
+        rows: 행 이터레이터
+        batch_size (int): 한 묶음의 최대 행 수
+    """
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
 
 
-class ExcelToSqliteApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Excel to SQLite 변환기")
-        self.root.geometry("800x600")
-        
-        # 기본 설정
-        self.excel_configs = {}
-        self.db_file = "mgui2.db"
-        
-        # UI 구성
-        self.create_widgets()
-        
-        # 기본 설정 로드
-        self.load_default_config()
-        
-    def create_widgets(self):
-        # 프레임 생성
-        top_frame = ttk.Frame(self.root, padding="10")
-        top_frame.pack(fill=tk.X)
-        
-        config_frame = ttk.LabelFrame(self.root, text="설정", padding="10")
-        config_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        log_frame = ttk.LabelFrame(self.root, text="로그", padding="10")
-        log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # 상단 버튼 및 검색 UI
-        self.convert_btn = ttk.Button(top_frame, text="엑셀 -> SQLite 변환", command=self.convert)
-        self.convert_btn.pack(side=tk.LEFT, padx=5)
-        
-        # 매핑SEQ 검색 UI
-        ttk.Label(top_frame, text="매핑SEQ:").pack(side=tk.LEFT, padx=(20, 5))
-        
-        self.search_var = tk.StringVar()
-        self.search_entry = ttk.Entry(top_frame, textvariable=self.search_var, width=15)
-        self.search_entry.pack(side=tk.LEFT, padx=5)
-        self.search_entry.bind("<Return>", lambda event: self.search_mapping_seq())
-        
-        self.search_btn = ttk.Button(top_frame, text="Search", command=self.search_mapping_seq)
-        self.search_btn.pack(side=tk.LEFT, padx=5)
-        
-        # 설정 표시 영역 - 높이를 2배로 늘림
-        self.config_text = ScrolledText(config_frame, height=20)
-        self.config_text.pack(fill=tk.BOTH, expand=True)
-        
-        # 로그 표시 영역 - 높이를 1/3로 줄임
-        self.log_text = ScrolledText(log_frame, height=5)
-        self.log_text.pack(fill=tk.BOTH, expand=True)
-        
-    def load_default_config(self):
-        # 기본 설정 로드
-        self.excel_configs = { 
-            'book1': {
-                'path': 'C:/work/doc/1.xlsx',
-                'sheet_name': '1',
-                'header_row': 1  # 첫 번째 행이 헤더
-            },
-            'book2': {
-                'path': 'C:/work/doc/2.xlsx',
-                'sheet_name': '1',
-                'header_row': 2  # 두 번째 행이 헤더
-            }
-        }
-        self.update_config_display()
-        
-    def update_config_display(self):
-        # 설정 정보 표시
-        self.config_text.delete(1.0, tk.END)
-        self.config_text.insert(tk.END, f"데이터베이스 파일: {self.db_file}\n")
-        
-        for table_name, config in self.excel_configs.items():
-            self.config_text.insert(tk.END, f"테이블: {table_name}\n")
-            self.config_text.insert(tk.END, f"  엑셀 파일: {config['path']}\n")
-            self.config_text.insert(tk.END, f"  시트 이름: {config['sheet_name']}\n")
-            self.config_text.insert(tk.END, f"  헤더 행: {config.get('header_row', 1)}\n")
-    
-    def log(self, message):
-        # 로그 메시지 추가
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)  # 스크롤을 가장 아래로 이동
-        self.root.update()  # UI 업데이트
-    
-    def search_mapping_seq(self):
-        # 매핑SEQ로 검색하는 함수
-        mapping_seq = self.search_var.get().strip()
-        if not mapping_seq:
-            messagebox.showwarning("검색 오류", "매핑SEQ를 입력하세요.")
+def read_excel_table(config, batch_size):
+    """
+    엑셀 시트 하나를 읽어 변환 이벤트를 차례로 생성합니다.
+    
+    생성되는 이벤트는 (종류, 값) 튜플입니다.
+    - ('log', 메시지): 진행 상황 메시지
+    - ('opened', None): 워크북과 시트를 연 직후 (단계별 소요 시간 집계용)
+    - ('columns', (컬럼 이름 목록, 컬럼 타입 목록, 원래 헤더 텍스트 목록)): 헤더 해석 결과 (파일 열기에
+      실패하면 생성되지 않음)
+    - ('rows', 행 목록): batch_size 크기의 데이터 배치
+    - ('stats', 통계): config의 collect_stats가 참일 때 마지막에 생성. 원본 크기(bytes), 열기/헤더 해석/행
+      생성 시간(open_s, header_s, rows_s), 그중 리더가 행을 읽은 시간(sheet_read_s)과 값 변환 시간
+      (convert_s), 읽은 행 수(rows_read), 건너뛴 빈 행 수(rows_empty)
+    
+    config의 infer_types가 참이면 앞부분 type_sample_rows개 행으로 컬럼 타입을 추론해 값을 숫자/날짜
+    그대로 전달하고, column_types로 컬럼별 타입을 직접 지정할 수 있습니다. 둘 다 없으면 모든 값을
+    문자열(TEXT)로 전달합니다.
+    
+    원본은 config의 reader에 맞는 시트 리더로 읽습니다 (open_sheet_reader 참고). CSV/TSV 원본의 값은
+    모두 문자열이므로 숫자/날짜로 저장하려면 column_types를 지정합니다.
+    
+    Args:
+        config (dict): 테이블 하나의 엑셀 설정 (path, sheet_name, header_row, reader, infer_types, column_types)
+        batch_size (int): 한 배치의 최대 행 수
+    """
+    stats = None
+    if config.get('collect_stats'):
+        stats = {'bytes': 0, 'open_s': 0.0, 'header_s': 0.0, 'rows_s': 0.0, 'sheet_read_s': 0.0, 'convert_s': 0.0,
+                 'rows_read': 0, 'rows_empty': 0}
+    
+    # 엑셀 파일 열기
+    try:
+        yield 'log', f"엑셀 파일 '{config['path']}' 열기..."
+        started = time.perf_counter()
+        sheet = open_sheet_reader(config)
+        if stats is not None:
+            stats['open_s'] = time.perf_counter() - started
+            stats['bytes'] = os.path.getsize(config['path'])
+        yield 'opened', None
+        if is_text_source(config):
+            yield 'log', f"'{config['path']}' 로드 완료 (리더: {sheet.backend})"
+        else:
+            yield 'log', f"시트 '{config['sheet_name']}' 로드 완료 (리더: {sheet.backend})"
+    except Exception as e:
+        yield 'log', f"엑셀 파일 '{config['path']}' 열기 실패: {e}"
+        return
+    
+    try:
+        started = time.perf_counter()
+        
+        # 헤더 행 결정 (book2는 두 번째 행을 헤더로 사용)
+        header_row_num = 1  # 기본값은 첫 번째 행
+        if 'header_row' in config:
+            header_row_num = config['header_row']
+        
+        # 헤더 행에서 컬럼 이름 가져오기
+        header_row = next(sheet.iter_rows(min_row=header_row_num, max_row=header_row_num), ())
+        header_columns = HEADER_NORMALIZER.resolve(header_row)
+        column_indices = [idx for idx, _, _ in header_columns]  # 유효한 컬럼의 인덱스
+        column_names = [col_name for _, col_name, _ in header_columns]
+        header_texts = [header_text for _, _, header_text in header_columns]
+        
+        # 데이터 시작 행 결정
+        data_start_row = header_row_num + 1
+        
+        type_overrides = {clean_column_name(col): col_type.upper()
+                          for col, col_type in config.get('column_types', {}).items()}
+        for col, col_type in type_overrides.items():
+            if col_type not in COLUMN_TYPE_CONVERTERS:
+                raise ValueError(f"지원하지 않는 컬럼 타입입니다: {col} {col_type}")
+        
+        if config.get('infer_types') or type_overrides:
+            # 앞부분 표본으로 타입을 추론한 뒤 표본 행부터 다시 이어서 전달
+            rows = iter_row_values(sheet, data_start_row, column_indices, stats)
+            sample_rows = list(itertools.islice(rows, config.get('type_sample_rows', 1000))) if config.get('infer_types') else []
+            column_types = infer_column_types(sample_rows, len(column_names)) if sample_rows else ['TEXT'] * len(column_names)
+            column_types = [type_overrides.get(col, col_type) for col, col_type in zip(column_names, column_types)]
+            rows = iter_typed_rows(itertools.chain(sample_rows, rows), column_types)
+            yield 'log', f"컬럼 타입: {', '.join(f'{col} {col_type}' for col, col_type in zip(column_names, column_types))}"
+        else:
+            column_types = ['TEXT'] * len(column_names)
+            rows = iter_data_rows(sheet, data_start_row, column_indices, stats)
+        
+        if stats is not None:
+            stats['header_s'] = time.perf_counter() - started
+            header_sheet_read_s = stats['sheet_read_s']  # 타입 추론 표본을 읽은 시간
+        yield 'columns', (column_names, column_types, header_texts)
+        
+        # 헤더 다음 행부터 배치 단위로 전달
+        if stats is None:
+            for batch in iter_batches(rows, batch_size):
+                yield 'rows', batch
             return
         
+        # 통계를 모을 때는 배치를 만드는 데 걸린 시간만 재고, 받는 쪽이 처리하는 시간은 제외
+        batches = iter_batches(rows, batch_size)
+        while True:
+            started = time.perf_counter()
+            batch = next(batches, None)
+            stats['rows_s'] += time.perf_counter() - started
+            if batch is None:
+                break
+            yield 'rows', batch
+        stats['convert_s'] = max(0.0, stats['rows_s'] - (stats['sheet_read_s'] - header_sheet_read_s))
+        yield 'stats', stats
+    finally:
+        # 원본 파일 닫기
+        sheet.close()
+
+
+def _read_excel_table_worker(table_name, config, batch_size, event_queue):
+    """병렬 변환 워커 프로세스에서 시트를 읽어 이벤트를 큐로 보냅니다."""
+    try:
+        event_queue.put((table_name, 'start', None))
+        for kind, value in read_excel_table(config, batch_size):
+            event_queue.put((table_name, kind, value))
+    except Exception as e:
+        event_queue.put((table_name, 'error', f"{type(e).__name__}: {e}"))
+    finally:
+        event_queue.put((table_name, 'done', None))
+
+
+def iter_table_events(excel_configs, batch_size, workers=1):
+    """
+    모든 테이블의 변환 이벤트를 (테이블 이름, 종류, 값) 형태로 생성합니다.
+    
+    workers가 2 이상이면 각 워크북을 별도 프로세스에서 파싱하고, 행 배치는 큐를 통해
+    호출한 쪽(SQLite 연결을 가진 단일 writer)으로 스트리밍됩니다. 테이블마다 ('start', None) 이벤트 하나,
+    read_excel_table의 이벤트('log', 'columns', 'rows' 배치 등), ('done', None) 이벤트 순서로 생성됩니다.
+    병렬 처리 시 여러 테이블의 이벤트는 서로 섞일 수 있지만 한 테이블 안의 순서는 유지됩니다.
+    
+    Args:
+        excel_configs (dict): 엑셀 파일 구성 정보를 담은 딕셔너리
+        batch_size (int): 한 배치의 최대 행 수
+        workers (int): 동시에 파싱할 워커 프로세스 수
+    """
+    workers = min(workers, len(excel_configs))
+    
+    # 순차 처리
+    if workers <= 1:
+        for table_name, config in excel_configs.items():
+            yield table_name, 'start', None
+            for kind, value in read_excel_table(config, batch_size):
+                yield table_name, kind, value
+            yield table_name, 'done', None
+        return
+    
+    # 병렬 처리: 큐 크기를 제한해 writer가 느려도 메모리 사용량이 일정하게 유지되도록 함
+    with multiprocessing.Manager() as manager:
+        event_queue = manager.Queue(maxsize=workers * QUEUE_BATCHES_PER_WORKER)
+        executor = ProcessPoolExecutor(max_workers=workers)
         try:
-            # SQLite 데이터베이스 연결
-            if not os.path.exists(self.db_file):
-                messagebox.showwarning("검색 오류", f"데이터베이스 파일({self.db_file})이 존재하지 않습니다. 먼저 변환을 실행하세요.")
-                return
-                
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
+            futures = [executor.submit(_read_excel_table_worker, table_name, config, batch_size, event_queue)
+                       for table_name, config in excel_configs.items()]
+            pending = set(excel_configs)
             
-            # book2 테이블 존재 여부 확인
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='book2'")
-            if not cursor.fetchone():
-                messagebox.showwarning("검색 오류", "book2 테이블이 존재하지 않습니다. 먼저 변환을 실행하세요.")
-                conn.close()
+            while pending:
+                try:
+                    table_name, kind, value = event_queue.get(timeout=1)
+                except queue.Empty:
+                    # 워커 프로세스가 이벤트를 보내지 못하고 비정상 종료된 경우 확인
+                    for future in futures:
+                        if future.done() and future.exception() is not None:
+                            raise RuntimeError(f"변환 워커가 비정상 종료되었습니다: {future.exception()}")
+                    continue
+                
+                if kind == 'error':
+                    raise RuntimeError(f"테이블 '{table_name}' 읽기 실패: {value}")
+                if kind == 'done':
+                    pending.discard(table_name)
+                yield table_name, kind, value
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_timed_events(events, phase_times, table_times=None):
+    """
+    변환 이벤트를 그대로 전달하면서 단계별 소요 시간(초)을 phase_times에 누적합니다.
+    
+    이벤트를 기다린 시간은 해당 테이블의 현재 읽기 단계(open: 워크북 열기, header: 헤더 해석과 타입
+    추론, rows: 행 읽기)로, 호출한 쪽이 이벤트를 처리한 시간은 insert(테이블 생성, 행 삽입) 또는
+    table_finish(행 비교 반영, 인덱스, manifest 기록)로 집계합니다. 병렬 변환에서는 읽기가 워커에서
+    겹쳐 진행되므로 읽기 단계 시간은 writer가 이벤트를 기다린 시간이 됩니다.
+    
+    Args:
+        events: iter_table_events가 생성하는 (테이블 이름, 종류, 값) 이벤트
+        phase_times (dict): 단계 이름 -> 누적 시간(초)
+        table_times (dict): 지정하면 테이블 이름 -> {단계 이름: 누적 시간(초)}도 누적
+    
+    phase_times와 table_times가 모두 None이면 events를 그대로 반환합니다.
+    """
+    if phase_times is None and table_times is None:
+        return events
+    
+    def add_time(table_name, phase, seconds):
+        if phase_times is not None:
+            phase_times[phase] = phase_times.get(phase, 0.0) + seconds
+        if table_times is not None:
+            times = table_times.setdefault(table_name, {})
+            times[phase] = times.get(phase, 0.0) + seconds
+    
+    def timed():
+        read_phases = {}  # 테이블 이름 -> 현재 읽기 단계
+        while True:
+            wait_started = time.perf_counter()
+            try:
+                table_name, kind, value = next(events)
+            except StopIteration:
                 return
+            received = time.perf_counter()
+            read_phase = read_phases.get(table_name, 'open')
+            add_time(table_name, read_phase, received - wait_started)
+            read_phases[table_name] = {'opened': 'header', 'columns': 'rows'}.get(kind, read_phase)
             
-            # book1 테이블 존재 여부 확인
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='book1'")
-            book1_exists = cursor.fetchone() is not None
-            
-            # book2 컬럼 정보 가져오기
-            cursor.execute(f"PRAGMA table_info(book2)")
-            book2_columns = [column[1] for column in cursor.fetchall()]
+            yield table_name, kind, value
             
-            # book1 컬럼 정보 가져오기
-            book1_columns = []
-            if book1_exists:
-                cursor.execute(f"PRAGMA table_info(book1)")
-                book1_columns = [column[1] for column in cursor.fetchall()]
-            
-            # 매핑SEQ 컬럼 존재 여부 확인
-            if "매핑SEQ" not in book2_columns:
-                # 컬럼명이 정리되었을 수 있으므로 가능한 변형 확인
-                mapping_seq_col = None
-                for col in book2_columns:
-                    if col.lower() == "매핑seq" or col.lower() == "매핑_seq" or col.lower() == "매핑seq_" or col.lower() == "매핑_seq_":
-                        mapping_seq_col = col
-                        break
-                
-                if not mapping_seq_col:
-                    messagebox.showwarning("검색 오류", "매핑SEQ 컬럼이 존재하지 않습니다.")
-                    conn.close()
-                    return
+            handle_phase = {'columns': 'insert', 'rows': 'insert', 'done': 'table_finish'}.get(kind)
+            if handle_phase:
+                add_time(table_name, handle_phase, time.perf_counter() - received)
+    
+    return timed()
+
+
+class TableProfiler:
+    """
+    테이블 하나를 변환하는 동안 cProfile 프로파일과 tracemalloc 메모리 사용량을 수집합니다.
+    
+    순차 변환에서 사용하며, 시작부터 끝까지 같은 스레드에서 읽기와 삽입이 모두 일어나야 전체가 잡힙니다.
+    """
+    
+    def __init__(self, cprofile=False, trace_memory=False):
+        self.cprofile = cprofile
+        self.trace_memory = trace_memory
+        self._profiler = None
+        self._started_tracing = False
+    
+    def start(self):
+        if self.cprofile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
             else:
-                mapping_seq_col = "매핑SEQ"
-            
-            # book1의 매핑SEQ 컬럼 찾기
-            book1_mapping_seq_col = None
-            if book1_exists:
-                if "매핑SEQ" in book1_columns:
-                    book1_mapping_seq_col = "매핑SEQ"
-                else:
-                    for col in book1_columns:
-                        if col.lower() == "매핑seq" or col.lower() == "매핑_seq" or col.lower() == "매핑seq_" or col.lower() == "매핑_seq_":
-                            book1_mapping_seq_col = col
-                            break
-            
-            # book1의 인터페이스_명 컬럼 찾기
-            interface_name_col = None
-            if book1_exists and book1_mapping_seq_col:
-                for col in book1_columns:
-                    if "인터페이스" in col and "명" in col:
-                        interface_name_col = col
-                        break
-            
-            # book1의 I_F_Type 컬럼 찾기
-            if_type_col = None
-            if book1_exists and book1_mapping_seq_col:
-                for col in book1_columns:
-                    if col.lower() == "i_f_type" or col.lower() == "if_type" or col.lower() == "i_f_타입" or col.lower() == "if_타입":
-                        if_type_col = col
-                        break
+                tracemalloc.start()
+                self._started_tracing = True
+    
+    def stop(self):
+        """
+        수집을 끝내고 결과를 반환합니다.
+        
+        Returns:
+            dict: cprofile_report(누적 시간 순 상위 함수 보고서), peak_memory_bytes(최대 메모리),
+                top_allocations(끝난 시점에 남아 있는 할당 위치 상위 목록) 중 수집한 항목
+        """
+        result = {}
+        if self._profiler is not None:
+            self._profiler.disable()
+            stream = io.StringIO()
+            pstats.Stats(self._profiler, stream=stream).sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+            result['cprofile_report'] = stream.getvalue()
+            self._profiler = None
+        if self.trace_memory and tracemalloc.is_tracing():
+            result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+            snapshot = tracemalloc.take_snapshot()
+            result['top_allocations'] = [str(stat) for stat in snapshot.statistics('lineno')[:MEMORY_TOP_ALLOCATIONS]]
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        return result
+
+
+def find_mapping_seq_column(columns):
+    """
+    컬럼 목록에서 매핑SEQ 컬럼을 찾습니다. 컬럼명이 정리되었을 수 있으므로 가능한 변형도 확인합니다.
+    
+    Args:
+        columns (list): 컬럼 이름 목록
+    
+    Returns:
+        str: 매핑SEQ 컬럼 이름 (없으면 None)
+    """
+    if "매핑SEQ" in columns:
+        return "매핑SEQ"
+    for col in columns:
+        if col.lower() in ("매핑seq", "매핑_seq", "매핑seq_", "매핑_seq_"):
+            return col
+    return None
+
+
+def find_header_column(columns, headers, header):
+    """
+    엑셀 원래 헤더 텍스트로 컬럼 이름을 찾습니다.
+    
+    원래 헤더가 같은 컬럼(예: 비고, 비고_1)이 여러 개면 첫 번째를 반환하며, 기록된 헤더에 없으면
+    변환 때와 같은 규칙으로 정리한 이름으로 찾습니다. 따라서 정리된 컬럼 이름을 지정해도 됩니다.
+    
+    Args:
+        columns (list): 테이블의 컬럼 이름 목록
+        headers (list): (컬럼 이름, 원래 헤더 텍스트) 목록 (load_column_headers 참고)
+        header (str): 찾을 헤더 텍스트
+    
+    Returns:
+        str: 컬럼 이름 (없으면 None)
+    """
+    text = str(header).strip()
+    for col, header_text in headers:
+        if header_text == text and col in columns:
+            return col
+    col = HEADER_NORMALIZER.clean(text)
+    return col if col in columns else None
+
+
+def file_content_hash(path, chunk_size=1024 * 1024):
+    """파일 내용을 청크 단위로 읽어 SHA-256 해시를 계산합니다."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def ensure_manifest_table(cursor):
+    """변환 원본 정보를 기록하는 manifest 테이블을 생성합니다."""
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {MANIFEST_TABLE} (
+            table_name TEXT PRIMARY KEY,
+            path TEXT,
+            size INTEGER,
+            mtime_ns INTEGER,
+            content_hash TEXT,
+            sheet_name TEXT,
+            header_row INTEGER,
+            converted_at TEXT,
+            options_hash TEXT
+        )
+    """)
+    # 변환 옵션 기록이 없던 이전 manifest에 컬럼 추가 (기록이 없는 테이블은 한 번 다시 변환됨)
+    cursor.execute(f"PRAGMA table_info({MANIFEST_TABLE})")
+    if 'options_hash' not in [column[1] for column in cursor.fetchall()]:
+        cursor.execute(f"ALTER TABLE {MANIFEST_TABLE} ADD COLUMN options_hash TEXT")
+
+
+def conversion_options_hash(config):
+    """테이블 설정 중 변환 결과에 영향을 주는 옵션(CONVERSION_OPTION_KEYS)의 해시를 반환합니다."""
+    options = {key: config.get(key) for key in CONVERSION_OPTION_KEYS}
+    options['reader'] = options['reader'] or 'auto'
+    options['infer_types'] = bool(options['infer_types'])
+    if not options['infer_types']:
+        options['type_sample_rows'] = None  # 타입 추론을 하지 않으면 표본 행 수는 결과와 무관
+    text = json.dumps(options, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def source_signature(config):
+    """
+    원본 파일의 현재 상태(경로, 크기, 수정 시각, 시트, 헤더 행)와 변환 옵션 해시를 manifest 형식의
+    딕셔너리로 반환합니다.
+    
+    content_hash는 비용이 크므로 여기서 계산하지 않고 필요할 때 채웁니다.
+    """
+    stat = os.stat(config['path'])
+    return {
+        'path': os.path.abspath(config['path']),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'content_hash': None,
+        'sheet_name': str(config.get('sheet_name', '')),
+        'header_row': config.get('header_row', 1),
+        'options_hash': conversion_options_hash(config),
+    }
+
+
+def is_source_unchanged(cursor, table_name, signature):
+    """
+    manifest 기록과 비교해 원본이 마지막 변환 이후 바뀌지 않았는지 확인합니다.
+    
+    변환 옵션(타입 추론, 컬럼 타입, 기본 키 등)이 마지막 변환과 다르면 원본이 같아도 바뀐 것으로 봅니다.
+    크기와 수정 시각이 같으면 해시 계산 없이 변경 없음으로 판단하고, 다르면 내용 해시를 계산해
+    비교합니다. 계산한 해시는 signature에 채워 두며, 내용이 같으면 manifest의 수정 시각을 갱신합니다.
+    
+    Args:
+        cursor: SQLite 커서
+        table_name (str): 테이블 이름
+        signature (dict): source_signature()가 반환한 현재 원본 상태
+    """
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
+    if not cursor.fetchone():
+        return False
+    
+    cursor.execute(f"SELECT path, size, mtime_ns, content_hash, sheet_name, header_row, options_hash "
+                   f"FROM {MANIFEST_TABLE} WHERE table_name = ?", (table_name,))
+    recorded = cursor.fetchone()
+    if not recorded:
+        return False
+    
+    path, size, mtime_ns, content_hash, sheet_name, header_row, options_hash = recorded
+    if (path, sheet_name, header_row, options_hash) != (signature['path'], signature['sheet_name'],
+                                                        signature['header_row'], signature['options_hash']):
+        return False
+    if (size, mtime_ns) == (signature['size'], signature['mtime_ns']):
+        return True
+    
+    # 수정 시각만 바뀐 경우(복사, 재저장 등)를 걸러내기 위해 내용 해시 비교
+    signature['content_hash'] = file_content_hash(signature['path'])
+    if signature['content_hash'] != content_hash:
+        return False
+    
+    cursor.execute(f"UPDATE {MANIFEST_TABLE} SET size = ?, mtime_ns = ? WHERE table_name = ?",
+                   (signature['size'], signature['mtime_ns'], table_name))
+    return True
+
+
+def record_source(cursor, table_name, signature):
+    """변환이 끝난 원본의 상태를 manifest에 기록합니다."""
+    if signature['content_hash'] is None:
+        signature['content_hash'] = file_content_hash(signature['path'])
+    cursor.execute(
+        f"INSERT OR REPLACE INTO {MANIFEST_TABLE} "
+        f"(table_name, path, size, mtime_ns, content_hash, sheet_name, header_row, converted_at, options_hash) "
+        f"VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now', 'localtime'), ?)",
+        (table_name, signature['path'], signature['size'], signature['mtime_ns'], signature['content_hash'],
+         signature['sheet_name'], signature['header_row'], signature['options_hash']))
+
+
+def ensure_header_table(cursor):
+    """컬럼별 엑셀 원래 헤더 텍스트를 기록하는 테이블을 생성합니다."""
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {HEADER_TABLE} (
+            table_name TEXT,
+            position INTEGER,
+            column_name TEXT,
+            header_text TEXT,
+            PRIMARY KEY (table_name, position)
+        )
+    """)
+
+
+def record_column_headers(cursor, table_name, column_names, header_texts):
+    """변환한 테이블의 컬럼 이름과 엑셀 원래 헤더 텍스트를 기록합니다."""
+    cursor.execute(f"DELETE FROM {HEADER_TABLE} WHERE table_name = ?", (table_name,))
+    cursor.executemany(f"INSERT INTO {HEADER_TABLE} VALUES (?, ?, ?, ?)",
+                       [(table_name, position, col, header_text)
+                        for position, (col, header_text) in enumerate(zip(column_names, header_texts))])
+
+
+def load_column_headers(cursor):
+    """
+    기록된 엑셀 원래 헤더 텍스트를 읽습니다. 헤더를 기록하기 전의 데이터베이스면 빈 딕셔너리를 반환합니다.
+    
+    Returns:
+        dict: 테이블 이름 -> [(컬럼 이름, 원래 헤더 텍스트), ...] (컬럼 순서)
+    """
+    try:
+        cursor.execute(f"SELECT table_name, column_name, header_text FROM {HEADER_TABLE} ORDER BY table_name, position")
+    except sqlite3.OperationalError:
+        return {}
+    headers = {}
+    for table_name, col, header_text in cursor.fetchall():
+        headers.setdefault(table_name, []).append((col, header_text))
+    return headers
+
+
+def apply_row_diff(cursor, table_name, stage_table, column_names, key_column):
+    """
+    스테이징 테이블에 적재한 새 데이터와 기존 테이블을 비교해 바뀐 키의 행만 교체합니다.
+    
+    행 내용이나 같은 키의 행 수가 달라진 키를 모두 찾아, 기존 테이블에서 해당 키의 행을 지우고
+    스테이징 테이블의 행을 다시 넣습니다. 새 데이터에서 사라진 키는 삭제만 됩니다.
+    스테이징 테이블은 호출한 쪽에서 삭제합니다.
+    
+    Returns:
+        tuple: (변경된 키 수, 삭제된 행 수, 삽입된 행 수)
+    """
+    columns = ', '.join(column_names)
+    cursor.execute("DROP TABLE IF EXISTS temp._changed_keys")
+    cursor.execute(f"""
+        CREATE TEMP TABLE _changed_keys AS
+        SELECT {key_column} AS key FROM (SELECT {columns} FROM {stage_table} EXCEPT SELECT {columns} FROM {table_name})
+        UNION
+        SELECT {key_column} FROM (SELECT {columns} FROM {table_name} EXCEPT SELECT {columns} FROM {stage_table})
+        UNION
+        SELECT {key_column} FROM (SELECT {key_column}, COUNT(*) FROM {stage_table} GROUP BY {key_column}
+                                  EXCEPT SELECT {key_column}, COUNT(*) FROM {table_name} GROUP BY {key_column})
+        UNION
+        SELECT {key_column} FROM (SELECT {key_column}, COUNT(*) FROM {table_name} GROUP BY {key_column}
+                                  EXCEPT SELECT {key_column}, COUNT(*) FROM {stage_table} GROUP BY {key_column})
+    """)
+    changed_count, null_key_changed = cursor.execute(
+        "SELECT COUNT(*), TOTAL(key IS NULL) FROM temp._changed_keys").fetchone()
+    
+    # 빈 키(타입 추론으로 NULL이 된 값)는 IN으로 찾을 수 없으므로 IS NULL로 함께 비교
+    changed_rows = f"{key_column} IN (SELECT key FROM temp._changed_keys)"
+    if null_key_changed:
+        changed_rows = f"({changed_rows} OR {key_column} IS NULL)"
+    cursor.execute(f"DELETE FROM {table_name} WHERE {changed_rows}")
+    deleted_count = cursor.rowcount
+    cursor.execute(f"INSERT INTO {table_name} ({columns}) SELECT {columns} FROM {stage_table} WHERE {changed_rows}")
+    inserted_count = cursor.rowcount
+    return changed_count, deleted_count, inserted_count
+
+
+def rebuild_with_primary_key(cursor, table_name, key_column):
+    """
+    키 컬럼 값이 모두 고유하면 테이블을 키 컬럼을 기본 키로 하는 테이블로 다시 만듭니다.
+    
+    값이 모두 정수 표기이면 INTEGER PRIMARY KEY(rowid 별칭)로, 아니면 WITHOUT ROWID 테이블의
+    TEXT PRIMARY KEY로 저장합니다.
+    
+    Returns:
+        str: 적용한 기본 키 형식 ('INTEGER', 'TEXT'), 고유하지 않아 적용하지 못하면 None
+    """
+    cursor.execute(f"""
+        SELECT COUNT(*), COUNT(DISTINCT {key_column}),
+               TOTAL({key_column} IS NULL OR {key_column} = ''),
+               TOTAL(CAST(CAST({key_column} AS INTEGER) AS TEXT) IS NOT CAST({key_column} AS TEXT))
+        FROM {table_name}
+    """)
+    total_count, distinct_count, empty_count, non_integer_count = cursor.fetchone()
+    if total_count != distinct_count or empty_count:
+        return None
+    
+    key_type = 'INTEGER' if non_integer_count == 0 else 'TEXT'
+    cursor.execute(f"PRAGMA table_info({table_name})")
+    column_defs = []
+    for column in cursor.fetchall():
+        if column[1] == key_column:
+            column_defs.append(f"{column[1]} {key_type} PRIMARY KEY")
+        else:
+            column_defs.append(f"{column[1]} {column[2]}")
+    
+    new_table = f"_pk_{table_name}"
+    suffix = "" if key_type == 'INTEGER' else " WITHOUT ROWID"
+    cursor.execute(f"DROP TABLE IF EXISTS {new_table}")
+    cursor.execute(f"CREATE TABLE {new_table} ({', '.join(column_defs)}){suffix}")
+    cursor.execute(f"INSERT INTO {new_table} SELECT * FROM {table_name} ORDER BY {key_column}")
+    cursor.execute(f"DROP TABLE {table_name}")
+    cursor.execute(f"ALTER TABLE {new_table} RENAME TO {table_name}")
+    return key_type
+
+
+def build_table_indexes(cursor, table_name, config, key_column, log):
+    """
+    적재가 끝난 테이블에 조회용 인덱스를 만듭니다.
+    
+    삽입 중에 인덱스를 유지하는 비용을 피하기 위해 데이터를 모두 넣은 뒤에 호출합니다.
+    config의 index_columns(원래 헤더 이름도 가능)에 지정한 컬럼에 인덱스를 만들며, 지정하지 않으면
+    키 컬럼(매핑SEQ)을 사용합니다. config의 primary_key가 참이고 키 값이 고유하면 키 컬럼을 기본 키로
+    저장합니다.
+    
+    Args:
+        cursor: SQLite 커서
+        table_name (str): 테이블 이름
+        config (dict): 테이블의 엑셀 설정
+        key_column (str): 키 컬럼 이름 (없으면 None)
+        log (function): 로그 출력 함수
+    """
+    cursor.execute(f"PRAGMA table_info({table_name})")
+    table_columns = {column[1]: column[5] for column in cursor.fetchall()}  # 컬럼 이름 -> 기본 키 여부
+    
+    if config.get('primary_key') and key_column in table_columns and not table_columns[key_column]:
+        key_type = rebuild_with_primary_key(cursor, table_name, key_column)
+        if key_type:
+            table_columns[key_column] = 1
+            log(f"'{key_column}' 컬럼을 {key_type} PRIMARY KEY로 저장했습니다.")
+        else:
+            log(f"'{key_column}' 값이 고유하지 않거나 비어 있어 기본 키 대신 인덱스를 사용합니다.")
+    
+    index_columns = config.get('index_columns')
+    if index_columns is None:
+        index_columns = [key_column] if key_column else []
+    
+    for col in index_columns:
+        col = clean_column_name(col)
+        if col not in table_columns:
+            log(f"인덱스 컬럼 '{col}'이 테이블에 없어 건너뜁니다.")
+            continue
+        if table_columns[col]:
+            continue  # 기본 키는 이미 인덱스 역할을 함
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{col} ON {table_name} ({col})")
+        log(f"인덱스 'idx_{table_name}_{col}' 생성 완료")
+
+
+# 검색 화면에서 사용하는 의미 필드별 컬럼 판별 규칙 (필드 이름, 판별 함수)
+# book1은 매핑SEQ 컬럼이 있을 때만 첫 번째로 일치하는 컬럼을, book2는 마지막으로 일치하는 컬럼을 사용
+BOOK1_FIELD_RULES = [
+    ('interface_name', lambda col: "인터페이스" in col and "명" in col),
+    ('if_type', lambda col: col.lower() in ("i_f_type", "if_type", "i_f_타입", "if_타입")),
+    ('route', lambda col: "route" in col.lower() and "정의" in col),
+]
+
+BOOK2_FIELD_RULES = [
+    ('group_id', lambda col: "group" in col.lower() and "id" in col.lower()),
+    ('event_id', lambda col: "event" in col.lower() and "id" in col.lower()),
+    # 송신 관련 컬럼
+    ('send_task', lambda col: "송신" in col and "업무" in col),
+    ('send_qmgr', lambda col: "송신" in col and "qmgr" in col.lower()),
+    ('send_userid', lambda col: "송신" in col and "userid" in col.lower()),
+    ('send_passwd', lambda col: "송신" in col and ("passwd" in col.lower() or "password" in col.lower())),
+    ('send_db', lambda col: "송신" in col and "db" in col.lower()),
+    ('send_schema_adapter', lambda col: "송신" in col and "schema" in col.lower() and "adapter" in col.lower()),
+    ('send_table_adapter', lambda col: "송신" in col and "table" in col.lower() and "adapter" in col.lower()),
+    # 수신 관련 컬럼
+    ('recv_task', lambda col: "수신" in col and "업무" in col),
+    ('recv_qmgr', lambda col: "수신" in col and "qmgr" in col.lower()),
+    ('recv_userid', lambda col: "수신" in col and "userid" in col.lower()),
+    ('recv_passwd', lambda col: "수신" in col and ("passwd" in col.lower() or "password" in col.lower())),
+    ('recv_db', lambda col: "수신" in col and "db" in col.lower()),
+    ('recv_schema_adapter', lambda col: "수신" in col and "schema" in col.lower() and "adapter" in col.lower()),
+    ('recv_table_adapter', lambda col: "수신" in col and "table" in col.lower() and "adapter" in col.lower()),
+]
+
+
+class ResolvedSchema:
+    """
+    검색에 사용하는 의미 필드(매핑SEQ, GroupID, 송신 QMGR 등)를 테이블별 컬럼 이름과 위치로 해석한 결과입니다.
+    
+    변환이 끝날 때 한 번 계산해 데이터베이스에 저장하므로, 검색할 때는 컬럼을 다시 훑지 않고
+    준비된 조회 쿼리 하나와 튜플 인덱싱으로 값을 꺼낼 수 있습니다.
+    """
+    
+    def __init__(self, tables, interface_view=False, headers=None):
+        self.tables = tables  # 테이블 이름 -> {필드: (컬럼 이름, 위치)}
+        self.interface_view = interface_view  # 상세 정보 테이블(interface_view) 존재 여부
+        self.headers = headers or {}  # 테이블 이름 -> [(컬럼 이름, 원래 헤더 텍스트), ...]
+        self._select_sqls = {}
+    
+    def has_table(self, table_name):
+        return table_name in self.tables
+    
+    def column(self, table_name, field):
+        """필드에 해당하는 컬럼 이름을 반환합니다. 없으면 None."""
+        return self.tables.get(table_name, {}).get(field, (None, None))[0]
+    
+    def column_by_header(self, table_name, header):
+        """엑셀 원래 헤더 텍스트에 해당하는 컬럼 이름을 반환합니다. 헤더 기록이 없거나 찾지 못하면 None."""
+        headers = self.headers.get(table_name, [])
+        return find_header_column([col for col, _ in headers], headers, header)
+    
+    def value(self, table_name, field, row, default=None):
+        """조회한 행 튜플에서 필드 값을 꺼냅니다. 컬럼이 없으면 default, 값이 NULL이면 빈 문자열을 반환합니다."""
+        position = self.tables.get(table_name, {}).get(field, (None, None))[1]
+        if position is None or position >= len(row):
+            return default
+        # 타입 추론으로 빈 값이 NULL로 저장된 경우에도 빈 문자열로 표시
+        return "" if row[position] is None else row[position]
+    
+    def select_sql(self, table_name):
+        """매핑SEQ로 행을 조회하는 쿼리를 반환합니다. 매핑SEQ 컬럼이 없으면 None."""
+        if table_name not in self._select_sqls:
+            key_column = self.column(table_name, 'mapping_seq')
+            self._select_sqls[table_name] = f"SELECT * FROM {table_name} WHERE {key_column} = ?" if key_column else None
+        return self._select_sqls[table_name]
+    
+    def interface_view_sql(self):
+        """상세 정보 테이블에서 매핑SEQ로 한 행을 조회하는 쿼리를 반환합니다."""
+        return f"SELECT {', '.join(INTERFACE_VIEW_FIELDS)} FROM {INTERFACE_VIEW_TABLE} WHERE mapping_seq = ?"
+
+
+def resolve_schema(cursor, field_headers=None):
+    """
+    book1, book2 테이블의 컬럼을 훑어 검색용 의미 필드를 해석합니다.
+    
+    field_headers로 필드를 엑셀 원래 헤더 텍스트에 직접 연결하면 판별 규칙 대신 그 헤더의 컬럼을
+    사용합니다 (예: {'book2': {'send_qmgr': "송신 QMGR(운영)"}}). 헤더를 찾지 못하면 판별 규칙을 따릅니다.
+    
+    Args:
+        cursor: SQLite 커서
+        field_headers (dict): 테이블 이름 -> {필드: 엑셀 헤더 텍스트}
+    
+    Returns:
+        ResolvedSchema: 존재하는 테이블만 담은 해석 결과
+    """
+    headers = load_column_headers(cursor)
+    field_headers = field_headers or {}
+    tables = {}
+    for table_name, rules, last_match in (('book1', BOOK1_FIELD_RULES, False), ('book2', BOOK2_FIELD_RULES, True)):
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        columns = [column[1] for column in cursor.fetchall()]
+        if not columns:
+            continue
+        
+        # 헤더 텍스트로 지정한 필드의 컬럼
+        pinned = {}
+        for field, header in field_headers.get(table_name, {}).items():
+            col = find_header_column(columns, headers.get(table_name, []), header)
+            if col:
+                pinned[field] = col
+        
+        mapping_seq_col = pinned.get('mapping_seq') or find_mapping_seq_column(columns)
+        fields = {'mapping_seq': (mapping_seq_col, columns.index(mapping_seq_col) if mapping_seq_col else None)}
+        for field, matches in rules:
+            matched = [pinned[field]] if field in pinned else [col for col in columns if matches(col)]
+            # book1의 부가 정보는 매핑SEQ로 연결할 수 있을 때만 사용
+            if not matched or (table_name == 'book1' and not mapping_seq_col):
+                fields[field] = (None, None)
+                continue
+            col = matched[-1] if last_match else matched[0]
+            fields[field] = (col, columns.index(col))
+        tables[table_name] = fields
+    return ResolvedSchema(tables, headers=headers)
+
+
+def save_resolved_schema(cursor, schema):
+    """해석한 검색 스키마를 데이터베이스에 저장합니다."""
+    cursor.execute(f"DROP TABLE IF EXISTS {SCHEMA_TABLE}")
+    cursor.execute(f"CREATE TABLE {SCHEMA_TABLE} (table_name TEXT, field TEXT, column_name TEXT, position INTEGER, "
+                   f"PRIMARY KEY (table_name, field))")
+    cursor.executemany(f"INSERT INTO {SCHEMA_TABLE} VALUES (?, ?, ?, ?)",
+                       [(table_name, field, col, position)
+                        for table_name, fields in schema.tables.items()
+                        for field, (col, position) in fields.items()])
+
+
+def load_resolved_schema(cursor):
+    """
+    변환 시 저장한 검색 스키마를 읽습니다. 저장된 스키마가 없는 이전 데이터베이스는 바로 해석합니다.
+    
+    Returns:
+        ResolvedSchema: 검색 스키마
+    """
+    try:
+        cursor.execute(f"SELECT table_name, field, column_name, position FROM {SCHEMA_TABLE}")
+    except sqlite3.OperationalError:
+        return resolve_schema(cursor)
+    
+    tables = {}
+    for table_name, field, col, position in cursor.fetchall():
+        tables.setdefault(table_name, {})[field] = (col, position)
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (INTERFACE_VIEW_TABLE,))
+    interface_view = cursor.fetchone() is not None
+    return ResolvedSchema(tables, interface_view=interface_view, headers=load_column_headers(cursor))
+
+
+def connect_read_only(db_file, check_same_thread=True):
+    """
+    데이터베이스를 읽기 전용(URI mode=ro)으로 엽니다.
+    
+    같은 SQL 문자열은 연결의 문장 캐시에서 준비된 문장을 재사용하므로, 오래 유지하는 조회용
+    연결에 사용합니다.
+    
+    Args:
+        db_file (str): 데이터베이스 파일 경로
+        check_same_thread (bool): False면 연결 풀처럼 여러 스레드가 번갈아 사용할 수 있음
+    """
+    uri = pathlib.Path(db_file).resolve().as_uri() + "?mode=ro"
+    return sqlite3.connect(uri, uri=True, cached_statements=STATEMENT_CACHE_SIZE,
+                           check_same_thread=check_same_thread)
+
+
+# 상세 조회 결과의 송신/수신 SQL 구성 (필드 접두어, 표시 이름, 추가 조건)
+INTERFACE_SQL_SIDES = [
+    ('send', "송신", " and EAI_TRANSFER_FLAG='Y'"),
+    ('recv', "수신", ""),
+]
+
+
+# 매핑SEQ별 상세 정보를 미리 계산해 두는 테이블의 컬럼 (lookup_interface 레코드의 필드와 같음)
+INTERFACE_VIEW_FIELDS = [
+    'mapping_seq', 'interface_id', 'interface_name', 'if_type', 'route',
+    'send_task', 'send_qmgr', 'send_sql', 'recv_task', 'recv_qmgr', 'recv_sql',
+]
+
+
+def sql_literal(text):
+    """문자열을 SQL 문자열 리터럴로 만듭니다."""
+    return "'" + text.replace("'", "''") + "'"
+
+
+def build_interface_view(cursor, schema, log, mapping_seqs=None):
+    """
+    book2와 book1을 매핑SEQ로 조인해 매핑SEQ당 한 행의 상세 정보 테이블(interface_view)을 만듭니다.
+    
+    INTERFACE ID, 인터페이스 명, 송신/수신 정보, 점검용 sqlplus 명령을 lookup_interface와 같은 형태로
+    미리 계산해 두므로, 조회는 기본 키로 한 행을 읽기만 하면 됩니다. 같은 매핑SEQ의 행이 여러 개면
+    첫 번째 행을 사용합니다. mapping_seq 컬럼은 book2 매핑SEQ 컬럼과 같은 타입으로 만들어, 타입 추론으로
+    INTEGER가 된 매핑SEQ를 '05'처럼 조회해도 book2를 직접 조회할 때와 같은 행을 찾습니다.
+    
+    Args:
+        cursor: SQLite 커서
+        schema (ResolvedSchema): 검색 스키마
+        log (function): 로그 출력 함수
+        mapping_seqs (iterable): 지정하면 기존 테이블에서 해당 매핑SEQ의 행만 다시 계산
+    """
+    key_column = schema.column('book2', 'mapping_seq')
+    if not key_column:
+        cursor.execute(f"DROP TABLE IF EXISTS {INTERFACE_VIEW_TABLE}")
+        log("book2 테이블 또는 매핑SEQ 컬럼이 없어 상세 정보 테이블을 만들지 않습니다.")
+        return
+    
+    def text(alias, table_name, field, default):
+        # 컬럼이 없으면 default, 값이 NULL이면 빈 문자열 (ResolvedSchema.value와 같은 규칙)
+        col = schema.column(table_name, field)
+        return f"COALESCE(CAST({alias}.{col} AS TEXT), '')" if col else default
+    
+    book1_key = schema.column('book1', 'mapping_seq')
+    expressions = {'mapping_seq': f"CAST(b2.{key_column} AS TEXT)", 'interface_id': "''"}
+    if schema.column('book2', 'group_id') and schema.column('book2', 'event_id'):
+        expressions['interface_id'] = (f"{text('b2', 'book2', 'group_id', 'NULL')} || '.' || "
+                                       f"{text('b2', 'book2', 'event_id', 'NULL')}")
+    for field in ('interface_name', 'if_type', 'route'):
+        # book1에 매핑SEQ가 없으면 NULL
+        value = text('b1', 'book1', field, 'NULL')
+        expressions[field] = f"CASE WHEN b1.{book1_key} IS NULL THEN NULL ELSE {value} END" if book1_key else "NULL"
+    for prefix, side, condition in INTERFACE_SQL_SIDES:
+        expressions[f'{prefix}_task'] = text('b2', 'book2', f'{prefix}_task', 'NULL')
+        expressions[f'{prefix}_qmgr'] = text('b2', 'book2', f'{prefix}_qmgr', 'NULL')
+        parts = ["'sqlplus '", text('b2', 'book2', f'{prefix}_userid', "'?'"), "'/'",
+                 text('b2', 'book2', f'{prefix}_passwd', "'?'"), "'@'", text('b2', 'book2', f'{prefix}_db', "'?'"),
+                 "char(10)", "'select count(*) from '", text('b2', 'book2', f'{prefix}_schema_adapter', "'?'"), "'.'",
+                 text('b2', 'book2', f'{prefix}_table_adapter', "'?'"),
+                 sql_literal(f" where EAI_TRANSFER_DATE > sysdate-(1/12){condition};")]
+        expressions[f'{prefix}_sql'] = " || ".join(parts)
+    
+    join = f"LEFT JOIN book1 b1 ON b1.{book1_key} = b2.{key_column}" if book1_key else ""
+    select_sql = (f"SELECT {', '.join(expressions[field] for field in INTERFACE_VIEW_FIELDS)} "
+                  f"FROM book2 b2 {join} WHERE b2.{key_column} IS NOT NULL")
+    insert_sql = f"INSERT OR IGNORE INTO {INTERFACE_VIEW_TABLE} ({', '.join(INTERFACE_VIEW_FIELDS)}) {select_sql}"
+    
+    started = time.perf_counter()
+    if mapping_seqs is None:
+        # 조회 값에 book2 매핑SEQ 컬럼과 같은 타입 변환(affinity)이 적용되도록 같은 타입으로 선언
+        cursor.execute("PRAGMA table_info(book2)")
+        key_type = next((column[2] for column in cursor.fetchall() if column[1] == key_column), "") or "TEXT"
+        cursor.execute(f"DROP TABLE IF EXISTS {INTERFACE_VIEW_TABLE}")
+        cursor.execute(f"CREATE TABLE {INTERFACE_VIEW_TABLE} (mapping_seq {key_type} PRIMARY KEY, "
+                       f"{', '.join(field + ' TEXT' for field in INTERFACE_VIEW_FIELDS[1:])}) WITHOUT ROWID")
+        cursor.execute(insert_sql)
+        log(f"상세 정보 테이블 생성 완료 ({cursor.rowcount}행, {time.perf_counter() - started:.1f}초)")
+        return
+    
+    # 바뀐 매핑SEQ의 행만 지우고 다시 계산
+    cursor.execute("DROP TABLE IF EXISTS temp._view_keys")
+    cursor.execute("CREATE TEMP TABLE _view_keys (key TEXT PRIMARY KEY)")
+    cursor.executemany("INSERT OR IGNORE INTO temp._view_keys VALUES (?)", [(key,) for key in mapping_seqs])
+    cursor.execute(f"DELETE FROM {INTERFACE_VIEW_TABLE} WHERE mapping_seq IN (SELECT key FROM temp._view_keys)")
+    cursor.execute(f"{insert_sql} AND b2.{key_column} IN (SELECT key FROM temp._view_keys)")
+    log(f"상세 정보 테이블 갱신 완료 (매핑SEQ {len(mapping_seqs)}개, {time.perf_counter() - started:.1f}초)")
+    cursor.execute("DROP TABLE temp._view_keys")
+
+
+def lookup_interface(conn, schema, mapping_seq):
+    """
+    매핑SEQ 하나의 인터페이스 상세 정보를 조회합니다.
+    
+    검색 화면과 조회 서비스가 같이 사용하며, 화면 표시는 format_interface_text로 만듭니다.
+    상세 정보 테이블(interface_view)이 있으면 기본 키로 한 행만 읽습니다.
+    
+    Args:
+        conn: SQLite 연결 (읽기 전용 연결도 가능)
+        schema (ResolvedSchema): 검색 스키마
+        mapping_seq (str): 조회할 매핑SEQ
+    
+    Returns:
+        dict: 상세 정보 레코드. 해당 컬럼이 없는 필드는 None, send_sql/recv_sql은 점검용 sqlplus 명령.
+            book2에 매핑SEQ가 없으면 None
+    """
+    if schema.interface_view:
+        row = conn.execute(schema.interface_view_sql(), (str(mapping_seq),)).fetchone()
+        if not row:
+            return None
+        # 매핑SEQ 컬럼이 숫자 타입이면 숫자로 저장되므로 직접 조회와 같이 문자열로 반환
+        return dict(zip(INTERFACE_VIEW_FIELDS, (str(row[0]),) + row[1:]))
+    
+    if not schema.select_sql('book2'):
+        return None
+    book2_row = conn.execute(schema.select_sql('book2'), (mapping_seq,)).fetchone()
+    if not book2_row:
+        return None
+    
+    book1_row = None
+    if schema.select_sql('book1'):
+        book1_row = conn.execute(schema.select_sql('book1'), (mapping_seq,)).fetchone()
+    
+    def value(table_name, field, row, default=None):
+        result = schema.value(table_name, field, row, default) if row is not None else default
+        return None if result is None else str(result)
+    
+    record = {'mapping_seq': value('book2', 'mapping_seq', book2_row, "")}
+    
+    # INTERFACE ID (GroupID.EventID)
+    record['interface_id'] = ""
+    if schema.column('book2', 'group_id') and schema.column('book2', 'event_id'):
+        record['interface_id'] = f"{value('book2', 'group_id', book2_row)}.{value('book2', 'event_id', book2_row)}"
+    
+    # 인터페이스 명, I_F_Type, Route정의는 book1에서
+    for field in ('interface_name', 'if_type', 'route'):
+        record[field] = value('book1', field, book1_row)
+    
+    for prefix, side, condition in INTERFACE_SQL_SIDES:
+        record[f'{prefix}_task'] = value('book2', f'{prefix}_task', book2_row)
+        record[f'{prefix}_qmgr'] = value('book2', f'{prefix}_qmgr', book2_row)
+        
+        userid = value('book2', f'{prefix}_userid', book2_row, "?")
+        passwd = value('book2', f'{prefix}_passwd', book2_row, "?")
+        db = value('book2', f'{prefix}_db', book2_row, "?")
+        schema_name = value('book2', f'{prefix}_schema_adapter', book2_row, "?")
+        table = value('book2', f'{prefix}_table_adapter', book2_row, "?")
+        record[f'{prefix}_sql'] = (f"sqlplus {userid}/{passwd}@{db}\n"
+                                   f"select count(*) from {schema_name}.{table} where EAI_TRANSFER_DATE > sysdate-(1/12){condition};")
+    return record
+
+
+def format_interface_text(record):
+    """lookup_interface 레코드를 검색 화면에 표시하는 텍스트로 만듭니다."""
+    text = f"[매핑SEQ] {record['mapping_seq']}\n"
+    text += f"[INTERFACE ID] {record['interface_id']}\n"
+    
+    if record['interface_name']:
+        text += f"[인터페이스 명] {record['interface_name']}\n"
+    if record['if_type'] and record['if_type'].strip():
+        text += f"[I_F_Type] {record['if_type']}\n"
+    
+    # 송신/수신 정보
+    for prefix, side, _ in INTERFACE_SQL_SIDES:
+        info = []
+        if record[f'{prefix}_task'] is not None:
+            info.append(f"[{side}_업무명] {record[f'{prefix}_task']}")
+        if record[f'{prefix}_qmgr'] is not None:
+            info.append(f"[{side}_QMGR명] {record[f'{prefix}_qmgr']}")
+        if info:
+            text += "\n" + "    ".join(info)
+    
+    # SQL 정보
+    for prefix, side, _ in INTERFACE_SQL_SIDES:
+        text += f"\n[{side}SQL]\n{record[f'{prefix}_sql']}"
+    
+    if record['route']:
+        text += f"\n[Route정의] {record['route']}"
+    return text
+
+
+# 일괄 검색 결과 표의 컬럼 (필드, 제목)
+INTERFACE_SUMMARY_FIELDS = [
+    ('mapping_seq', "매핑SEQ"),
+    ('status', "결과"),
+    ('interface_id', "INTERFACE ID"),
+    ('interface_name', "인터페이스 명"),
+    ('if_type', "I_F_Type"),
+    ('send_task', "송신_업무명"),
+    ('send_qmgr', "송신_QMGR명"),
+    ('recv_task', "수신_업무명"),
+    ('recv_qmgr', "수신_QMGR명"),
+    ('route', "Route정의"),
+]
+
+
+def parse_mapping_seqs(text):
+    """
+    붙여넣은 텍스트나 파일 내용에서 매핑SEQ 값을 순서대로 추출합니다.
+    
+    공백, 줄바꿈, 쉼표, 세미콜론, 탭으로 구분하며, 중복 값과 '매핑SEQ' 같은 헤더는 제외합니다.
+    """
+    mapping_seqs = []
+    seen = set()
+    for token in re.split(r'[\s,;]+', text):
+        token = token.strip().strip('"\'')
+        if not token or token.lower().replace('_', '') == "매핑seq" or token in seen:
+            continue
+        seen.add(token)
+        mapping_seqs.append(token)
+    return mapping_seqs
+
+
+def lookup_mapping_seqs(conn, schema, mapping_seqs):
+    """
+    여러 매핑SEQ를 한 번의 집합 쿼리로 조회해 요약 레코드 목록을 반환합니다.
+    
+    매핑SEQ 목록을 임시 테이블에 넣고 book2, book1과 조인하므로 값 개수만큼 쿼리를 반복하지 않고
+    키 인덱스를 한 번 훑어 결과를 얻습니다. 같은 매핑SEQ에 행이 여러 개면 첫 번째 행을 사용합니다.
+    
+    Args:
+        conn: SQLite 연결 (읽기 전용 연결도 가능)
+        schema (ResolvedSchema): 검색 스키마
+        mapping_seqs (list): 조회할 매핑SEQ 목록
+    
+    Returns:
+        list: INTERFACE_SUMMARY_FIELDS의 필드를 키로 하는 딕셔너리 목록 (입력 순서)
+    """
+    # 조회할 테이블별 필드와 SELECT 목록 구성
+    select_list = ["k.ord", "k.seq"]
+    joins = []
+    field_positions = {}  # (테이블, 필드) -> SELECT 목록 위치
+    for alias, table_name in (('b2', 'book2'), ('b1', 'book1')):
+        key_column = schema.column(table_name, 'mapping_seq')
+        if not key_column:
+            continue
+        joins.append(f"LEFT JOIN {table_name} {alias} ON {alias}.{key_column} = k.seq")
+        select_list.append(f"{alias}.{key_column} IS NOT NULL")
+        field_positions[(table_name, 'found')] = len(select_list) - 1
+        for field in schema.tables[table_name]:
+            col = schema.column(table_name, field)
+            if col:
+                select_list.append(f"{alias}.{col}")
+                field_positions[(table_name, field)] = len(select_list) - 1
+    
+    def value(table_name, field, row):
+        position = field_positions.get((table_name, field))
+        if position is None or row[position] is None:
+            return ""
+        return str(row[position])
+    
+    # 임시 테이블 작업이 연 암묵적 트랜잭션은 끝낸 뒤 되돌려, 오래 유지하는 읽기 전용 연결이
+    # 데이터베이스 공유 잠금을 계속 잡고 있지 않도록 함 (호출 전부터 열린 트랜잭션은 그대로 둠)
+    owns_transaction = not conn.in_transaction
+    try:
+        conn.execute("DROP TABLE IF EXISTS temp._lookup_keys")
+        conn.execute("CREATE TEMP TABLE _lookup_keys (ord INTEGER PRIMARY KEY, seq TEXT)")
+        conn.executemany("INSERT INTO temp._lookup_keys (seq) VALUES (?)", [(seq,) for seq in mapping_seqs])
+        
+        records = []
+        last_ord = None
+        for row in conn.execute(f"SELECT {', '.join(select_list)} FROM temp._lookup_keys k {' '.join(joins)} ORDER BY k.ord"):
+            if row[0] == last_ord:
+                continue  # 같은 매핑SEQ의 중복 행은 첫 번째만 사용
+            last_ord = row[0]
             
-            # book1의 Route정의 컬럼 찾기
-            route_col = None
-            if book1_exists and book1_mapping_seq_col:
-                for col in book1_columns:
-                    if "route" in col.lower() and "정의" in col:
-                        route_col = col
-                        break
+            found = bool(field_positions.get(('book2', 'found')) and row[field_positions[('book2', 'found')]])
+            record = {'mapping_seq': row[1], 'status': "OK" if found else "없음"}
+            if found:
+                group_id = value('book2', 'group_id', row)
+                event_id = value('book2', 'event_id', row)
+                record['interface_id'] = f"{group_id}.{event_id}" if schema.column('book2', 'group_id') and schema.column('book2', 'event_id') else ""
+                for field in ('interface_name', 'if_type', 'route'):
+                    record[field] = value('book1', field, row)
+                for field in ('send_task', 'send_qmgr', 'recv_task', 'recv_qmgr'):
+                    record[field] = value('book2', field, row)
+            records.append(record)
+    finally:
+        conn.execute("DROP TABLE IF EXISTS temp._lookup_keys")
+        if owns_transaction and conn.in_transaction:
+            conn.rollback()
+    return records
+
+
+# 인터페이스 전문 검색(FTS5) 인덱스에 넣을 필드 (테이블, 필드). 인덱스 컬럼 이름은 필드 이름을 사용
+SEARCH_INDEX_FIELDS = [
+    ('book2', 'mapping_seq'),
+    ('book2', 'group_id'),
+    ('book2', 'event_id'),
+    ('book1', 'interface_name'),
+    ('book1', 'if_type'),
+    ('book2', 'send_task'),
+    ('book2', 'send_qmgr'),
+    ('book2', 'send_table_adapter'),
+    ('book2', 'recv_task'),
+    ('book2', 'recv_qmgr'),
+    ('book2', 'recv_table_adapter'),
+    ('book1', 'route'),
+]
+
+
+def build_search_index(cursor, schema, log):
+    """
+    book2(와 매핑SEQ로 연결한 book1)의 인터페이스 정보로 FTS5 전문 검색 인덱스를 만듭니다.
+    
+    부분 문자열 검색이 되도록 trigram 토크나이저를 우선 사용하고, 지원하지 않는 SQLite에서는
+    unicode61(단어 앞부분 검색)로 만듭니다.
+    
+    Returns:
+        str: 사용한 토크나이저. FTS5를 지원하지 않거나 book2 매핑SEQ 컬럼이 없으면 None
+    """
+    cursor.execute(f"DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}")
+    key_column = schema.column('book2', 'mapping_seq')
+    if not key_column:
+        log("book2 테이블 또는 매핑SEQ 컬럼이 없어 검색 인덱스를 만들지 않습니다.")
+        return None
+    
+    index_columns = ', '.join(field for _, field in SEARCH_INDEX_FIELDS)
+    tokenizer = None
+    for candidate in ('trigram', 'unicode61'):
+        try:
+            cursor.execute(f"CREATE VIRTUAL TABLE {SEARCH_INDEX_TABLE} USING fts5({index_columns}, tokenize='{candidate}')")
+            tokenizer = candidate
+            break
+        except sqlite3.OperationalError:
+            continue
+    if tokenizer is None:
+        log("SQLite가 FTS5를 지원하지 않아 검색 인덱스를 만들지 않습니다.")
+        return None
+    
+    select_list = []
+    for table_name, field in SEARCH_INDEX_FIELDS:
+        col = schema.column(table_name, field)
+        select_list.append(f"{'b2' if table_name == 'book2' else 'b1'}.{col}" if col else "NULL")
+    join = ""
+    if schema.column('book1', 'mapping_seq'):
+        join = f"LEFT JOIN book1 b1 ON b1.{schema.column('book1', 'mapping_seq')} = b2.{key_column}"
+    
+    started = time.perf_counter()
+    cursor.execute(f"INSERT INTO {SEARCH_INDEX_TABLE} ({index_columns}) SELECT {', '.join(select_list)} FROM book2 b2 {join}")
+    log(f"검색 인덱스 생성 완료 ({tokenizer}, {cursor.rowcount}행, {time.perf_counter() - started:.1f}초)")
+    return tokenizer
+
+
+def search_index_tokenizer(conn):
+    """검색 인덱스의 토크나이저 이름을 반환합니다. 인덱스가 없으면 None."""
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE name = ?", (SEARCH_INDEX_TABLE,)).fetchone()
+    if not row:
+        return None
+    return 'trigram' if "'trigram'" in row[0] else 'unicode61'
+
+
+def search_interfaces(conn, query, limit=SEARCH_RESULT_LIMIT):
+    """
+    인터페이스 명, QMGR 명, 업무명, 어댑터 테이블 등의 일부로 인터페이스를 검색합니다.
+    
+    공백으로 나눈 검색어를 모두 포함하는 인터페이스를 관련도 순으로 반환합니다. trigram 인덱스는 세 글자
+    미만의 검색어를 찾을 수 없으므로 그런 검색어는 LIKE로 비교합니다.
+    
+    Args:
+        conn: SQLite 연결 (읽기 전용 연결도 가능)
+        query (str): 검색어
+        limit (int): 최대 결과 수
+    
+    Returns:
+        list: SEARCH_INDEX_FIELDS의 필드를 키로 하는 딕셔너리 목록 (매핑SEQ당 하나).
+            검색 인덱스가 없으면 빈 목록
+    """
+    terms = query.split()
+    tokenizer = search_index_tokenizer(conn)
+    if not terms or tokenizer is None:
+        return []
+    
+    fields = [field for _, field in SEARCH_INDEX_FIELDS]
+    if tokenizer == 'trigram':
+        match_terms = [term for term in terms if len(term) >= TRIGRAM_MIN_LENGTH]
+        like_terms = [term for term in terms if len(term) < TRIGRAM_MIN_LENGTH]
+    else:
+        match_terms, like_terms = terms, []
+    
+    conditions = []
+    params = []
+    if match_terms:
+        # 검색어를 각각 구문으로 묶어 FTS5 연산자로 해석되지 않게 함 (unicode61은 앞부분 일치)
+        suffix = "" if tokenizer == 'trigram' else "*"
+        conditions.append(f"{SEARCH_INDEX_TABLE} MATCH ?")
+        params.append(" ".join('"' + term.replace('"', '""') + '"' + suffix for term in match_terms))
+    for term in like_terms:
+        pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        conditions.append("(" + " OR ".join(f"{field} LIKE ? ESCAPE '\\'" for field in fields) + ")")
+        params.extend([pattern] * len(fields))
+    
+    order_by = "rank" if match_terms else "rowid"
+    sql = f"SELECT {', '.join(fields)} FROM {SEARCH_INDEX_TABLE} WHERE {' AND '.join(conditions)} ORDER BY {order_by}"
+    
+    results = []
+    seen = set()
+    for row in conn.execute(sql, params):
+        # book1에 같은 매핑SEQ가 여러 행이면 첫 번째(가장 관련도가 높은) 결과만 사용
+        if row[0] in seen:
+            continue
+        seen.add(row[0])
+        results.append({field: "" if value is None else str(value) for field, value in zip(fields, row)})
+        if len(results) >= limit:
+            break
+    return results
+
+
+def format_metrics_summary(table_metrics, finalize_s, commit_s):
+    """
+    테이블별 변환 지표를 사람이 읽을 수 있는 요약 줄 목록으로 만듭니다.
+    
+    Args:
+        table_metrics (list): excel_to_sqlite가 만든 table_done 지표 목록
+        finalize_s (float): 검색 스키마/인덱스 등 마무리 시간(초)
+        commit_s (float): 커밋 시간(초)
+    """
+    lines = ["=== 변환 지표 요약 ==="]
+    for metrics in table_metrics:
+        lines.append(f"[{metrics['table']}] 원본 {metrics.get('bytes', 0) / 1024 / 1024:.1f}MB, "
+                     f"읽은 행 {metrics.get('rows_read', 0):,} (빈 행 {metrics.get('rows_empty', 0):,}), "
+                     f"삽입 {metrics['rows_inserted']:,}행, {metrics['elapsed_s']:.2f}초 ({metrics['rows_per_s']:,.0f}행/초)")
+        lines.append(f"    열기 {metrics.get('open_s', 0):.2f}초, 헤더 {metrics.get('header_s', 0):.2f}초, "
+                     f"행 읽기 {metrics.get('rows_s', 0):.2f}초 (시트 {metrics.get('sheet_read_s', 0):.2f}초, "
+                     f"값 변환 {metrics.get('convert_s', 0):.2f}초), "
+                     f"삽입 {metrics['insert_s']:.2f}초, 마무리 {metrics['finish_s']:.2f}초")
+    lines.append(f"마무리(검색 스키마/인덱스) {finalize_s:.2f}초, 커밋 {commit_s:.2f}초")
+    return lines
+
+
+def open_bulk_load_database(db_file, work_file):
+    """
+    대량 적재 프로파일로 작업용 데이터베이스 파일을 엽니다.
+    
+    기존 데이터베이스가 있으면 변환하지 않는 테이블과 manifest가 유지되도록 작업 파일로 복사한 뒤,
+    저널과 동기화를 끄고 캐시를 키워 적재 속도를 높입니다. 작업 파일은 변환이 끝난 뒤 원래
+    파일 위치로 교체하므로, 중간에 실패하면 버리기만 하면 됩니다.
+    
+    Args:
+        db_file (str): 최종 데이터베이스 파일 경로
+        work_file (str): 적재에 사용할 작업 파일 경로 (db_file과 같은 디렉터리)
+    """
+    if os.path.exists(work_file):
+        os.remove(work_file)
+    
+    conn = sqlite3.connect(work_file)
+    conn.execute(f"PRAGMA page_size = {BULK_PAGE_SIZE}")  # 빈 데이터베이스에서만 적용됨
+    if os.path.exists(db_file):
+        source = sqlite3.connect(db_file)
+        try:
+            source.backup(conn)
+        finally:
+            source.close()
+    
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute(f"PRAGMA cache_size = -{BULK_CACHE_SIZE_KB}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+def replace_database_file(work_file, db_file):
+    """
+    완성된 작업 파일을 디스크에 기록한 뒤 원래 데이터베이스 위치로 원자적으로 교체합니다.
+    
+    대량 적재는 동기화 없이(synchronous=OFF) 기록하므로, 교체 전에 fsync하지 않으면 전원이 꺼졌을 때
+    교체된 파일이 잘리거나 손상된 채로 남을 수 있습니다. Windows에서는 데이터베이스를 연 프로그램이 있으면
+    교체할 수 없으므로, 이때는 작업 파일을 지우고 기존 데이터베이스를 그대로 둔 채 PermissionError를 발생시킵니다.
+    
+    Args:
+        work_file (str): 완성된 작업 파일 경로
+        db_file (str): 교체할 데이터베이스 파일 경로
+    """
+    with open(work_file, 'rb') as f:
+        os.fsync(f.fileno())
+    try:
+        os.replace(work_file, db_file)
+    except PermissionError as e:
+        os.remove(work_file)
+        raise PermissionError(f"데이터베이스 '{db_file}'를 사용 중인 프로그램(GUI 검색, serve 등)이 있어 교체하지 "
+                              f"못했습니다. 데이터베이스를 연 프로그램을 닫은 뒤 다시 실행하세요: {e}") from e
+    # 이름 변경도 디스크에 남도록 디렉터리를 동기화 (디렉터리를 열 수 없는 Windows는 제외)
+    if os.name == 'posix':
+        directory = os.open(os.path.dirname(os.path.abspath(db_file)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def is_database_current(db_file, table_configs, search_index, interface_view):
+    """
+    기존 데이터베이스가 이번 변환 설정으로 다시 만들 것이 없는 최신 상태인지 확인합니다.
+    
+    대량 적재는 작업 파일 복사와 교체 비용이 크므로, 복사하기 전에 이 함수로 변환할 테이블이
+    있는지 먼저 확인합니다. 원본 내용이 같아 수정 시각만 갱신한 manifest 기록은 저장합니다.
+    
+    Args:
+        db_file (str): 데이터베이스 파일 경로
+        table_configs (dict): 공통 옵션을 반영한 테이블별 설정
+        search_index (bool): 인터페이스 전문 검색 인덱스를 만드는지 여부
+        interface_view (bool): 인터페이스 상세 정보 테이블을 만드는지 여부
+    
+    Returns:
+        bool: 모든 테이블의 원본과 변환 옵션, 컬럼 해석 결과가 그대로이고 필요한 검색 인덱스와
+        상세 정보 테이블이 있으면 True
+    """
+    if not os.path.exists(db_file):
+        return False
+    
+    conn = sqlite3.connect(db_file)
+    try:
+        cursor = conn.cursor()
+        for table_name, config in table_configs.items():
+            try:
+                signature = source_signature(config)
+            except OSError:
+                return False
+            if not is_source_unchanged(cursor, table_name, signature):
+                return False
+        
+        if search_index and search_index_tokenizer(conn) is None:
+            return False
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (INTERFACE_VIEW_TABLE,))
+        if interface_view and cursor.fetchone() is None:
+            return False
+        
+        # 헤더로 지정한 필드가 바뀌었으면 컬럼 해석 결과를 다시 저장해야 함
+        previous_schema = load_resolved_schema(cursor)
+        schema = resolve_schema(cursor, {table_name: config['field_headers']
+                                         for table_name, config in table_configs.items() if config.get('field_headers')})
+        if any(schema.tables.get(table_name) != previous_schema.tables.get(table_name) for table_name in table_configs):
+            return False
+        
+        conn.commit()
+        return True
+    except sqlite3.OperationalError:
+        # 이전 형식의 manifest 등 비교할 수 없으면 변환이 필요한 것으로 봄
+        return False
+    finally:
+        conn.close()
+
+
+def excel_to_sqlite(excel_configs, db_file='test.db', log_callback=None, batch_size=1000, commit_every=None,
+                    workers=1, incremental=False, row_diff=False, cancel_event=None, infer_types=False,
+                    type_sample_rows=1000, bulk_load=False, search_index=True, interface_view=False,
+                    phase_times=None, metrics_callback=None, cprofile=False, trace_memory=False):
+    """
+    엑셀 파일의 데이터를 SQLite 데이터베이스로 변환합니다.
+    
+    데이터 행은 batch_size 단위로 스트리밍 삽입하므로 시트 크기와 관계없이 메모리 사용량이 일정합니다.
+    workers가 2 이상이면 워크북을 워커 프로세스에서 병렬로 파싱하고, 이 함수가 가진 단일
+    SQLite 연결로 모든 배치를 기록합니다.
+    
+    변환한 원본의 경로, 크기, 수정 시각, 내용 해시, 시트, 헤더 행은 manifest 테이블에 기록됩니다.
+    incremental이면 마지막 변환 이후 바뀌지 않은 원본은 건너뛰고, row_diff이면 테이블을 새로
+    만드는 대신 매핑SEQ(또는 config의 key_column) 기준으로 바뀐 행만 반영합니다.
+    적재가 끝난 테이블에는 키 컬럼(또는 config의 index_columns)에 인덱스를 만들고, config의
+    primary_key가 참이면 키 컬럼을 기본 키로 저장합니다.
+    
+    infer_types이면 앞부분 type_sample_rows개 행으로 컬럼 타입(INTEGER, REAL, DATE, TEXT)을 추론해 값을
+    원래 형태로 저장합니다. 테이블별로 config의 infer_types, column_types로 바꿀 수 있습니다.
+    
+    bulk_load이면 저널/동기화를 끈 작업 파일에 하나의 트랜잭션으로 적재한 뒤 db_file 위치로 원자적으로
+    교체합니다. 조회하는 쪽은 변환 중에도 이전 데이터베이스를 온전히 보며, 절반만 만들어진
+    데이터베이스를 보는 일이 없습니다.
+    
+    search_index이면 인터페이스 명, QMGR 명, 업무명 등의 일부로 찾을 수 있도록 FTS5 검색 인덱스를
+    만듭니다 (search_interfaces 참고). interface_view이면 매핑SEQ당 한 행의 상세 정보 테이블을 만들어
+    조회를 한 행 읽기로 줄이며, 행 단위로 반영한 경우에는 바뀐 매핑SEQ의 행만 다시 계산합니다.
+    각 컬럼의 엑셀 원래 헤더 텍스트를 기록해 두므로, 검색 필드를 판별 규칙 대신 config의 field_headers로
+    헤더 텍스트에 직접 연결할 수 있습니다 (resolve_schema 참고).
+    
+    metrics_callback을 지정하면 다음 지표 이벤트(딕셔너리)를 전달하고, 마지막에 테이블별 요약을 로그로
+    출력합니다. 모든 이벤트에는 'event' 키로 종류가 들어 있습니다.
+    - batch: table, rows(배치 행 수), total_rows(누적 삽입 행 수), insert_s(executemany 시간)
+    - table_done: table, bytes, rows_read, rows_empty, rows_inserted, 읽기 쪽 시간(open_s, header_s, rows_s,
+      sheet_read_s, convert_s), 쓰기 쪽 시간(phases: iter_timed_events 단계별 시간), insert_s, finish_s,
+      elapsed_s, rows_per_s
+    - profile: table, cprofile_report, peak_memory_bytes, top_allocations (cprofile/trace_memory 사용 시)
+    - run_done: tables, rows_inserted, elapsed_s, rows_per_s, finalize_s, commit_s
+    cprofile, trace_memory는 테이블별로 프로파일을 수집하며, 읽기도 같은 프로세스에서 측정해야 하므로
+    순차 변환(workers=1)으로 실행합니다.
+    
+    Args:
+        excel_configs (dict): 엑셀 파일 구성 정보를 담은 딕셔너리
+        db_file (str): SQLite 데이터베이스 파일 경로
+        log_callback (function): 로그 메시지를 표시하기 위한 콜백 함수
+        batch_size (int): executemany 한 번에 삽입할 행 수
+        commit_every (int): 지정하면 N개 배치마다 커밋 (None이면 마지막에 한 번만 커밋)
+        workers (int): 워크북을 동시에 파싱할 워커 프로세스 수 (1이면 순차 처리)
+        incremental (bool): 바뀌지 않은 원본은 다시 변환하지 않음
+        row_diff (bool): 기존 테이블과 비교해 바뀐 키의 행만 삭제/삽입
+        cancel_event (threading.Event): 설정되면 변환을 중단하고 ConversionCancelled를 발생시킴
+        infer_types (bool): 컬럼 타입을 추론해 숫자/날짜를 문자열로 바꾸지 않고 저장
+        type_sample_rows (int): 타입 추론에 사용할 앞부분 행 수
+        bulk_load (bool): 대량 적재 프로파일로 작업 파일에 만든 뒤 교체 (commit_every는 무시됨)
+        search_index (bool): 인터페이스 전문 검색 인덱스 생성
+        interface_view (bool): 매핑SEQ별 상세 정보 테이블(interface_view) 생성
+        phase_times (dict): 지정하면 단계별 소요 시간(초)을 누적 (open, header, rows, insert, table_finish,
+            finalize, commit; iter_timed_events 참고)
+        metrics_callback (function): 지표 이벤트(딕셔너리)를 받을 콜백 함수
+        cprofile (bool): 테이블별 cProfile 프로파일 수집
+        trace_memory (bool): 테이블별 tracemalloc 메모리 사용량 수집
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size는 1 이상이어야 합니다: {batch_size}")
+    
+    def log(message):
+        if log_callback:
+            log_callback(message)
+        else:
+            print(message)
+    
+    # 지표와 프로파일 수집 설정
+    collect_metrics = metrics_callback is not None or cprofile or trace_memory
+    
+    def emit(event, **values):
+        if metrics_callback:
+            metrics_callback(dict(event=event, **values))
+    
+    profiler = TableProfiler(cprofile, trace_memory)
+    if (cprofile or trace_memory) and workers > 1:
+        log("프로파일을 수집하기 위해 순차 변환으로 실행합니다.")
+        workers = 1
+    
+    # 공통 옵션을 테이블 설정에 반영 (테이블 설정에 지정한 값이 우선)
+    table_configs = {table_name: dict({'infer_types': infer_types, 'type_sample_rows': type_sample_rows,
+                                       'collect_stats': collect_metrics}, **config)
+                     for table_name, config in excel_configs.items()}
+    
+    # 대량 적재 시 바뀐 것이 없으면 작업 파일을 복사하고 교체할 필요가 없으므로 바로 끝냄
+    if bulk_load and incremental and is_database_current(db_file, table_configs, search_index, interface_view):
+        log("모든 테이블의 원본과 변환 옵션 변경 없음, 데이터베이스를 그대로 둡니다.")
+        return True
+    
+    # SQLite 데이터베이스 연결
+    if bulk_load:
+        work_file = f"{db_file}.building"
+        conn = open_bulk_load_database(db_file, work_file)
+        commit_every = None  # 전체를 하나의 트랜잭션으로 적재
+        log(f"대량 적재 모드: 작업 파일 '{work_file}'에 적재 후 교체합니다.")
+    else:
+        work_file = db_file
+        conn = sqlite3.connect(db_file)
+    
+    conversion_started = time.perf_counter()
+    succeeded = False
+    try:
+        # 테이블 삭제/생성까지 같은 트랜잭션에 묶이도록 트랜잭션을 직접 관리
+        conn.isolation_level = None
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        ensure_manifest_table(cursor)
+        ensure_header_table(cursor)
+        
+        # 원본 상태를 확인해 변환 대상 선정
+        signatures = {}
+        pending_configs = {}
+        for table_name, config in table_configs.items():
+            try:
+                signatures[table_name] = source_signature(config)
+            except OSError:
+                # 파일이 없으면 열기 단계에서 실패 로그를 남기도록 그대로 진행
+                pending_configs[table_name] = config
+                continue
             
-            # GroupID와 EventID 컬럼 확인
-            group_id_col = None
-            event_id_col = None
-            for col in book2_columns:
-                if "group" in col.lower() and "id" in col.lower():
-                    group_id_col = col
-                if "event" in col.lower() and "id" in col.lower():
-                    event_id_col = col
+            if incremental and is_source_unchanged(cursor, table_name, signatures[table_name]):
+                log(f"테이블 '{table_name}': 원본과 변환 옵션 변경 없음, 건너뜀")
+                continue
+            pending_configs[table_name] = config
+        
+        # 병렬 처리 시 여러 테이블의 로그가 섞이므로 테이블 이름을 앞에 붙임
+        parallel = min(workers, len(pending_configs)) > 1
+        
+        def table_log(table_name, message):
+            log(f"[{table_name}] {message}" if parallel else message)
+        
+        # 테이블별 삽입 상태 ((삽입 대상 테이블, 컬럼 목록, 컬럼 정의, 키 컬럼), INSERT 문, 삽입된 행 수)
+        targets = {}
+        insert_sqls = {}
+        column_headers = {}  # 테이블 이름 -> 원래 헤더 텍스트 목록
+        row_counts = {}
+        started_at = {}
+        batch_count = 0
+        
+        # 지표: 테이블별 쓰기 쪽 단계 시간, 읽기 쪽 통계, 삽입 시간, 완료된 테이블 지표
+        table_times = {} if collect_metrics else None
+        reader_stats = {}
+        insert_times = {}
+        table_metrics = []
+        
+        # 상세 정보 테이블에서 다시 계산할 매핑SEQ (book1/book2를 새로 만들었으면 None으로 두고 전체 재생성)
+        view_changed_keys = set()
+        
+        if parallel:
+            log(f"워커 {min(workers, len(pending_configs))}개로 병렬 변환합니다.")
+        
+        # 각 엑셀 설정에 대해 처리
+        events = iter_table_events(pending_configs, batch_size, workers)
+        for table_name, kind, value in iter_timed_events(events, phase_times, table_times):
+            # 취소 요청은 이벤트(배치) 단위로 확인
+            if cancel_event is not None and cancel_event.is_set():
+                events.close()
+                raise ConversionCancelled("변환이 취소되었습니다.")
             
-            # 송신 및 수신 관련 컬럼 찾기
-            send_task_col = None
-            send_qmgr_col = None
-            recv_task_col = None
-            recv_qmgr_col = None
+            if kind == 'start':
+                log(f"테이블 '{table_name}' 처리 중...")
+                started_at[table_name] = time.perf_counter()
+                profiler.start()
             
-            # SQL 관련 컬럼 찾기
-            send_userid_col = None
-            send_passwd_col = None
-            send_db_col = None
-            send_schema_adapter_col = None
-            send_table_adapter_col = None
+            elif kind == 'stats':
+                reader_stats[table_name] = value
             
-            recv_userid_col = None
-            recv_passwd_col = None
-            recv_db_col = None
-            recv_schema_adapter_col = None
-            recv_table_adapter_col = None
+            elif kind == 'log':
+                table_log(table_name, value)
             
-            for col in book2_columns:
-                # 송신 관련 컬럼
-                if "송신" in col and "업무" in col:
-                    send_task_col = col
-                if "송신" in col and "qmgr" in col.lower():
-                    send_qmgr_col = col
-                if "송신" in col and "userid" in col.lower():
-                    send_userid_col = col
-                if "송신" in col and ("passwd" in col.lower() or "password" in col.lower()):
-                    send_passwd_col = col
-                if "송신" in col and "db" in col.lower():
-                    send_db_col = col
-                if "송신" in col and "schema" in col.lower() and "adapter" in col.lower():
-                    send_schema_adapter_col = col
-                if "송신" in col and "table" in col.lower() and "adapter" in col.lower():
-                    send_table_adapter_col = col
+            elif kind == 'columns':
+                column_names, column_types, header_texts = value
+                column_headers[table_name] = header_texts
+                column_defs = [f'{col} {col_type}' for col, col_type in zip(column_names, column_types)]
+                table_log(table_name, f"컬럼: {', '.join(column_names)}")
                 
-                # 수신 관련 컬럼
-                if "수신" in col and "업무" in col:
-                    recv_task_col = col
-                if "수신" in col and "qmgr" in col.lower():
-                    recv_qmgr_col = col
-                if "수신" in col and "userid" in col.lower():
-                    recv_userid_col = col
-                if "수신" in col and ("passwd" in col.lower() or "password" in col.lower()):
-                    recv_passwd_col = col
-                if "수신" in col and "db" in col.lower():
-                    recv_db_col = col
-                if "수신" in col and "schema" in col.lower() and "adapter" in col.lower():
-                    recv_schema_adapter_col = col
-                if "수신" in col and "table" in col.lower() and "adapter" in col.lower():
-                    recv_table_adapter_col = col
-            
-            # book2에서 검색 실행
-            query = f"SELECT * FROM book2 WHERE {mapping_seq_col} = ?"
-            cursor.execute(query, (mapping_seq,))
-            book2_row = cursor.fetchone()
-            
-            if not book2_row:
-                messagebox.showinfo("검색 결과", f"매핑SEQ '{mapping_seq}'에 해당하는 데이터가 없습니다.")
-                conn.close()
-                return
-            
-            # book1에서 검색 실행
-            book1_row = None
-            if book1_exists and book1_mapping_seq_col:
-                query = f"SELECT * FROM book1 WHERE {book1_mapping_seq_col} = ?"
-                cursor.execute(query, (mapping_seq,))
-                book1_row = cursor.fetchone()
-            
-            # 결과 표시
-            self.config_text.delete(1.0, tk.END)
-            
-            # 매핑SEQ 표시
-            self.config_text.insert(tk.END, f"[매핑SEQ] {book2_row[book2_columns.index(mapping_seq_col)]}\n")
-            
-            # INTERFACE ID 표시 (GroupID.EventID)
-            interface_id = ""
-            if group_id_col and event_id_col:
-                group_id = book2_row[book2_columns.index(group_id_col)]
-                event_id = book2_row[book2_columns.index(event_id_col)]
-                interface_id = f"{group_id}.{event_id}"
-            
-            self.config_text.insert(tk.END, f"[INTERFACE ID] {interface_id}\n")
-            
-            # 인터페이스 명 표시 (book1 테이블에서)
-            if book1_row and interface_name_col:
-                interface_name = book1_row[book1_columns.index(interface_name_col)]
-                if interface_name:
-                    self.config_text.insert(tk.END, f"[인터페이스 명] {interface_name}\n")
-            
-            # I_F_Type 표시 (book1 테이블에서)
-            if book1_row and if_type_col:
-                if_type = book1_row[book1_columns.index(if_type_col)]
-                if if_type and str(if_type).strip():
-                    self.config_text.insert(tk.END, f"[I_F_Type] {if_type}\n")
-            
-            # 송신 정보 표시
-            send_info = ""
-            if send_task_col:
-                send_task = book2_row[book2_columns.index(send_task_col)]
-                send_info = f"[송신_업무명] {send_task}"
-            
-            if send_qmgr_col:
-                send_qmgr = book2_row[book2_columns.index(send_qmgr_col)]
-                if send_info:
-                    send_info += f"    [송신_QMGR명] {send_qmgr}"
+                # 행 단위 반영: 기존 테이블과 컬럼 구성(기본 키를 제외한 타입 포함)이 같고 키 컬럼이 있으면
+                # 임시 스테이징 테이블에 적재
+                key_column = pending_configs[table_name].get('key_column') or find_mapping_seq_column(column_names)
+                cursor.execute(f"PRAGMA table_info({table_name})")
+                existing_columns = [(column[1], column[2], column[5]) for column in cursor.fetchall()]
+                same_layout = ([col for col, _, _ in existing_columns] == column_names and
+                               all(is_pk or existing_type == col_type
+                                   for (_, existing_type, is_pk), col_type in zip(existing_columns, column_types)))
+                
+                if row_diff and key_column in column_names and same_layout:
+                    # 기존 테이블과 같은 타입으로 만들어야 EXCEPT 비교 시 값이 같은 형태로 저장됨
+                    target_table = f"temp._stage_{table_name}"
+                    cursor.execute(f"DROP TABLE IF EXISTS {target_table}")
+                    cursor.execute(f"CREATE TABLE {target_table} ({', '.join([f'{col} {col_type}' for col, col_type, _ in existing_columns])})")
+                    table_log(table_name, f"키 컬럼 '{key_column}' 기준으로 변경된 행만 반영합니다.")
                 else:
-                    send_info = f"[송신_QMGR명] {send_qmgr}"
-            
-            if send_info:
-                self.config_text.insert(tk.END, f"\n{send_info}")
+                    if row_diff:
+                        table_log(table_name, "기존 테이블과 컬럼 구성이 다르거나 키 컬럼이 없어 테이블을 새로 생성합니다.")
+                    target_table = table_name
+                    
+                    # 테이블이 존재하면 삭제
+                    cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+                    
+                    # 테이블 생성
+                    create_table_sql = f"CREATE TABLE {table_name} ({', '.join(column_defs)})"
+                    cursor.execute(create_table_sql)
+                    table_log(table_name, f"테이블 '{table_name}' 생성 완료")
+                
+                placeholders = ', '.join(['?' for _ in column_names])
+                targets[table_name] = (target_table, column_names, column_defs, key_column)
+                insert_sqls[table_name] = f"INSERT INTO {target_table} ({', '.join(column_names)}) VALUES ({placeholders})"
+                row_counts[table_name] = 0
             
-            # 수신 정보 표시
-            recv_info = ""
-            if recv_task_col:
-                recv_task = book2_row[book2_columns.index(recv_task_col)]
-                recv_info = f"[수신_업무명] {recv_task}"
+            elif kind == 'rows':
+                # 데이터 삽입 (배치 단위 스트리밍)
+                insert_started = time.perf_counter()
+                cursor.executemany(insert_sqls[table_name], value)
+                previous_count = row_counts[table_name]
+                row_counts[table_name] += len(value)
+                batch_count += 1
+                if collect_metrics:
+                    insert_s = time.perf_counter() - insert_started
+                    insert_times[table_name] = insert_times.get(table_name, 0.0) + insert_s
+                    emit('batch', table=table_name, rows=len(value), total_rows=row_counts[table_name], insert_s=insert_s)
+                
+                # N개 배치마다 커밋
+                if commit_every and batch_count % commit_every == 0:
+                    conn.commit()
+                    cursor.execute("BEGIN")
+                
+                # 일정 행 수를 넘길 때마다 실제 삽입된 행 수를 로그로 출력
+                if row_counts[table_name] // PROGRESS_LOG_INTERVAL > previous_count // PROGRESS_LOG_INTERVAL:
+                    table_log(table_name, f"{row_counts[table_name]}행 처리 중...")
             
-            if recv_qmgr_col:
-                recv_qmgr = book2_row[book2_columns.index(recv_qmgr_col)]
-                if recv_info:
-                    recv_info += f"    [수신_QMGR명] {recv_qmgr}"
+            elif kind == 'done':
+                profile = profiler.stop()
+                if profile:
+                    emit('profile', table=table_name, **profile)
+                finish_started = time.perf_counter()
+                
+                # 파일 열기에 실패한 테이블은 기존 데이터와 manifest를 그대로 둠
+                if table_name not in targets:
+                    continue
+                
+                target_table, column_names, column_defs, key_column = targets[table_name]
+                view_source = table_name in ('book1', 'book2')
+                if target_table == table_name:
+                    table_log(table_name, f"총 {row_counts[table_name]}행 삽입 완료")
+                    if view_source:
+                        view_changed_keys = None
                 else:
-                    recv_info = f"[수신_QMGR명] {recv_qmgr}"
-            
-            if recv_info:
-                self.config_text.insert(tk.END, f"\n{recv_info}")
-            
-            # SQL 정보 추가
-            # 송신 SQL
-            send_sql = "\n[송신SQL]"
-            
-            send_userid = book2_row[book2_columns.index(send_userid_col)] if send_userid_col and book2_columns.index(send_userid_col) < len(book2_row) else "?"
-            send_passwd = book2_row[book2_columns.index(send_passwd_col)] if send_passwd_col and book2_columns.index(send_passwd_col) < len(book2_row) else "?"
-            send_db = book2_row[book2_columns.index(send_db_col)] if send_db_col and book2_columns.index(send_db_col) < len(book2_row) else "?"
-            send_schema = book2_row[book2_columns.index(send_schema_adapter_col)] if send_schema_adapter_col and book2_columns.index(send_schema_adapter_col) < len(book2_row) else "?"
-            send_table = book2_row[book2_columns.index(send_table_adapter_col)] if send_table_adapter_col and book2_columns.index(send_table_adapter_col) < len(book2_row) else "?"
-            
-            send_sql += f"\nsqlplus {send_userid}/{send_passwd}@{send_db}"
-            send_sql += f"\nselect count(*) from {send_schema}.{send_table} where EAI_TRANSFER_DATE > sysdate-(1/12) and EAI_TRANSFER_FLAG='Y';"
-            
-            self.config_text.insert(tk.END, send_sql)
-            
-            # 수신 SQL
-            recv_sql = "\n[수신SQL]"
-            
-            recv_userid = book2_row[book2_columns.index(recv_userid_col)] if recv_userid_col and book2_columns.index(recv_userid_col) < len(book2_row) else "?"
-            recv_passwd = book2_row[book2_columns.index(recv_passwd_col)] if recv_passwd_col and book2_columns.index(recv_passwd_col) < len(book2_row) else "?"
-            recv_db = book2_row[book2_columns.index(recv_db_col)] if recv_db_col and book2_columns.index(recv_db_col) < len(book2_row) else "?"
-            recv_schema = book2_row[book2_columns.index(recv_schema_adapter_col)] if recv_schema_adapter_col and book2_columns.index(recv_schema_adapter_col) < len(book2_row) else "?"
-            recv_table = book2_row[book2_columns.index(recv_table_adapter_col)] if recv_table_adapter_col and book2_columns.index(recv_table_adapter_col) < len(book2_row) else "?"
-            
-            recv_sql += f"\nsqlplus {recv_userid}/{recv_passwd}@{recv_db}"
-            recv_sql += f"\nselect count(*) from {recv_schema}.{recv_table} where EAI_TRANSFER_DATE > sysdate-(1/12);"
-            
-            self.config_text.insert(tk.END, recv_sql)
-            
-            # Route정의 표시 (book1 테이블에서)
-            if book1_row and route_col:
-                route_def = book1_row[book1_columns.index(route_col)]
-                if route_def:
-                    self.config_text.insert(tk.END, f"\n[Route정의] {route_def}")
-            
-            conn.close()
-            self.log(f"매핑SEQ '{mapping_seq}' 검색 완료")
+                    try:
+                        changed_count, deleted_count, inserted_count = apply_row_diff(
+                            cursor, table_name, target_table, column_names, key_column)
+                        table_log(table_name, f"총 {row_counts[table_name]}행 비교, 변경된 키 {changed_count}개 반영 "
+                                              f"(삭제 {deleted_count}행, 삽입 {inserted_count}행)")
+                        # 매핑SEQ가 아닌 키로 비교한 경우에는 바뀐 매핑SEQ를 알 수 없으므로 전체 재생성
+                        if view_source and view_changed_keys is not None:
+                            if key_column == find_mapping_seq_column(column_names):
+                                view_changed_keys.update(
+                                    key for (key,) in cursor.execute("SELECT CAST(key AS TEXT) FROM temp._changed_keys")
+                                    if key is not None)
+                            else:
+                                view_changed_keys = None
+                    except sqlite3.IntegrityError:
+                        # 기본 키로 저장된 테이블에 중복 키가 생긴 경우 스테이징 데이터로 테이블을 새로 만듦
+                        table_log(table_name, "새 데이터에 중복 키가 있어 테이블을 새로 생성합니다.")
+                        if view_source:
+                            view_changed_keys = None
+                        cursor.execute(f"DROP TABLE {table_name}")
+                        cursor.execute(f"CREATE TABLE {table_name} ({', '.join(column_defs)})")
+                        cursor.execute(f"INSERT INTO {table_name} SELECT * FROM {target_table}")
+                        table_log(table_name, f"총 {row_counts[table_name]}행 삽입 완료")
+                    cursor.execute(f"DROP TABLE {target_table}")
+                
+                # 일괄 삽입이 끝난 뒤 조회용 인덱스 생성
+                build_table_indexes(cursor, table_name, pending_configs[table_name], key_column,
+                                    lambda message, table_name=table_name: table_log(table_name, message))
+                
+                if table_name in signatures:
+                    record_source(cursor, table_name, signatures[table_name])
+                record_column_headers(cursor, table_name, column_names, column_headers[table_name])
+                
+                elapsed = time.perf_counter() - started_at[table_name]
+                table_log(table_name, f"처리 시간 {elapsed:.1f}초 ({row_counts[table_name] / elapsed if elapsed else 0:,.0f}행/초)")
+                
+                if collect_metrics:
+                    metrics = dict(reader_stats.get(table_name, {}), table=table_name,
+                                   rows_inserted=row_counts[table_name],
+                                   phases=table_times.get(table_name, {}),
+                                   insert_s=insert_times.get(table_name, 0.0),
+                                   finish_s=time.perf_counter() - finish_started,
+                                   elapsed_s=elapsed,
+                                   rows_per_s=row_counts[table_name] / elapsed if elapsed else 0)
+                    table_metrics.append(metrics)
+                    emit('table_done', **metrics)
+        
+        # 검색에 사용할 컬럼 해석 결과를 저장
+        # 이번 설정에 없고 다시 만들지도 않은 테이블은 이전 해석 결과(헤더로 지정한 필드 포함)를 유지
+        finalize_started = time.perf_counter()
+        previous_schema = load_resolved_schema(cursor)
+        schema = resolve_schema(cursor, {table_name: config['field_headers']
+                                         for table_name, config in excel_configs.items() if config.get('field_headers')})
+        for table_name, fields in previous_schema.tables.items():
+            if schema.has_table(table_name) and table_name not in targets and table_name not in excel_configs:
+                schema.tables[table_name] = fields
+        # 대량 적재 시 실제로 바뀐 내용이 있을 때만 작업 파일로 교체
+        database_changed = bool(targets) or schema.tables != previous_schema.tables
+        save_resolved_schema(cursor, schema)
+        
+        # 검색 인덱스와 상세 정보 테이블은 book1/book2로 만드므로 다른 테이블만 변환했으면 그대로 둠
+        sources_changed = any(table_name in ('book1', 'book2') for table_name in targets)
+        
+        # 인터페이스 전문 검색 인덱스는 book1/book2를 변환했거나 인덱스가 없을 때만 다시 만듦
+        # (만들지 않는 경우 이전 인덱스가 바뀐 데이터와 어긋나지 않도록 삭제)
+        if search_index and (sources_changed or search_index_tokenizer(conn) is None):
+            build_search_index(cursor, schema, log)
+            database_changed = True
+        elif not search_index and sources_changed:
+            cursor.execute(f"DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}")
+        
+        # 상세 정보 테이블은 없거나 book1/book2를 새로 만들었으면 전체를, 행 단위로 반영했으면 바뀐 매핑SEQ만 계산
+        if interface_view:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (INTERFACE_VIEW_TABLE,))
+            if view_changed_keys is None or cursor.fetchone() is None:
+                build_interface_view(cursor, schema, log)
+                database_changed = True
+            elif view_changed_keys:
+                build_interface_view(cursor, schema, log, view_changed_keys)
+                database_changed = True
+        elif sources_changed:
+            cursor.execute(f"DROP TABLE IF EXISTS {INTERFACE_VIEW_TABLE}")
+        
+        # 변경사항 저장
+        commit_started = time.perf_counter()
+        conn.commit()
+        succeeded = True
+    except BaseException:
+        # 취소나 오류 시 마지막 커밋 이후 변경사항을 되돌림 (대량 적재 시에는 작업 파일을 버림)
+        if work_file == db_file:
+            conn.rollback()
+        raise
+    finally:
+        profiler.stop()  # 테이블 도중에 중단된 경우 프로파일러 정리
+        conn.close()
+        if work_file != db_file and not succeeded and os.path.exists(work_file):
+            os.remove(work_file)
+    
+    # 완성된 작업 파일을 디스크에 기록한 뒤 원래 위치로 원자적으로 교체
+    # (건너뛰거나 실패한 테이블만 있어 바뀐 것이 없으면 작업 파일을 버리고 기존 파일을 그대로 둠)
+    if work_file != db_file:
+        if database_changed or not os.path.exists(db_file):
+            replace_database_file(work_file, db_file)
+        else:
+            os.remove(work_file)
+            log("바뀐 테이블이 없어 데이터베이스를 교체하지 않습니다.")
+    
+    finalize_s = commit_started - finalize_started
+    commit_s = time.perf_counter() - commit_started
+    if phase_times is not None:
+        phase_times['finalize'] = phase_times.get('finalize', 0.0) + finalize_s
+        phase_times['commit'] = phase_times.get('commit', 0.0) + commit_s
+    
+    total_rows = sum(row_counts.values())
+    elapsed = time.perf_counter() - conversion_started
+    if collect_metrics:
+        for line in format_metrics_summary(table_metrics, finalize_s, commit_s):
+            log(line)
+        emit('run_done', tables=[metrics['table'] for metrics in table_metrics], rows_inserted=total_rows,
+             elapsed_s=elapsed, rows_per_s=total_rows / elapsed if elapsed else 0,
+             finalize_s=finalize_s, commit_s=commit_s)
+    log(f"전체 {total_rows}행, {elapsed:.1f}초 ({total_rows / elapsed if elapsed else 0:,.0f}행/초)")
+    log(f"데이터베이스 '{db_file}'에 성공적으로 데이터를 저장했습니다.")
+    return True
+
+
+def load_config_file(path):
+    """
+    변환 설정 파일(JSON 또는 TOML)을 읽습니다.
+    
+    파일에는 tables(테이블 이름 -> 엑셀 설정)와 선택적으로 db_file, options(excel_to_sqlite 옵션)를
+    둘 수 있습니다. tables 키가 없으면 파일 전체를 테이블 설정으로 봅니다.
+    
+    JSON 예:
+        {"db_file": "mgui2.db",
+         "options": {"workers": 2, "incremental": true},
+         "tables": {"book1": {"path": "1.xlsx", "sheet_name": "1", "header_row": 1}}}
+    
+    테이블 설정의 reader로 원본 리더(auto, openpyxl, xlsx, csv)를 고를 수 있으며, CSV/TSV 원본은
+    sheet_name 없이 path만 지정하고 delimiter, encoding을 둘 수 있습니다. priority(클수록 먼저)는
+    작업공간에서 변환 순서를 정할 때 사용합니다 (Workspace 참고).
+    
+    Returns:
+        dict: {'tables': dict, 'db_file': str 또는 None, 'options': dict}
+    """
+    if path.lower().endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:  # Python 3.10 이하
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise RuntimeError("TOML 설정 파일을 읽으려면 Python 3.11 이상 또는 tomli 패키지가 필요합니다.")
+        with open(path, 'rb') as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, encoding='utf-8-sig') as f:
+            data = json.load(f)
+    
+    tables = data.get('tables', data if 'db_file' not in data and 'options' not in data else {})
+    for table_name, config in tables.items():
+        if 'path' not in config or ('sheet_name' not in config and not is_text_source(config)):
+            raise ValueError(f"테이블 '{table_name}' 설정에 path와 sheet_name이 필요합니다.")
+        if not re.fullmatch(r'[A-Za-z_]\w*', table_name):
+            raise ValueError(f"테이블 이름으로 사용할 수 없습니다: {table_name}")
+    return {'tables': tables, 'db_file': data.get('db_file'), 'options': data.get('options', {})}
+
+
+class Workspace:
+    """
+    설정 파일 하나에 담긴 여러 테이블 설정(작업공간)입니다.
+    
+    변환할 테이블을 고르고, 변환 작업을 우선순위(테이블 설정의 priority, 클수록 먼저) 다음으로 오래된
+    순서(order='stale') 또는 원본이 작은 순서(order='size')로 정렬해 concurrency개씩 차례로 실행합니다.
+    차례마다 excel_to_sqlite를 따로 호출해 바로 커밋하므로, 앞에 둔 테이블은 나머지 테이블의 변환을
+    기다리지 않고 조회할 수 있습니다. bulk_load이면 차례마다 데이터베이스 파일을 복사하므로, 작은 테이블을
+    자주 새로 고칠 때는 끄는 편이 빠릅니다.
+    """
+    
+    def __init__(self, tables, db_file=None, options=None, path=None):
+        self.tables = tables  # 테이블 이름 -> 엑셀 설정
+        self.db_file = db_file or DEFAULT_DB_FILE
+        self.options = options or {}  # excel_to_sqlite 공통 옵션
+        self.path = path  # 설정 파일 경로
+    
+    @classmethod
+    def load(cls, path):
+        """설정 파일(JSON 또는 TOML)에서 작업공간을 읽습니다 (load_config_file 참고)."""
+        config = load_config_file(path)
+        return cls(config['tables'], config['db_file'], config['options'], path)
+    
+    def effective_config(self, table_name, options=None):
+        """excel_to_sqlite가 테이블 설정에 공통 옵션을 반영하는 것과 같이 합친 테이블 설정을 반환합니다."""
+        options = dict(self.options, **(options or {}))
+        return dict({'infer_types': options.get('infer_types', False),
+                     'type_sample_rows': options.get('type_sample_rows', 1000)}, **self.tables[table_name])
+    
+    def table_status(self, table_names=None, options=None):
+        """
+        테이블별 원본 상태를 manifest 기록과 비교합니다.
+        
+        파일 크기와 수정 시각만 확인하므로 테이블이 많아도 빠르며, 수정 시각만 바뀐 원본은 변경된
+        것으로 보입니다 (변환할 때 내용 해시로 다시 확인해 건너뜀). 변환 옵션이 마지막 변환과 다른
+        테이블도 변환이 필요한 것으로 표시합니다.
+        
+        Args:
+            table_names (list): 확인할 테이블 (None이면 전체)
+            options (dict): 작업공간 옵션 대신 적용할 excel_to_sqlite 옵션 (infer_types 등)
+        
+        Returns:
+            list: 테이블별 딕셔너리 (table, path, priority, size, stale, reason, converted_at)
+        """
+        recorded = {}
+        existing = set()
+        if os.path.exists(self.db_file):
+            conn = connect_read_only(self.db_file)
+            try:
+                cursor = conn.cursor()
+                existing = {name for (name,) in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+                if MANIFEST_TABLE in existing:
+                    # 변환 옵션 기록이 없는 이전 manifest는 옵션 해시를 NULL로 읽음
+                    cursor.execute(f"PRAGMA table_info({MANIFEST_TABLE})")
+                    has_options = 'options_hash' in [column[1] for column in cursor.fetchall()]
+                    for row in cursor.execute(f"SELECT table_name, path, size, mtime_ns, sheet_name, header_row, "
+                                              f"converted_at, {'options_hash' if has_options else 'NULL'} "
+                                              f"FROM {MANIFEST_TABLE}"):
+                        recorded[row[0]] = row[1:]
+            finally:
+                conn.close()
+        
+        statuses = []
+        for table_name in table_names or self.tables:
+            config = self.effective_config(table_name, options)
+            status = {'table': table_name, 'path': config['path'], 'priority': config.get('priority', 0),
+                      'size': None, 'stale': True, 'reason': "", 'converted_at': None}
+            try:
+                signature = source_signature(config)
+            except OSError:
+                status.update(stale=False, reason="원본 없음")
+                statuses.append(status)
+                continue
             
-        except Exception as e:
-            self.log(f"검색 중 오류 발생: {e}")
-            messagebox.showerror("검색 오류", f"검색 중 오류가 발생했습니다: {e}")
+            status['size'] = signature['size']
+            entry = recorded.get(table_name)
+            if entry:
+                status['converted_at'] = entry[5]
+            if entry is None or table_name not in existing:
+                status['reason'] = "변환 기록 없음"
+            elif entry[:5] != (signature['path'], signature['size'], signature['mtime_ns'],
+                               signature['sheet_name'], signature['header_row']):
+                status['reason'] = "원본 변경"
+            elif entry[6] != signature['options_hash']:
+                status['reason'] = "변환 옵션 변경"
+            else:
+                status.update(stale=False, reason="최신")
+            statuses.append(status)
+        return statuses
     
-    def convert(self):
-        # 변환 시작
-        self.log("변환 시작...")
-        self.convert_btn.config(state=tk.DISABLED)
+    def plan(self, table_names=None, stale_only=False, order='stale', options=None):
+        """
+        변환할 테이블 이름을 실행 순서대로 반환합니다.
+        
+        Args:
+            table_names (list): 변환할 테이블 (None이면 전체)
+            stale_only (bool): 원본이나 변환 옵션이 바뀌었거나 변환 기록이 없는 테이블만 선택
+            order (str): 같은 우선순위 안에서의 순서. 'stale'이면 변환이 필요한 테이블부터 마지막 변환이
+                오래된 순서, 'size'면 원본이 작은 순서
+            options (dict): 변환에 적용할 excel_to_sqlite 옵션 (table_status 참고)
+        
+        Returns:
+            list: 테이블 이름 목록
+        """
+        if order not in SCHEDULE_ORDERS:
+            raise ValueError(f"지원하지 않는 순서입니다: {order} (사용 가능: {', '.join(SCHEDULE_ORDERS)})")
+        unknown = [table_name for table_name in table_names or [] if table_name not in self.tables]
+        if unknown:
+            raise ValueError(f"작업공간에 없는 테이블입니다: {', '.join(unknown)}")
+        
+        statuses = self.table_status(table_names, options)
+        if stale_only:
+            statuses = [status for status in statuses if status['stale']]
+        if order == 'stale':
+            statuses.sort(key=lambda status: (-status['priority'], not status['stale'], status['converted_at'] or ""))
+        else:
+            statuses.sort(key=lambda status: (-status['priority'], status['size'] is None, status['size'] or 0))
+        return [status['table'] for status in statuses]
+    
+    def convert(self, table_names=None, stale_only=False, order='stale', concurrency=None, log_callback=None,
+                **options):
+        """
+        고른 테이블을 plan 순서대로 concurrency개씩 나눠 변환합니다.
+        
+        Args:
+            table_names (list): 변환할 테이블 (None이면 전체)
+            stale_only (bool): 원본이 바뀌었거나 변환 기록이 없는 테이블만 변환
+            order (str): 같은 우선순위 안에서의 순서 ('stale' 또는 'size')
+            concurrency (int): 한 차례에 병렬로 파싱할 최대 테이블 수 (기본값: 작업공간 옵션의 workers 또는 1)
+            log_callback (function): 로그 메시지를 처리할 콜백 함수
+            options: excel_to_sqlite 옵션 (작업공간 설정의 options보다 우선하며, workers는 concurrency로 정함)
         
+        Returns:
+            bool: 모든 차례가 성공했으면 True
+        """
+        log = log_callback or print
+        jobs = self.plan(table_names, stale_only, order, options)
+        if not jobs:
+            log("변환할 테이블이 없습니다.")
+            return True
+        
+        options = dict(self.options, **options)
+        workers = options.pop('workers', 1)
+        concurrency = max(1, concurrency or workers)
+        log(f"테이블 {len(jobs)}개를 한 번에 최대 {concurrency}개씩 변환합니다 (순서: {', '.join(jobs)})")
+        succeeded = True
+        for start in range(0, len(jobs), concurrency):
+            wave = jobs[start:start + concurrency]
+            configs = {table_name: self.tables[table_name] for table_name in wave}
+            succeeded = excel_to_sqlite(configs, self.db_file, log, workers=len(wave), **options) and succeeded
+        return succeeded
+    
+    def watch(self, interval=DEFAULT_REFRESH_INTERVAL, stop_event=None, log_callback=None, **options):
+        """
+        interval초마다 원본이 바뀐 테이블만 골라 변환합니다 (자동 새로 고침). stop_event가 설정되면 끝냅니다.
+        
+        Args:
+            interval (float): 원본을 확인하는 주기(초)
+            stop_event (threading.Event): 설정되면 다음 확인 전에 종료
+            log_callback (function): 로그 메시지를 처리할 콜백 함수
+            options: convert 옵션 (order, concurrency, excel_to_sqlite 옵션)
+        """
+        log = log_callback or print
+        stop_event = stop_event or threading.Event()
+        log(f"{interval:g}초마다 바뀐 원본을 확인합니다.")
+        while not stop_event.is_set():
+            if self.plan(stale_only=True, order=options.get('order', 'stale'), options=options):
+                try:
+                    self.convert(stale_only=True, log_callback=log, **options)
+                except PermissionError as e:
+                    # 교체하지 못한 테이블은 manifest가 그대로이므로 다음 확인 때 다시 변환됨
+                    log(str(e))
+            stop_event.wait(interval)
+
+
+def conversion_option_overrides(args, tables):
+    # 명령행에서 지정한 변환 옵션 (원본 리더는 모든 테이블 설정에 반영)
+    options = {}
+    for name in ('batch_size', 'commit_every', 'workers', 'incremental', 'row_diff', 'infer_types', 'bulk_load',
+                 'search_index', 'interface_view'):
+        if getattr(args, name) is not None:
+            options[name] = getattr(args, name)
+    if args.reader:
+        for table_config in tables.values():
+            table_config['reader'] = args.reader
+    return options
+
+
+def run_convert_command(args):
+    # 설정 파일의 옵션에 명령행 옵션을 덮어써 변환 실행
+    config = load_config_file(args.config)
+    options = dict(config['options'], **conversion_option_overrides(args, config['tables']))
+    db_file = args.db or config['db_file'] or DEFAULT_DB_FILE
+    
+    log_callback = (lambda message: None) if args.quiet else (lambda message: print(message, file=sys.stderr))
+    
+    # 지표 이벤트는 JSON Lines 파일로 저장하고, 파일이 없으면 프로파일 보고서만 로그로 출력
+    metrics_file = open(args.metrics_file, 'w', encoding='utf-8') if args.metrics_file else None
+    
+    def metrics_callback(event):
+        if metrics_file:
+            metrics_file.write(json.dumps(event, ensure_ascii=False) + "\n")
+        elif event['event'] == 'profile':
+            print(f"=== [{event['table']}] 프로파일 ===", file=sys.stderr)
+            if 'cprofile_report' in event:
+                print(event['cprofile_report'], file=sys.stderr)
+            if 'peak_memory_bytes' in event:
+                print(f"최대 메모리 {event['peak_memory_bytes'] / 1024 / 1024:.1f}MB", file=sys.stderr)
+                for line in event['top_allocations']:
+                    print(f"  {line}", file=sys.stderr)
+    
+    try:
+        excel_to_sqlite(config['tables'], db_file, log_callback,
+                        metrics_callback=metrics_callback if metrics_file or args.cprofile or args.trace_memory else None,
+                        cprofile=args.cprofile, trace_memory=args.trace_memory, **options)
+    finally:
+        if metrics_file:
+            metrics_file.close()
+    
+    # 변환이 끝나면 배포용 스냅샷으로 내보냄
+    if args.snapshot:
+        from mgui2_snapshot import export_snapshot
+        export_snapshot(db_file, args.snapshot, args.snapshot_format, log_callback=log_callback)
+    return 0
+
+
+def run_refresh_command(args):
+    # 작업공간의 테이블을 골라 우선순위 순서로 변환하고, --watch이면 주기적으로 바뀐 테이블만 변환
+    workspace = Workspace.load(args.config)
+    if args.db:
+        workspace.db_file = args.db
+    options = conversion_option_overrides(args, workspace.tables)
+    log_callback = (lambda message: None) if args.quiet else (lambda message: print(message, file=sys.stderr))
+    try:
+        if args.watch:
+            workspace.watch(args.watch, log_callback=log_callback, order=args.order, **options)
+        else:
+            workspace.convert(args.table, args.stale_only, args.order, log_callback=log_callback, **options)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def run_status_command(args):
+    # 작업공간 테이블별 원본 상태를 JSON으로 출력
+    workspace = Workspace.load(args.config)
+    if args.db:
+        workspace.db_file = args.db
+    unknown = [table_name for table_name in args.table or [] if table_name not in workspace.tables]
+    if unknown:
+        print(f"작업공간에 없는 테이블입니다: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    json.dump(workspace.table_status(args.table), sys.stdout, ensure_ascii=False, indent=2)
+    print()
+    return 0
+
+
+def run_lookup_command(args):
+    # 매핑SEQ를 조회해 JSON으로 출력
+    mapping_seqs = list(args.mapping_seqs)
+    if args.file:
+        with open(args.file, encoding='utf-8-sig', errors='replace') as f:
+            mapping_seqs += parse_mapping_seqs(f.read())
+    mapping_seqs = parse_mapping_seqs("\n".join(mapping_seqs))
+    if not mapping_seqs:
+        print("조회할 매핑SEQ를 지정하세요.", file=sys.stderr)
+        return 2
+    if not os.path.exists(args.db):
+        print(f"데이터베이스 파일({args.db})이 존재하지 않습니다. 먼저 변환을 실행하세요.", file=sys.stderr)
+        return 2
+    
+    conn = connect_read_only(args.db)
+    try:
+        schema = load_resolved_schema(conn.cursor())
+        if not schema.column('book2', 'mapping_seq'):
+            print("book2 테이블 또는 매핑SEQ 컬럼이 존재하지 않습니다.", file=sys.stderr)
+            return 2
+        records = lookup_mapping_seqs(conn, schema, mapping_seqs)
+    finally:
+        conn.close()
+    
+    json.dump(records, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+    return 0
+
+
+def run_search_command(args):
+    # 검색어로 인터페이스를 찾아 JSON으로 출력
+    if not os.path.exists(args.db):
+        print(f"데이터베이스 파일({args.db})이 존재하지 않습니다. 먼저 변환을 실행하세요.", file=sys.stderr)
+        return 2
+    
+    conn = connect_read_only(args.db)
+    try:
+        if search_index_tokenizer(conn) is None:
+            print("검색 인덱스가 없습니다. 검색 인덱스를 만들도록 다시 변환하세요.", file=sys.stderr)
+            return 2
+        results = search_interfaces(conn, " ".join(args.query), args.limit)
+    finally:
+        conn.close()
+    
+    json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+    return 0
+
+
+def run_check_readers_command(args):
+    # 설정 파일의 테이블마다 두 리더가 같은 행을 읽는지 비교
+    config = load_config_file(args.config)
+    tables = {name: table_config for name, table_config in config['tables'].items()
+              if not args.table or name in args.table}
+    backends = tuple(args.backends.split(','))
+    if len(backends) != 2 or any(backend not in SHEET_READERS for backend in backends):
+        print(f"비교할 리더 두 개를 쉼표로 지정하세요 (사용 가능: {', '.join(SHEET_READERS)})", file=sys.stderr)
+        return 2
+    
+    mismatched = False
+    for table_name, table_config in tables.items():
         try:
-            # 변환 실행
-            success = excel_to_sqlite(self.excel_configs, self.db_file, self.log)
-            
-            if success:
-                messagebox.showinfo("완료", f"변환이 완료되었습니다.\n데이터베이스 파일: {self.db_file}")
-            
+            result = compare_sheet_readers(table_config, backends)
         except Exception as e:
-            self.log(f"오류 발생: {e}")
-            messagebox.showerror("오류", f"변환 중 오류가 발생했습니다: {e}")
-        
-        finally:
-            self.convert_btn.config(state=tk.NORMAL)
+            print(f"[{table_name}] 비교 실패: {e}", file=sys.stderr)
+            return 2
+        if not result['difference_count']:
+            print(f"[{table_name}] 일치: {result['rows']}행 ({' = '.join(backends)})")
+            continue
+        mismatched = True
+        print(f"[{table_name}] 불일치: {result['rows']}행 중 {result['difference_count']}행 ({' != '.join(backends)})")
+        for row_number, first, second in result['differences']:
+            print(f"  {row_number}행\n    {backends[0]}: {first!r}\n    {backends[1]}: {second!r}")
+    return 1 if mismatched else 0
+
+
+def run_serve_command(args):
+    # 조회 서비스는 asyncio 서버 모듈에 있으므로 serve 명령일 때만 불러옴
+    from mgui2_server import DEFAULT_CACHE_SIZE, DEFAULT_HOST, DEFAULT_POOL_SIZE, DEFAULT_PORT, run_server
+    if not os.path.exists(args.db):
+        print(f"데이터베이스 파일({args.db})이 존재하지 않습니다. 먼저 변환을 실행하세요.", file=sys.stderr)
+        return 2
+    run_server(args.db, args.host or DEFAULT_HOST, args.port or DEFAULT_PORT,
+               DEFAULT_POOL_SIZE if args.pool_size is None else args.pool_size,
+               DEFAULT_CACHE_SIZE if args.cache_size is None else args.cache_size)
+    return 0
+
+
+def run_export_command(args):
+    # 스냅샷 모듈은 export/import 명령일 때만 불러옴 (pyarrow, zstandard를 선택적으로 사용)
+    from mgui2_snapshot import export_snapshot
+    if not os.path.exists(args.db):
+        print(f"데이터베이스 파일({args.db})이 존재하지 않습니다. 먼저 변환을 실행하세요.", file=sys.stderr)
+        return 2
+    log_callback = (lambda message: None) if args.quiet else (lambda message: print(message, file=sys.stderr))
+    try:
+        export_snapshot(args.db, args.output, args.format, log_callback=log_callback)
+    except (ValueError, RuntimeError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    return 0
+
+
+def run_import_command(args):
+    # 스냅샷에서 데이터베이스를 다시 만듦 (엑셀을 다시 파싱하지 않음)
+    from mgui2_snapshot import SNAPSHOT_META_FILE, import_snapshot
+    if not os.path.exists(os.path.join(args.snapshot, SNAPSHOT_META_FILE)):
+        print(f"스냅샷 디렉터리({args.snapshot})에 {SNAPSHOT_META_FILE}이 없습니다.", file=sys.stderr)
+        return 2
+    log_callback = (lambda message: None) if args.quiet else (lambda message: print(message, file=sys.stderr))
+    try:
+        import_snapshot(args.snapshot, args.db, log_callback=log_callback)
+    except (ValueError, RuntimeError, PermissionError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    return 0
+
+
+def positive_int(text):
+    # 1 이상이어야 하는 정수 옵션의 argparse 타입 (0 이하는 사용법 오류로 알림)
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return value
+
+
+def add_conversion_arguments(parser):
+    # convert, refresh 명령이 함께 쓰는 변환 옵션 (지정하지 않으면 설정 파일의 options를 따름)
+    parser.add_argument('--batch-size', type=positive_int, help="executemany 한 번에 삽입할 행 수")
+    parser.add_argument('--commit-every', type=int, help="N개 배치마다 커밋")
+    parser.add_argument('--workers', type=int, help="병렬 파싱 워커 프로세스 수 (refresh에서는 한 차례에 변환할 테이블 수)")
+    parser.add_argument('--incremental', action=argparse.BooleanOptionalAction, help="바뀌지 않은 원본은 건너뜀")
+    parser.add_argument('--row-diff', action=argparse.BooleanOptionalAction, help="바뀐 행만 반영")
+    parser.add_argument('--infer-types', action=argparse.BooleanOptionalAction, help="컬럼 타입 추론")
+    parser.add_argument('--bulk-load', action=argparse.BooleanOptionalAction, help="작업 파일에 대량 적재 후 교체")
+    parser.add_argument('--search-index', action=argparse.BooleanOptionalAction, help="인터페이스 전문 검색 인덱스 생성")
+    parser.add_argument('--interface-view', action=argparse.BooleanOptionalAction,
+                        help="매핑SEQ별 상세 정보 테이블 생성")
+    parser.add_argument('--reader', choices=['auto', *SHEET_READERS],
+                        help="모든 테이블에 사용할 원본 리더 (기본값: 테이블 설정의 reader 또는 auto)")
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="mgui2", description="엑셀 매핑 정보를 SQLite로 변환하고 매핑SEQ를 조회합니다. "
+                                                               "명령 없이 실행하면 GUI를 엽니다.")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    convert_parser = subparsers.add_parser('convert', help="설정 파일의 엑셀 파일을 SQLite로 변환")
+    convert_parser.add_argument('--config', required=True, help="변환 설정 파일 (JSON 또는 TOML)")
+    convert_parser.add_argument('--db', help=f"데이터베이스 파일 (기본값: 설정 파일의 db_file 또는 {DEFAULT_DB_FILE})")
+    add_conversion_arguments(convert_parser)
+    convert_parser.add_argument('--metrics-file', help="테이블별 지표 이벤트를 저장할 JSON Lines 파일")
+    convert_parser.add_argument('--cprofile', action='store_true', help="테이블별 cProfile 프로파일 수집")
+    convert_parser.add_argument('--trace-memory', action='store_true', help="테이블별 tracemalloc 메모리 사용량 수집")
+    convert_parser.add_argument('--snapshot', metavar='DIR', help="변환 후 데이터베이스를 내보낼 스냅샷 디렉터리")
+    convert_parser.add_argument('--snapshot-format', choices=SNAPSHOT_FORMATS, default='auto',
+                                help="스냅샷 형식 (기본값: auto, pyarrow가 있으면 parquet 아니면 columns)")
+    convert_parser.add_argument('--quiet', action='store_true', help="진행 로그를 출력하지 않음")
+    convert_parser.set_defaults(handler=run_convert_command)
+    
+    lookup_parser = subparsers.add_parser('lookup', help="매핑SEQ를 조회해 JSON으로 출력")
+    lookup_parser.add_argument('mapping_seqs', nargs='*', metavar='매핑SEQ', help="조회할 매핑SEQ")
+    lookup_parser.add_argument('--file', help="매핑SEQ 목록 파일")
+    lookup_parser.add_argument('--db', default=DEFAULT_DB_FILE, help=f"데이터베이스 파일 (기본값: {DEFAULT_DB_FILE})")
+    lookup_parser.set_defaults(handler=run_lookup_command)
+    
+    search_parser = subparsers.add_parser('search', help="인터페이스 명, QMGR 명, 업무명 등의 일부로 검색")
+    search_parser.add_argument('query', nargs='+', help="검색어 (공백으로 나눈 검색어를 모두 포함하는 결과)")
+    search_parser.add_argument('--limit', type=int, default=SEARCH_RESULT_LIMIT, help=f"최대 결과 수 (기본값: {SEARCH_RESULT_LIMIT})")
+    search_parser.add_argument('--db', default=DEFAULT_DB_FILE, help=f"데이터베이스 파일 (기본값: {DEFAULT_DB_FILE})")
+    search_parser.set_defaults(handler=run_search_command)
+    
+    refresh_parser = subparsers.add_parser('refresh', help="작업공간의 테이블을 골라 우선순위 순서로 변환")
+    refresh_parser.add_argument('--config', required=True, help="작업공간 설정 파일 (JSON 또는 TOML)")
+    refresh_parser.add_argument('--db', help=f"데이터베이스 파일 (기본값: 설정 파일의 db_file 또는 {DEFAULT_DB_FILE})")
+    refresh_parser.add_argument('--table', action='append', help="변환할 테이블 (여러 번 지정 가능, 기본값: 전체)")
+    refresh_parser.add_argument('--stale-only', action='store_true', help="원본이 바뀌었거나 변환 기록이 없는 테이블만 변환")
+    refresh_parser.add_argument('--order', choices=SCHEDULE_ORDERS, default='stale',
+                                help="같은 우선순위 안에서의 순서: 오래된 순서(stale) 또는 작은 순서(size)")
+    refresh_parser.add_argument('--watch', type=float, metavar='초',
+                                help="지정한 주기마다 바뀐 테이블만 변환 (Ctrl+C로 종료)")
+    add_conversion_arguments(refresh_parser)
+    refresh_parser.add_argument('--quiet', action='store_true', help="진행 로그를 출력하지 않음")
+    refresh_parser.set_defaults(handler=run_refresh_command)
+    
+    status_parser = subparsers.add_parser('status', help="작업공간 테이블별 원본 상태(변환 필요 여부)를 JSON으로 출력")
+    status_parser.add_argument('--config', required=True, help="작업공간 설정 파일 (JSON 또는 TOML)")
+    status_parser.add_argument('--db', help=f"데이터베이스 파일 (기본값: 설정 파일의 db_file 또는 {DEFAULT_DB_FILE})")
+    status_parser.add_argument('--table', action='append', help="확인할 테이블 (여러 번 지정 가능, 기본값: 전체)")
+    status_parser.set_defaults(handler=run_status_command)
+    
+    check_parser = subparsers.add_parser('check-readers', help="두 원본 리더가 같은 행을 읽는지 비교")
+    check_parser.add_argument('--config', required=True, help="변환 설정 파일 (JSON 또는 TOML)")
+    check_parser.add_argument('--table', action='append', help="비교할 테이블 (여러 번 지정 가능, 기본값: 전체)")
+    check_parser.add_argument('--backends', default="openpyxl,xlsx", help="비교할 리더 두 개 (기본값: openpyxl,xlsx)")
+    check_parser.set_defaults(handler=run_check_readers_command)
+    
+    export_parser = subparsers.add_parser('export', help="데이터베이스를 압축한 열 단위 스냅샷 디렉터리로 내보냄")
+    export_parser.add_argument('--db', default=DEFAULT_DB_FILE, help=f"데이터베이스 파일 (기본값: {DEFAULT_DB_FILE})")
+    export_parser.add_argument('--output', required=True, metavar='DIR', help="스냅샷 디렉터리 (있으면 교체)")
+    export_parser.add_argument('--format', choices=SNAPSHOT_FORMATS, default='auto',
+                               help="스냅샷 형식 (기본값: auto, pyarrow가 있으면 parquet 아니면 columns)")
+    export_parser.add_argument('--quiet', action='store_true', help="진행 로그를 출력하지 않음")
+    export_parser.set_defaults(handler=run_export_command)
+    
+    import_parser = subparsers.add_parser('import', help="스냅샷 디렉터리에서 데이터베이스를 다시 만듦")
+    import_parser.add_argument('--snapshot', required=True, metavar='DIR', help="export로 만든 스냅샷 디렉터리")
+    import_parser.add_argument('--db', default=DEFAULT_DB_FILE, help=f"만들 데이터베이스 파일 (기본값: {DEFAULT_DB_FILE})")
+    import_parser.add_argument('--quiet', action='store_true', help="진행 로그를 출력하지 않음")
+    import_parser.set_defaults(handler=run_import_command)
+    
+    serve_parser = subparsers.add_parser('serve', help="매핑SEQ 조회 HTTP 서비스 실행 (GET /mapping/{매핑SEQ})")
+    serve_parser.add_argument('--db', default=DEFAULT_DB_FILE, help=f"데이터베이스 파일 (기본값: {DEFAULT_DB_FILE})")
+    # 지정하지 않은 값은 조회 서비스 모듈의 기본값을 사용 (asyncio를 불러오지 않도록 serve 실행 시에만 확인)
+    serve_parser.add_argument('--host', help="바인드 주소 (기본값: 조회 서비스 기본 주소)")
+    serve_parser.add_argument('--port', type=int, help="포트 (기본값: 조회 서비스 기본 포트)")
+    serve_parser.add_argument('--pool-size', type=positive_int, help="읽기 전용 연결 수 (기본값: 조회 서비스 기본값)")
+    serve_parser.add_argument('--cache-size', type=int, help="결과 캐시에 보관할 매핑SEQ 수 (기본값: 조회 서비스 기본값)")
+    serve_parser.set_defaults(handler=run_serve_command)
+    
+    gui_parser = subparsers.add_parser('gui', help="GUI 실행")
+    gui_parser.set_defaults(handler=None)
+    return parser
+
+
+def main(argv=None):
+    """
+    명령행 진입점입니다. convert, lookup 명령은 tkinter를 불러오지 않으므로 화면이 없는 서버에서도
+    실행할 수 있습니다. 명령 없이 실행하거나 gui 명령이면 GUI를 엽니다.
+    """
+    args = build_arg_parser().parse_args(argv)
+    if getattr(args, 'handler', None) is None:
+        # GUI를 실행할 때만 tkinter를 불러옴
+        from mgui2_gui import run_gui
+        run_gui()
+        return 0
+    return args.handler(args)
 
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = ExcelToSqliteApp(root)
-    root.mainloop()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,383 @@
+import os
+import sys
+import json
+import math
+import time
+import random
+import sqlite3
+import argparse
+import datetime
+import platform
+import tracemalloc
+
+import openpyxl
+
+from mgui2 import (
+    SHEET_READERS,
+    connect_read_only,
+    excel_to_sqlite,
+    load_resolved_schema,
+    lookup_interface,
+    search_index_tokenizer,
+    search_interfaces,
+)
+
+# 기본 벤치마크 크기 (워크북당 데이터 행 수)
+DEFAULT_SIZES = [10000, 100000, 1000000]
+
+# 인터페이스 컬럼 외에 덧붙이는 부가 컬럼 수
+DEFAULT_EXTRA_COLUMNS = 8
+
+# 조회 지연 시간을 재는 매핑SEQ 수와 그중 없는 매핑SEQ의 비율
+DEFAULT_LOOKUP_SAMPLES = 2000
+LOOKUP_MISS_RATIO = 0.1
+
+# 인터페이스 검색 지연 시간을 재는 검색어
+SEARCH_QUERIES = ["주문", "QM1", "인터페이스 12", "배송 QMR", "T9", "EV100"]
+
+# 기준 결과보다 이 비율 이상 나빠지면 성능 저하로 표시
+DEFAULT_TOLERANCE = 0.10
+
+# 기준 결과와 비교하는 지표 (결과 내 경로, 표시 이름)
+COMPARED_METRICS = [
+    (('convert', 'total_s'), "변환 시간(초)"),
+    (('lookup', 'p50_ms'), "조회 p50(ms)"),
+    (('lookup', 'p99_ms'), "조회 p99(ms)"),
+    (('search', 'p50_ms'), "검색 p50(ms)"),
+    (('peak_memory_mb',), "최대 메모리(MB)"),
+]
+
+# book1/book2 형태의 헤더 (중복 헤더 포함). book2는 첫 행이 제목이고 두 번째 행이 헤더
+BOOK1_HEADERS = ["매핑SEQ", "인터페이스 명", "I_F_Type", "Route 정의", "비고", "비고"]
+BOOK2_HEADERS = [
+    "매핑 SEQ", "GroupID", "EventID",
+    "송신 업무명", "송신 QMGR", "송신 userid", "송신 passwd", "송신 DB", "송신 schema adapter", "송신 table adapter",
+    "수신 업무명", "수신 QMGR", "수신 userid", "수신 passwd", "수신 DB", "수신 schema adapter", "수신 table adapter",
+    "비고", "비고",
+]
+
+# 부가 컬럼 헤더 (개수가 많으면 반복되어 중복 헤더가 됨)
+EXTRA_HEADERS = ["담당자", "등록일", "처리 건수", "설명", "비고", "사용 여부", "수정일", "Remark"]
+
+TASK_NAMES = ["주문", "배송", "정산", "재고", "회원", "결제", "물류", "상품"]
+
+
+def synthetic_row(kind, seq, extra_columns, rng):
+    """book1 또는 book2 형태의 데이터 행 하나를 만듭니다."""
+    if kind == 'book1':
+        row = [seq, f"{rng.choice(TASK_NAMES)} 인터페이스 {seq}", rng.choice(["EAI", "FEP", "MCI", "BATCH"]),
+               f"ROUTE_{seq % 97}", None, "" if seq % 3 else "확인 필요"]
+    else:
+        send_task, recv_task = rng.sample(TASK_NAMES, 2)
+        row = [seq, f"GRP{seq % 50:03d}", f"EV{seq}",
+               send_task, f"QM{seq % 7}", f"user{seq % 11}", "passwd", f"ORA{seq % 5}", f"S{seq % 13}", f"T{seq}",
+               recv_task, f"QMR{seq % 5}", f"ruser{seq % 9}", "rpasswd", f"RDB{seq % 4}", f"RS{seq % 7}", f"RT{seq}",
+               None, "" if seq % 5 else "비고"]
+    
+    # 부가 컬럼은 문자열, 정수, 날짜, 빈 값을 섞어 채움
+    for idx in range(extra_columns):
+        kind_of_value = (seq + idx) % 4
+        if kind_of_value == 0:
+            row.append(f"{rng.choice(TASK_NAMES)}팀 담당자{seq % 100}")
+        elif kind_of_value == 1:
+            row.append(rng.randint(0, 100000))
+        elif kind_of_value == 2:
+            row.append(datetime.datetime(2024, 1, 1) + datetime.timedelta(days=seq % 700))
+        else:
+            row.append(None)
+    return row
+
+
+def generate_workbook(path, kind, rows, extra_columns, seed=0):
+    """
+    book1 또는 book2 형태의 합성 엑셀 파일을 만듭니다.
+    
+    openpyxl의 write_only 모드로 행을 바로 기록하므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+    
+    Args:
+        path (str): 만들 .xlsx 파일 경로
+        kind (str): 'book1' 또는 'book2'
+        rows (int): 데이터 행 수
+        extra_columns (int): 부가 컬럼 수 (한국어 헤더, 중복 헤더 포함)
+        seed (int): 난수 시드 (같은 값이면 같은 파일)
+    """
+    rng = random.Random(seed)
+    headers = list(BOOK1_HEADERS if kind == 'book1' else BOOK2_HEADERS)
+    headers += [EXTRA_HEADERS[idx % len(EXTRA_HEADERS)] for idx in range(extra_columns)]
+    
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    if kind == 'book2':
+        sheet.append(["인터페이스 매핑 정의서"])
+    sheet.append(headers)
+    for seq in range(1, rows + 1):
+        sheet.append(synthetic_row(kind, seq, extra_columns, rng))
+    workbook.save(path)
+
+
+def prepare_workbooks(work_dir, rows, extra_columns, log, reader='auto'):
+    """
+    크기별 합성 워크북을 준비합니다. 같은 크기의 파일이 이미 있으면 다시 만들지 않습니다.
+    
+    Returns:
+        dict: excel_to_sqlite에 전달할 엑셀 설정
+    """
+    os.makedirs(work_dir, exist_ok=True)
+    configs = {}
+    for kind, header_row in (('book1', 1), ('book2', 2)):
+        path = os.path.join(work_dir, f"bench_{kind}_{rows}_{extra_columns}.xlsx")
+        if not os.path.exists(path):
+            log(f"합성 워크북 생성: {path}")
+            started = time.perf_counter()
+            generate_workbook(path + ".tmp", kind, rows, extra_columns)
+            os.replace(path + ".tmp", path)
+            log(f"  {time.perf_counter() - started:.1f}초")
+        configs[kind] = {'path': path, 'sheet_name': "Sheet1", 'header_row': header_row, 'reader': reader}
+    return configs
+
+
+def percentile(sorted_values, fraction):
+    """정렬된 값에서 백분위수(nearest-rank)를 구합니다."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_summary(durations_ns):
+    durations = sorted(durations_ns)
+    return {
+        'count': len(durations),
+        'p50_ms': round(percentile(durations, 0.50) / 1e6, 4),
+        'p99_ms': round(percentile(durations, 0.99) / 1e6, 4),
+        'max_ms': round(durations[-1] / 1e6, 4),
+    }
+
+
+def remove_database(db_file):
+    for path in (db_file, f"{db_file}.building", f"{db_file}-journal"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def measure_conversion(configs, db_file, options):
+    """빈 데이터베이스로 변환을 한 번 실행해 전체 시간과 단계별 시간을 잽니다."""
+    remove_database(db_file)
+    phase_times = {}
+    started = time.perf_counter()
+    excel_to_sqlite(configs, db_file, log_callback=lambda message: None, phase_times=phase_times, **options)
+    total = time.perf_counter() - started
+    
+    conn = sqlite3.connect(db_file)
+    try:
+        rows = sum(conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0] for table_name in configs)
+    finally:
+        conn.close()
+    return {
+        'total_s': round(total, 4),
+        'rows': rows,
+        'rows_per_s': round(rows / total) if total else None,
+        'phases': {phase: round(seconds, 4) for phase, seconds in phase_times.items()},
+        'db_size_mb': round(os.path.getsize(db_file) / 1024 / 1024, 2),
+    }
+
+
+def measure_peak_memory(configs, db_file, options):
+    """
+    tracemalloc으로 변환 중 파이썬 메모리 최대 사용량(MB)을 잽니다.
+    
+    추적 비용 때문에 시간 측정과는 따로 한 번 더 변환합니다. 병렬 변환의 워커 프로세스는 포함되지 않습니다.
+    """
+    remove_database(db_file)
+    tracemalloc.start()
+    try:
+        excel_to_sqlite(configs, db_file, log_callback=lambda message: None, **options)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024 / 1024, 2)
+
+
+def measure_lookups(db_file, rows, samples, seed=0):
+    """임의의 매핑SEQ(일부는 없는 값)로 lookup_interface 지연 시간을 잽니다."""
+    rng = random.Random(seed)
+    mapping_seqs = [str(rows + idx + 1) if rng.random() < LOOKUP_MISS_RATIO else str(rng.randint(1, rows))
+                    for idx in range(samples)]
+    
+    conn = connect_read_only(db_file)
+    try:
+        schema = load_resolved_schema(conn.cursor())
+        lookup_interface(conn, schema, mapping_seqs[0])  # 준비된 문장 캐시 준비
+        durations = []
+        found = 0
+        for mapping_seq in mapping_seqs:
+            started = time.perf_counter_ns()
+            record = lookup_interface(conn, schema, mapping_seq)
+            durations.append(time.perf_counter_ns() - started)
+            found += record is not None
+        
+        summary = latency_summary(durations)
+        summary['found'] = found
+        summary['interface_view'] = schema.interface_view
+        return summary
+    finally:
+        conn.close()
+
+
+def measure_searches(db_file, repeat=5):
+    """SEARCH_QUERIES로 search_interfaces 지연 시간을 잽니다. 검색 인덱스가 없으면 None."""
+    conn = connect_read_only(db_file)
+    try:
+        tokenizer = search_index_tokenizer(conn)
+        if tokenizer is None:
+            return None
+        durations = []
+        for _ in range(repeat):
+            for query in SEARCH_QUERIES:
+                started = time.perf_counter_ns()
+                search_interfaces(conn, query)
+                durations.append(time.perf_counter_ns() - started)
+        summary = latency_summary(durations)
+        summary['tokenizer'] = tokenizer
+        return summary
+    finally:
+        conn.close()
+
+
+def metric_value(run, path):
+    value = run
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare_with_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    같은 크기의 실행끼리 지표를 비교합니다.
+    
+    Returns:
+        tuple: (비교 결과 줄 목록, 성능 저하 여부)
+    """
+    baseline_runs = {run['rows']: run for run in baseline.get('runs', [])}
+    lines = []
+    if (baseline.get('options') != results['options'] or baseline.get('extra_columns') != results['extra_columns']
+            or baseline.get('reader', 'auto') != results['reader']):
+        lines.append(f"주의: 변환 옵션이 기준 결과와 다릅니다 (기준 {baseline.get('options')}, "
+                     f"부가 컬럼 {baseline.get('extra_columns')}, 리더 {baseline.get('reader', 'auto')})")
+    regressed = False
+    for run in results['runs']:
+        base_run = baseline_runs.get(run['rows'])
+        if base_run is None:
+            lines.append(f"{run['rows']:,}행: 기준 결과 없음")
+            continue
+        for path, title in COMPARED_METRICS:
+            current, previous = metric_value(run, path), metric_value(base_run, path)
+            if current is None or not previous:
+                continue
+            ratio = current / previous
+            mark = ""
+            if ratio > 1 + tolerance:
+                mark = "  << 느려짐"
+                regressed = True
+            elif ratio < 1 - tolerance:
+                mark = "  (개선)"
+            lines.append(f"{run['rows']:,}행 {title}: {previous} -> {current} ({ratio - 1:+.1%}){mark}")
+    return lines, regressed
+
+
+def run_benchmark(sizes, work_dir, extra_columns, options, lookup_samples, measure_memory=True, log=print,
+                  reader='auto'):
+    """
+    크기별로 합성 워크북을 변환하고 변환/조회/메모리 지표를 측정합니다.
+    
+    Returns:
+        dict: 실행 환경과 크기별 측정 결과 (JSON으로 저장 가능한 형태)
+    """
+    results = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'openpyxl': openpyxl.__version__,
+        'platform': platform.platform(),
+        'extra_columns': extra_columns,
+        'options': options,
+        'reader': reader,
+        'runs': [],
+    }
+    db_file = os.path.join(work_dir, "bench.db")
+    for rows in sizes:
+        configs = prepare_workbooks(work_dir, rows, extra_columns, log, reader)
+        
+        log(f"[{rows:,}행] 변환 측정")
+        run = {'rows': rows, 'convert': measure_conversion(configs, db_file, options)}
+        log(f"  {run['convert']['total_s']}초, {run['convert']['rows_per_s']:,}행/초, 단계 {run['convert']['phases']}")
+        
+        run['lookup'] = measure_lookups(db_file, rows, lookup_samples)
+        log(f"  조회 p50 {run['lookup']['p50_ms']}ms, p99 {run['lookup']['p99_ms']}ms")
+        
+        run['search'] = measure_searches(db_file)
+        if run['search']:
+            log(f"  검색 p50 {run['search']['p50_ms']}ms, p99 {run['search']['p99_ms']}ms")
+        
+        if measure_memory:
+            log(f"[{rows:,}행] 메모리 측정")
+            run['peak_memory_mb'] = measure_peak_memory(configs, db_file, options)
+            log(f"  최대 {run['peak_memory_mb']}MB")
+        
+        results['runs'].append(run)
+    remove_database(db_file)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 워크북으로 엑셀 변환과 매핑SEQ 조회 성능을 측정합니다.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="워크북당 데이터 행 수 목록")
+    parser.add_argument('--extra-columns', type=int, default=DEFAULT_EXTRA_COLUMNS, help="부가 컬럼 수")
+    parser.add_argument('--work-dir', default="bench_data", help="합성 워크북과 데이터베이스를 둘 디렉터리")
+    parser.add_argument('--output', default="bench_results.json", help="결과 JSON 파일")
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON 파일")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help="성능 저하로 볼 비율 (기본값: 0.10)")
+    parser.add_argument('--fail-on-regression', action='store_true', help="성능 저하가 있으면 종료 코드 1")
+    parser.add_argument('--lookup-samples', type=int, default=DEFAULT_LOOKUP_SAMPLES, help="조회 측정 횟수")
+    parser.add_argument('--memory', action=argparse.BooleanOptionalAction, default=True, help="메모리 최대 사용량 측정")
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--infer-types', action=argparse.BooleanOptionalAction, default=False)
+    parser.add_argument('--bulk-load', action=argparse.BooleanOptionalAction, default=False)
+    parser.add_argument('--search-index', action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument('--interface-view', action=argparse.BooleanOptionalAction, default=False)
+    parser.add_argument('--reader', choices=['auto', *SHEET_READERS], default='auto', help="원본 리더 (기본값: auto)")
+    args = parser.parse_args(argv)
+    
+    options = {
+        'batch_size': args.batch_size,
+        'workers': args.workers,
+        'infer_types': args.infer_types,
+        'bulk_load': args.bulk_load,
+        'search_index': args.search_index,
+        'interface_view': args.interface_view,
+    }
+    log = lambda message: print(message, file=sys.stderr)
+    results = run_benchmark(args.sizes, args.work_dir, args.extra_columns, options, args.lookup_samples,
+                            args.memory, log, args.reader)
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    log(f"결과를 '{args.output}'에 저장했습니다.")
+    
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        lines, regressed = compare_with_baseline(results, baseline, args.tolerance)
+        print(f"기준 결과 '{args.baseline}'과 비교:")
+        for line in lines:
+            print(f"  {line}")
+        if regressed and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
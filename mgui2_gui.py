@@ -0,0 +1,637 @@
+import os
+import csv
+import time
+import queue
+import threading
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from tkinter.scrolledtext import ScrolledText
+
+from mgui2 import (
+    DEFAULT_DB_FILE,
+    DEFAULT_REFRESH_INTERVAL,
+    INTERFACE_SUMMARY_FIELDS,
+    SCHEDULE_ORDERS,
+    ConversionCancelled,
+    Workspace,
+    connect_read_only,
+    format_interface_text,
+    load_resolved_schema,
+    lookup_interface,
+    lookup_mapping_seqs,
+    parse_mapping_seqs,
+    search_index_tokenizer,
+    search_interfaces,
+)
+
+# 화면이 로그/진행 이벤트 큐를 확인하는 주기(ms)와 한 번에 표시할 최대 로그 수
+UI_POLL_INTERVAL_MS = 100
+LOG_MESSAGES_PER_POLL = 500
+
+# 로그 창에 남겨 둘 최대 줄 수
+LOG_MAX_LINES = 5000
+
+# 인터페이스 검색창 입력이 멈춘 뒤 검색을 실행하기까지 기다리는 시간(ms)
+SEARCH_DEBOUNCE_MS = 250
+
+# 작업공간 테이블 표의 컬럼 (필드, 제목, 너비)
+WORKSPACE_TABLE_COLUMNS = [
+    ('table', "테이블", 120),
+    ('priority', "우선순위", 60),
+    ('reason', "상태", 100),
+    ('size', "원본 크기", 90),
+    ('converted_at', "마지막 변환", 140),
+]
+
+# 인터페이스 검색 결과 표의 컬럼 (필드, 제목, 너비)
+SEARCH_RESULT_COLUMNS = [
+    ('mapping_seq', "매핑SEQ", 80),
+    ('interface_name', "인터페이스 명", 220),
+    ('send_task', "송신_업무명", 100),
+    ('send_qmgr', "송신_QMGR명", 100),
+    ('recv_task', "수신_업무명", 100),
+    ('recv_qmgr', "수신_QMGR명", 100),
+]
+
+
+class BatchSearchWindow:
+    """여러 매핑SEQ를 한 번에 조회하고 결과를 표로 보여주는 창입니다."""
+    
+    def __init__(self, app):
+        self.app = app
+        self.records = []
+        
+        self.window = tk.Toplevel(app.root)
+        self.window.title("매핑SEQ 일괄 검색")
+        self.window.geometry("1000x550")
+        
+        self.create_widgets()
+    
+    def create_widgets(self):
+        # 입력 영역
+        input_frame = ttk.LabelFrame(self.window, text="매핑SEQ 목록 (줄바꿈, 쉼표, 공백으로 구분)", padding="10")
+        input_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        self.input_text = ScrolledText(input_frame, height=5)
+        self.input_text.pack(fill=tk.X)
+        
+        # 버튼 영역
+        button_frame = ttk.Frame(self.window, padding=(10, 0))
+        button_frame.pack(fill=tk.X)
+        
+        ttk.Button(button_frame, text="파일 열기", command=self.load_file).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="검색", command=self.search).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="CSV 내보내기", command=self.export_csv).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="클립보드 복사", command=self.copy_to_clipboard).pack(side=tk.LEFT, padx=5)
+        
+        self.status_var = tk.StringVar()
+        ttk.Label(button_frame, textvariable=self.status_var).pack(side=tk.LEFT, padx=20)
+        
+        # 결과 표 영역
+        result_frame = ttk.Frame(self.window, padding="10")
+        result_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = [field for field, _ in INTERFACE_SUMMARY_FIELDS]
+        self.tree = ttk.Treeview(result_frame, columns=columns, show="headings")
+        for field, title in INTERFACE_SUMMARY_FIELDS:
+            self.tree.heading(field, text=title)
+            self.tree.column(field, width=100, stretch=True)
+        
+        y_scroll = ttk.Scrollbar(result_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        x_scroll = ttk.Scrollbar(result_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        x_scroll.grid(row=1, column=0, sticky="ew")
+        result_frame.rowconfigure(0, weight=1)
+        result_frame.columnconfigure(0, weight=1)
+        
+        # 행을 더블클릭하면 메인 창에서 상세 검색
+        self.tree.bind("<Double-1>", self.show_detail)
+    
+    def load_file(self):
+        # 매핑SEQ 목록 파일 읽기
+        path = filedialog.askopenfilename(parent=self.window, title="매핑SEQ 목록 파일",
+                                          filetypes=[("텍스트/CSV", "*.txt *.csv *.tsv"), ("모든 파일", "*.*")])
+        if not path:
+            return
+        with open(path, encoding='utf-8-sig', errors='replace') as f:
+            self.input_text.delete(1.0, tk.END)
+            self.input_text.insert(tk.END, f.read())
+    
+    def search(self):
+        mapping_seqs = parse_mapping_seqs(self.input_text.get(1.0, tk.END))
+        if not mapping_seqs:
+            messagebox.showwarning("검색 오류", "매핑SEQ를 입력하세요.", parent=self.window)
+            return
+        if not os.path.exists(self.app.db_file):
+            messagebox.showwarning("검색 오류", f"데이터베이스 파일({self.app.db_file})이 존재하지 않습니다. 먼저 변환을 실행하세요.",
+                                   parent=self.window)
+            return
+        if self.app.convert_thread is not None:
+            # 변환 중에 데이터베이스를 열어 두면 Windows에서 변환 결과로 교체하지 못함
+            messagebox.showwarning("검색 오류", "변환 중에는 검색할 수 없습니다. 변환이 끝난 뒤 다시 검색하세요.",
+                                   parent=self.window)
+            return
+        
+        try:
+            started = time.perf_counter()
+            conn, schema = self.app.get_read_connection()
+            if not schema.column('book2', 'mapping_seq'):
+                messagebox.showwarning("검색 오류", "book2 테이블 또는 매핑SEQ 컬럼이 존재하지 않습니다.", parent=self.window)
+                return
+            self.records = lookup_mapping_seqs(conn, schema, mapping_seqs)
+            lookup_ms = (time.perf_counter() - started) * 1000
+        except Exception as e:
+            self.app.log(f"일괄 검색 중 오류 발생: {e}")
+            messagebox.showerror("검색 오류", f"일괄 검색 중 오류가 발생했습니다: {e}", parent=self.window)
+            return
+        
+        # 결과 표 갱신
+        self.tree.delete(*self.tree.get_children())
+        for record in self.records:
+            self.tree.insert("", tk.END, values=[record.get(field, "") for field, _ in INTERFACE_SUMMARY_FIELDS])
+        
+        found_count = sum(1 for record in self.records if record['status'] == "OK")
+        self.status_var.set(f"{len(self.records)}건 중 {found_count}건 조회 ({lookup_ms:.1f}ms)")
+        self.app.log(f"매핑SEQ {len(self.records)}건 일괄 검색 완료 (조회 {lookup_ms:.1f}ms)")
+    
+    def export_csv(self):
+        if not self.records:
+            messagebox.showwarning("내보내기 오류", "먼저 검색을 실행하세요.", parent=self.window)
+            return
+        path = filedialog.asksaveasfilename(parent=self.window, title="CSV로 내보내기", defaultextension=".csv",
+                                            filetypes=[("CSV", "*.csv")])
+        if not path:
+            return
+        
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8로 저장
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow([title for _, title in INTERFACE_SUMMARY_FIELDS])
+            for record in self.records:
+                writer.writerow([record.get(field, "") for field, _ in INTERFACE_SUMMARY_FIELDS])
+        self.app.log(f"일괄 검색 결과 {len(self.records)}건을 '{path}'에 저장했습니다.")
+    
+    def copy_to_clipboard(self):
+        if not self.records:
+            messagebox.showwarning("복사 오류", "먼저 검색을 실행하세요.", parent=self.window)
+            return
+        
+        # 엑셀에 바로 붙여넣을 수 있도록 탭으로 구분
+        lines = ["\t".join(title for _, title in INTERFACE_SUMMARY_FIELDS)]
+        for record in self.records:
+            lines.append("\t".join(str(record.get(field, "")) for field, _ in INTERFACE_SUMMARY_FIELDS))
+        self.window.clipboard_clear()
+        self.window.clipboard_append("\n".join(lines))
+        self.status_var.set(f"{len(self.records)}건을 클립보드에 복사했습니다.")
+    
+    def show_detail(self, event):
+        selection = self.tree.selection()
+        if not selection:
+            return
+        mapping_seq = self.tree.set(selection[0], 'mapping_seq')
+        self.app.search_var.set(mapping_seq)
+        self.app.search_mapping_seq()
+
+
+class ExcelToSqliteApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Excel to SQLite 변환기")
+        self.root.geometry("800x600")
+        
+        # 기본 설정 (작업공간 설정 파일을 열면 바뀜)
+        self.excel_configs = {}
+        self.db_file = DEFAULT_DB_FILE
+        self.workspace = None
+        self.order_var = tk.StringVar(value=SCHEDULE_ORDERS[0])  # 같은 우선순위 안에서의 변환 순서
+        self.auto_refresh_var = tk.BooleanVar(value=False)  # 바뀐 원본만 주기적으로 변환
+        self.refresh_interval_var = tk.IntVar(value=DEFAULT_REFRESH_INTERVAL)  # 자동 새로 고침 주기(초)
+        self._auto_refresh_after_id = None
+        self._auto_conversion = False  # 진행 중인 변환이 자동 새로 고침인지 여부
+        self.workers_var = tk.IntVar(value=min(2, os.cpu_count() or 1))  # 병렬 변환 워커 수
+        self.incremental_var = tk.BooleanVar(value=True)  # 바뀐 원본만 변환
+        self.row_diff_var = tk.BooleanVar(value=False)  # 바뀐 행만 반영
+        self.infer_types_var = tk.BooleanVar(value=False)  # 컬럼 타입 추론
+        self.bulk_load_var = tk.BooleanVar(value=True)  # 작업 파일에 대량 적재 후 교체
+        self.interface_view_var = tk.BooleanVar(value=True)  # 매핑SEQ별 상세 정보 테이블 생성
+        
+        # 변환 작업 스레드와 화면 사이의 이벤트 큐, 취소 요청
+        self.ui_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.convert_thread = None
+        
+        # 검색용 읽기 전용 연결과 검색 스키마 (데이터베이스 파일이 바뀌면 다시 엶)
+        self._read_conn = None
+        self._read_conn_signature = None
+        self._schema = None
+        self._search_after_id = None  # 예약된 인터페이스 검색 (입력이 이어지면 취소)
+        
+        # UI 구성
+        self.create_widgets()
+        
+        # 기본 설정 로드
+        self.load_default_config()
+        
+        # 변환 작업 스레드가 보낸 로그/완료 이벤트를 주기적으로 처리
+        self.root.after(UI_POLL_INTERVAL_MS, self.process_ui_queue)
+    
+    def create_widgets(self):
+        # 프레임 생성
+        top_frame = ttk.Frame(self.root, padding="10")
+        top_frame.pack(fill=tk.X)
+        
+        search_frame = ttk.LabelFrame(self.root, text="인터페이스 검색 (인터페이스 명, QMGR 명, 업무명, 어댑터 테이블 등)", padding="10")
+        search_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        workspace_frame = ttk.LabelFrame(self.root, text="작업공간 (선택한 테이블만 변환, 선택하지 않으면 전체)", padding="10")
+        workspace_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        config_frame = ttk.LabelFrame(self.root, text="설정", padding="10")
+        config_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        log_frame = ttk.LabelFrame(self.root, text="로그", padding="10")
+        log_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # 상단 버튼 및 검색 UI
+        self.convert_btn = ttk.Button(top_frame, text="엑셀 -> SQLite 변환", command=self.convert)
+        self.convert_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.cancel_btn = ttk.Button(top_frame, text="취소", command=self.cancel_conversion, state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.LEFT)
+        
+        # 병렬 변환 워커 수
+        ttk.Label(top_frame, text="워커:").pack(side=tk.LEFT, padx=(10, 2))
+        ttk.Spinbox(top_frame, from_=1, to=os.cpu_count() or 1, textvariable=self.workers_var, width=3).pack(side=tk.LEFT)
+        
+        # 증분 변환 옵션
+        ttk.Checkbutton(top_frame, text="변경분만", variable=self.incremental_var).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Checkbutton(top_frame, text="행 단위", variable=self.row_diff_var).pack(side=tk.LEFT)
+        ttk.Checkbutton(top_frame, text="타입 추론", variable=self.infer_types_var).pack(side=tk.LEFT)
+        ttk.Checkbutton(top_frame, text="대량 적재", variable=self.bulk_load_var).pack(side=tk.LEFT)
+        ttk.Checkbutton(top_frame, text="상세 테이블", variable=self.interface_view_var).pack(side=tk.LEFT)
+        
+        # 매핑SEQ 검색 UI
+        ttk.Label(top_frame, text="매핑SEQ:").pack(side=tk.LEFT, padx=(20, 5))
+        
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(top_frame, textvariable=self.search_var, width=15)
+        self.search_entry.pack(side=tk.LEFT, padx=5)
+        self.search_entry.bind("<Return>", lambda event: self.search_mapping_seq())
+        
+        self.search_btn = ttk.Button(top_frame, text="Search", command=self.search_mapping_seq)
+        self.search_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.batch_search_btn = ttk.Button(top_frame, text="일괄 검색", command=lambda: BatchSearchWindow(self))
+        self.batch_search_btn.pack(side=tk.LEFT, padx=5)
+        
+        # 입력하는 대로 검색하는 인터페이스 검색 UI
+        self.fuzzy_var = tk.StringVar()
+        self.fuzzy_var.trace_add("write", lambda *args: self.schedule_interface_search())
+        ttk.Entry(search_frame, textvariable=self.fuzzy_var).pack(fill=tk.X)
+        
+        self.search_tree = ttk.Treeview(search_frame, columns=[field for field, _, _ in SEARCH_RESULT_COLUMNS],
+                                        show="headings", height=5)
+        for field, title, width in SEARCH_RESULT_COLUMNS:
+            self.search_tree.heading(field, text=title)
+            self.search_tree.column(field, width=width, stretch=field == 'interface_name')
+        self.search_tree.pack(fill=tk.X, pady=(5, 0))
+        self.search_tree.bind("<<TreeviewSelect>>", self.show_search_result)
+        
+        # 작업공간 UI
+        workspace_buttons = ttk.Frame(workspace_frame)
+        workspace_buttons.pack(fill=tk.X)
+        ttk.Button(workspace_buttons, text="작업공간 열기", command=self.open_workspace).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(workspace_buttons, text="상태 새로 고침", command=self.update_table_status).pack(side=tk.LEFT)
+        ttk.Label(workspace_buttons, text="순서:").pack(side=tk.LEFT, padx=(10, 2))
+        ttk.Combobox(workspace_buttons, textvariable=self.order_var, values=SCHEDULE_ORDERS, state="readonly",
+                     width=6).pack(side=tk.LEFT)
+        ttk.Checkbutton(workspace_buttons, text="자동 새로 고침", variable=self.auto_refresh_var,
+                        command=self.schedule_auto_refresh).pack(side=tk.LEFT, padx=(10, 2))
+        ttk.Spinbox(workspace_buttons, from_=5, to=3600, textvariable=self.refresh_interval_var,
+                    width=5).pack(side=tk.LEFT)
+        ttk.Label(workspace_buttons, text="초").pack(side=tk.LEFT)
+        
+        self.table_tree = ttk.Treeview(workspace_frame, columns=[field for field, _, _ in WORKSPACE_TABLE_COLUMNS],
+                                       show="headings", height=5, selectmode="extended")
+        for field, title, width in WORKSPACE_TABLE_COLUMNS:
+            self.table_tree.heading(field, text=title)
+            self.table_tree.column(field, width=width, stretch=field == 'converted_at')
+        self.table_tree.pack(fill=tk.X, pady=(5, 0))
+        
+        # 설정 표시 영역 - 높이를 2배로 늘림
+        self.config_text = ScrolledText(config_frame, height=20)
+        self.config_text.pack(fill=tk.BOTH, expand=True)
+        
+        # 로그 표시 영역 - 높이를 1/3로 줄임
+        self.log_text = ScrolledText(log_frame, height=5)
+        self.log_text.pack(fill=tk.BOTH, expand=True)
+    
+    def load_default_config(self):
+        # 기본 설정 로드
+        self.excel_configs = { 
+            'book1': {
+                'path': 'C:/work/doc/1.xlsx',
+                'sheet_name': '1',
+                'header_row': 1  # 첫 번째 행이 헤더
+            },
+            'book2': {
+                'path': 'C:/work/doc/2.xlsx',
+                'sheet_name': '1',
+                'header_row': 2  # 두 번째 행이 헤더
+            }
+        }
+        self.workspace = Workspace(self.excel_configs, self.db_file)
+        self.update_config_display()
+        self.update_table_status()
+    
+    def open_workspace(self):
+        # 여러 테이블 설정을 담은 작업공간 설정 파일 열기
+        if self.convert_thread is not None:
+            messagebox.showwarning("작업공간", "변환이 끝난 뒤에 작업공간을 여세요.")
+            return
+        path = filedialog.askopenfilename(title="작업공간 설정 파일",
+                                          filetypes=[("설정 파일", "*.json *.toml"), ("모든 파일", "*.*")])
+        if not path:
+            return
+        try:
+            workspace = Workspace.load(path)
+        except Exception as e:
+            messagebox.showerror("작업공간", f"설정 파일을 읽지 못했습니다: {e}")
+            return
+        
+        self.close_read_connection()
+        self.workspace = workspace
+        self.excel_configs = workspace.tables
+        self.db_file = workspace.db_file
+        self.update_config_display()
+        self.update_table_status()
+        self.log(f"작업공간 '{path}' 열기 완료 (테이블 {len(workspace.tables)}개)")
+    
+    def current_options(self):
+        """
+        화면에서 고른 excel_to_sqlite 옵션을 반환합니다.
+        
+        상태 표시, 자동 새로 고침 계획, 변환이 같은 옵션으로 변환 필요 여부를 판단하도록 함께 사용합니다.
+        """
+        return {
+            'incremental': self.incremental_var.get(),
+            'row_diff': self.row_diff_var.get(),
+            'infer_types': self.infer_types_var.get(),
+            'bulk_load': self.bulk_load_var.get(),
+            'interface_view': self.interface_view_var.get(),
+        }
+    
+    def update_table_status(self):
+        # 테이블별 원본 상태를 표에 표시 (선택은 유지)
+        selected = set(self.table_tree.selection())
+        try:
+            statuses = self.workspace.table_status(options=self.current_options())
+        except Exception as e:
+            self.log(f"작업공간 상태 확인 중 오류 발생: {e}")
+            return
+        self.table_tree.delete(*self.table_tree.get_children())
+        for status in statuses:
+            size = "" if status['size'] is None else f"{status['size'] / 1024:,.0f}KB"
+            values = [status['table'], status['priority'], status['reason'], size, status['converted_at'] or ""]
+            self.table_tree.insert("", tk.END, iid=status['table'], values=values)
+        self.table_tree.selection_set([table_name for table_name in selected if self.table_tree.exists(table_name)])
+    
+    def update_config_display(self):
+        # 설정 정보 표시
+        self.config_text.delete(1.0, tk.END)
+        self.config_text.insert(tk.END, f"데이터베이스 파일: {self.db_file}\n")
+        
+        for table_name, config in self.excel_configs.items():
+            self.config_text.insert(tk.END, f"테이블: {table_name}\n")
+            self.config_text.insert(tk.END, f"  엑셀 파일: {config['path']}\n")
+            self.config_text.insert(tk.END, f"  시트 이름: {config.get('sheet_name', '')}\n")
+            self.config_text.insert(tk.END, f"  헤더 행: {config.get('header_row', 1)}\n")
+    
+    def log(self, message):
+        # 로그 메시지는 큐에 넣고 process_ui_queue에서 모아서 표시 (작업 스레드에서도 호출 가능)
+        self.ui_queue.put(('log', message))
+    
+    def process_ui_queue(self):
+        # 큐에 쌓인 로그를 한 번에 표시해 메시지마다 화면을 다시 그리지 않도록 함
+        messages = []
+        finished = None
+        try:
+            while len(messages) < LOG_MESSAGES_PER_POLL:
+                kind, value = self.ui_queue.get_nowait()
+                if kind == 'log':
+                    messages.append(value)
+                else:
+                    finished = (kind, value)
+                    break
+        except queue.Empty:
+            pass
+        
+        if messages:
+            self.log_text.insert(tk.END, "".join(f"{message}\n" for message in messages))
+            # 오래된 로그는 잘라내 로그 창이 끝없이 커지지 않도록 함
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete(1.0, f"{line_count - LOG_MAX_LINES}.0")
+            self.log_text.see(tk.END)  # 스크롤을 가장 아래로 이동
+        
+        if finished:
+            self.finish_conversion(*finished)
+        
+        self.root.after(UI_POLL_INTERVAL_MS, self.process_ui_queue)
+    
+    def get_read_connection(self):
+        # 검색용 연결과 그 연결로 읽은 검색 스키마를 반환
+        # 연결은 계속 유지하고, 변환으로 데이터베이스 파일이 바뀐 경우에만 다시 엶
+        stat = os.stat(self.db_file)
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if self._read_conn is None or self._read_conn_signature != signature:
+            self.close_read_connection()
+            self._read_conn = connect_read_only(self.db_file)
+            self._schema = load_resolved_schema(self._read_conn.cursor())
+            self._read_conn_signature = signature
+        return self._read_conn, self._schema
+    
+    def close_read_connection(self):
+        # 변환 전에 검색용 연결을 닫아 데이터베이스 파일을 잠그지 않도록 함
+        if self._read_conn is not None:
+            self._read_conn.close()
+        self._read_conn = None
+        self._read_conn_signature = None
+        self._schema = None
+    
+    def search_mapping_seq(self):
+        # 매핑SEQ로 검색하는 함수
+        mapping_seq = self.search_var.get().strip()
+        if not mapping_seq:
+            messagebox.showwarning("검색 오류", "매핑SEQ를 입력하세요.")
+            return
+        if self.convert_thread is not None:
+            # 변환 중에 데이터베이스를 열어 두면 Windows에서 변환 결과로 교체하지 못함
+            messagebox.showwarning("검색 오류", "변환 중에는 검색할 수 없습니다. 변환이 끝난 뒤 다시 검색하세요.")
+            return
+        
+        try:
+            # SQLite 데이터베이스 연결
+            if not os.path.exists(self.db_file):
+                messagebox.showwarning("검색 오류", f"데이터베이스 파일({self.db_file})이 존재하지 않습니다. 먼저 변환을 실행하세요.")
+                return
+            
+            started = time.perf_counter()
+            conn, schema = self.get_read_connection()
+            
+            # book2 테이블 존재 여부 확인
+            if not schema.has_table('book2'):
+                messagebox.showwarning("검색 오류", "book2 테이블이 존재하지 않습니다. 먼저 변환을 실행하세요.")
+                return
+            
+            # 매핑SEQ 컬럼 존재 여부 확인
+            if not schema.column('book2', 'mapping_seq'):
+                messagebox.showwarning("검색 오류", "매핑SEQ 컬럼이 존재하지 않습니다.")
+                return
+            
+            # book2, book1에서 검색 실행
+            record = lookup_interface(conn, schema, mapping_seq)
+            lookup_ms = (time.perf_counter() - started) * 1000
+            
+            if not record:
+                messagebox.showinfo("검색 결과", f"매핑SEQ '{mapping_seq}'에 해당하는 데이터가 없습니다.")
+                return
+            
+            # 결과 표시
+            self.config_text.delete(1.0, tk.END)
+            self.config_text.insert(tk.END, format_interface_text(record))
+            
+            self.log(f"매핑SEQ '{mapping_seq}' 검색 완료 (조회 {lookup_ms:.3f}ms)")
+        
+        except Exception as e:
+            self.log(f"검색 중 오류 발생: {e}")
+            messagebox.showerror("검색 오류", f"검색 중 오류가 발생했습니다: {e}")
+    
+    def schedule_interface_search(self):
+        # 입력할 때마다 검색하지 않고, 입력이 SEARCH_DEBOUNCE_MS 동안 멈추면 한 번만 검색
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.search_interfaces)
+    
+    def search_interfaces(self):
+        # 검색어를 포함하는 인터페이스를 관련도 순으로 표시
+        self._search_after_id = None
+        self.search_tree.delete(*self.search_tree.get_children())
+        query = self.fuzzy_var.get().strip()
+        if not query or not os.path.exists(self.db_file) or self.convert_thread is not None:
+            return
+        
+        try:
+            started = time.perf_counter()
+            conn, _ = self.get_read_connection()
+            if search_index_tokenizer(conn) is None:
+                self.log("검색 인덱스가 없습니다. 다시 변환하면 검색 인덱스가 만들어집니다.")
+                return
+            results = search_interfaces(conn, query)
+            search_ms = (time.perf_counter() - started) * 1000
+        except Exception as e:
+            self.log(f"인터페이스 검색 중 오류 발생: {e}")
+            return
+        
+        for result in results:
+            self.search_tree.insert("", tk.END, values=[result[field] for field, _, _ in SEARCH_RESULT_COLUMNS])
+        self.log(f"'{query}' 검색 결과 {len(results)}건 (조회 {search_ms:.1f}ms)")
+    
+    def show_search_result(self, event):
+        # 선택한 검색 결과의 상세 정보를 매핑SEQ 검색으로 표시
+        selection = self.search_tree.selection()
+        if not selection:
+            return
+        self.search_var.set(self.search_tree.set(selection[0], 'mapping_seq'))
+        self.search_mapping_seq()
+    
+    def convert(self, table_names=None, auto=False):
+        # 변환 시작 (table_names가 없으면 작업공간 표에서 선택한 테이블, 선택이 없으면 전체)
+        if table_names is None:
+            table_names = list(self.table_tree.selection()) or None
+        self.log("자동 새로 고침: 바뀐 원본 변환 시작..." if auto else "변환 시작...")
+        self._auto_conversion = auto
+        self.convert_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.close_read_connection()
+        self.cancel_event.clear()
+        
+        # 화면 변수는 작업 스레드에서 읽을 수 없으므로 미리 값을 꺼내 전달
+        options = dict(self.current_options(), concurrency=self.workers_var.get(), order=self.order_var.get(),
+                       cancel_event=self.cancel_event)
+        self.convert_thread = threading.Thread(target=self.run_conversion, args=(self.workspace, table_names, options),
+                                               daemon=True)
+        self.convert_thread.start()
+    
+    def run_conversion(self, workspace, table_names, options):
+        # 작업 스레드에서 우선순위 순서로 변환을 실행하고 결과를 큐로 전달
+        try:
+            success = workspace.convert(table_names, log_callback=self.log, **options)
+            self.ui_queue.put(('done', success))
+        except ConversionCancelled as e:
+            self.ui_queue.put(('cancelled', e))
+        except Exception as e:
+            self.ui_queue.put(('error', e))
+    
+    def cancel_conversion(self):
+        # 진행 중인 변환에 취소 요청 (현재 배치 처리 후 중단)
+        self.cancel_event.set()
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.log("변환 취소 요청...")
+    
+    def finish_conversion(self, kind, value):
+        # 작업 스레드의 변환 결과 처리 (화면 스레드에서 호출)
+        self.convert_btn.config(state=tk.NORMAL)
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.convert_thread = None
+        self.update_table_status()
+        
+        if kind == 'done':
+            if value and not self._auto_conversion:
+                messagebox.showinfo("완료", f"변환이 완료되었습니다.\n데이터베이스 파일: {self.db_file}")
+        elif kind == 'cancelled':
+            self.log(f"{value} 마지막 커밋 이후 변경사항은 되돌렸습니다.")
+        else:
+            self.log(f"오류 발생: {value}")
+            messagebox.showerror("오류", f"변환 중 오류가 발생했습니다: {value}")
+    
+    def schedule_auto_refresh(self):
+        # 자동 새로 고침을 켜면 주기마다 auto_refresh를 예약하고, 끄면 예약을 취소
+        if self._auto_refresh_after_id is not None:
+            self.root.after_cancel(self._auto_refresh_after_id)
+            self._auto_refresh_after_id = None
+        if self.auto_refresh_var.get():
+            try:
+                interval = max(1, self.refresh_interval_var.get())
+            except tk.TclError:
+                interval = DEFAULT_REFRESH_INTERVAL
+            self._auto_refresh_after_id = self.root.after(interval * 1000, self.auto_refresh)
+    
+    def auto_refresh(self):
+        # 변환 중이 아니면 원본이 바뀐 테이블만 우선순위 순서로 변환
+        self._auto_refresh_after_id = None
+        if self.convert_thread is None:
+            try:
+                stale_tables = self.workspace.plan(stale_only=True, order=self.order_var.get(),
+                                                   options=self.current_options())
+            except Exception as e:
+                stale_tables = []
+                self.log(f"자동 새로 고침 중 오류 발생: {e}")
+            if stale_tables:
+                self.convert(stale_tables, auto=True)
+            else:
+                self.update_table_status()
+        self.schedule_auto_refresh()
+
+
+def run_gui():
+    root = tk.Tk()
+    app = ExcelToSqliteApp(root)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    run_gui()
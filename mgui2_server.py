@@ -0,0 +1,276 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, unquote, parse_qs
+
+from mgui2 import DEFAULT_DB_FILE, connect_read_only, format_interface_text, load_resolved_schema, lookup_interface
+
+# 조회 서비스 기본 주소와 포트
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 동시에 조회를 처리할 읽기 전용 연결 수와 결과 캐시에 보관할 최대 매핑SEQ 수
+DEFAULT_POOL_SIZE = 4
+DEFAULT_CACHE_SIZE = 10000
+
+# 요청이 없는 keep-alive 연결을 닫기까지 기다리는 시간(초)
+KEEP_ALIVE_TIMEOUT = 30
+
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    503: "Service Unavailable",
+}
+
+
+class ReadConnectionPool:
+    """
+    조회 요청이 나눠 쓰는 읽기 전용 연결 풀입니다.
+    
+    데이터베이스 파일 서명(inode, 수정 시각, 크기)이 바뀌면, 즉 다시 변환되면 기존 연결을 버리고
+    새 파일과 검색 스키마로 연결을 다시 엽니다.
+    """
+    
+    def __init__(self, db_file, size=DEFAULT_POOL_SIZE):
+        self.db_file = db_file
+        self.size = size
+        self.signature = None
+        self.schema = None
+        self._idle = []  # (연결, 서명, 스키마)
+        self._lock = threading.Lock()
+    
+    def refresh(self):
+        """
+        데이터베이스 파일이 바뀌었는지 확인합니다.
+        
+        Returns:
+            bool: 파일이 바뀌어 연결을 다시 열었으면 True (결과 캐시를 비워야 함)
+        """
+        stat = os.stat(self.db_file)
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if signature == self.signature:
+                return False
+            for conn, _, _ in self._idle:
+                conn.close()
+            conn = connect_read_only(self.db_file, check_same_thread=False)
+            self.schema = load_resolved_schema(conn.cursor())
+            self.signature = signature
+            self._idle = [(conn, signature, self.schema)]
+            return True
+    
+    def acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            signature, schema = self.signature, self.schema
+        return connect_read_only(self.db_file, check_same_thread=False), signature, schema
+    
+    def release(self, entry):
+        # 이전 파일의 연결이거나 풀이 가득 차 있으면 닫음
+        with self._lock:
+            if entry[1] == self.signature and len(self._idle) < self.size:
+                self._idle.append(entry)
+                return
+        entry[0].close()
+    
+    def lookup(self, mapping_seq):
+        """
+        매핑SEQ를 조회합니다.
+        
+        Returns:
+            tuple: (조회 결과, 조회에 사용한 연결의 데이터베이스 파일 서명)
+        """
+        entry = self.acquire()
+        try:
+            return lookup_interface(entry[0], entry[2], mapping_seq), entry[1]
+        finally:
+            self.release(entry)
+    
+    def close(self):
+        with self._lock:
+            for conn, _, _ in self._idle:
+                conn.close()
+            self._idle = []
+            self.signature = None
+
+
+class LookupCache:
+    """최근 조회한 매핑SEQ 결과를 보관하는 LRU 캐시입니다. 이벤트 루프 스레드에서만 사용합니다."""
+    
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self._items = OrderedDict()
+    
+    def __contains__(self, key):
+        return key in self._items
+    
+    def get(self, key):
+        self._items.move_to_end(key)
+        return self._items[key]
+    
+    def put(self, key, value):
+        if self.max_size <= 0:
+            return
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+    
+    def clear(self):
+        self._items.clear()
+    
+    def __len__(self):
+        return len(self._items)
+
+
+class LookupService:
+    """
+    변환된 데이터베이스를 조회하는 HTTP 서비스입니다.
+    
+    GET /mapping/{매핑SEQ} 요청에 lookup_interface 결과를 JSON으로 응답하며, ?format=text를 붙이면
+    검색 화면과 같은 텍스트로 응답합니다. 조회는 연결 풀 크기만큼의 스레드에서 동시에 처리합니다.
+    """
+    
+    def __init__(self, db_file=DEFAULT_DB_FILE, pool_size=DEFAULT_POOL_SIZE, cache_size=DEFAULT_CACHE_SIZE,
+                 log_callback=None):
+        if pool_size < 1:
+            raise ValueError(f"pool_size는 1 이상이어야 합니다: {pool_size}")
+        self.db_file = db_file
+        self.pool = ReadConnectionPool(db_file, pool_size)
+        self.cache = LookupCache(cache_size)
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="mgui2-lookup")
+        self.log = log_callback or print
+    
+    async def handle_client(self, reader, writer):
+        # HTTP/1.1 keep-alive 연결에서 요청을 차례로 처리
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    content_length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    content_length = -1
+                if content_length > 0:
+                    await reader.readexactly(content_length)
+                
+                parts = request_line.decode('latin-1').split()
+                version = parts[2] if len(parts) == 3 else "HTTP/1.0"
+                keep_alive = headers.get('connection', '').lower() != 'close' if version == "HTTP/1.1" \
+                    else headers.get('connection', '').lower() == 'keep-alive'
+                
+                if content_length < 0:
+                    # 본문의 끝을 알 수 없으므로 응답 후 연결을 닫음
+                    status, content_type, body = self.json_response(400, {'error': "Content-Length 헤더가 잘못되었습니다."})
+                    keep_alive = False
+                elif len(parts) != 3:
+                    status, content_type, body = self.json_response(400, {'error': "잘못된 요청입니다."})
+                else:
+                    status, content_type, body = await self.dispatch(parts[0], parts[1])
+                
+                writer.write(f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                             f"Content-Type: {content_type}\r\n"
+                             f"Content-Length: {len(body)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def dispatch(self, method, target):
+        url = urlsplit(target)
+        segments = [unquote(segment) for segment in url.path.strip('/').split('/')]
+        if len(segments) != 2 or segments[0] != 'mapping' or not segments[1].strip():
+            return self.json_response(404, {'error': "GET /mapping/{매핑SEQ} 형식으로 요청하세요."})
+        if method != 'GET':
+            return self.json_response(405, {'error': "GET 요청만 지원합니다."})
+        
+        mapping_seq = segments[1].strip()
+        try:
+            record = await self.lookup(mapping_seq)
+        except FileNotFoundError:
+            return self.json_response(503, {'error': f"데이터베이스 파일({self.db_file})이 존재하지 않습니다."})
+        except Exception as e:
+            return self.json_response(503, {'error': f"조회 중 오류가 발생했습니다: {e}"})
+        
+        if record is None:
+            return self.json_response(404, {'mapping_seq': mapping_seq, 'status': "없음"})
+        if parse_qs(url.query).get('format') == ['text']:
+            return 200, "text/plain; charset=utf-8", format_interface_text(record).encode('utf-8')
+        return self.json_response(200, record)
+    
+    async def lookup(self, mapping_seq):
+        # 데이터베이스가 다시 변환되었으면 캐시를 비우고, 캐시에 없는 매핑SEQ만 연결 풀에서 조회
+        # (파일 확인과 연결 다시 열기는 블로킹 작업이므로 이벤트 루프 밖에서 실행)
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(self.executor, self.pool.refresh):
+            self.cache.clear()
+        if mapping_seq in self.cache:
+            return self.cache.get(mapping_seq)
+        
+        record, signature = await loop.run_in_executor(self.executor, self.pool.lookup, mapping_seq)
+        # 조회하는 동안 다시 변환되어 캐시를 비웠다면 이전 파일의 결과는 캐시에 넣지 않음
+        if signature == self.pool.signature:
+            self.cache.put(mapping_seq, record)
+        return record
+    
+    def json_response(self, status, data):
+        return status, "application/json; charset=utf-8", json.dumps(data, ensure_ascii=False).encode('utf-8')
+    
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle_client, host, port)
+        self.log(f"매핑SEQ 조회 서비스 시작: http://{host}:{port}/mapping/{{매핑SEQ}} (데이터베이스: {self.db_file})")
+        async with server:
+            await server.serve_forever()
+    
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.pool.close()
+
+
+def run_server(db_file=DEFAULT_DB_FILE, host=DEFAULT_HOST, port=DEFAULT_PORT, pool_size=DEFAULT_POOL_SIZE,
+               cache_size=DEFAULT_CACHE_SIZE, log_callback=None):
+    """
+    매핑SEQ 조회 HTTP 서비스를 실행합니다. Ctrl+C로 종료합니다.
+    
+    Args:
+        db_file (str): 조회할 데이터베이스 파일
+        host (str): 바인드 주소
+        port (int): 포트
+        pool_size (int): 읽기 전용 연결 수 (동시 조회 수)
+        cache_size (int): 결과 캐시에 보관할 최대 매핑SEQ 수 (0이면 캐시 사용 안 함)
+        log_callback (function): 로그 메시지를 처리할 콜백 함수
+    """
+    log = log_callback or (lambda message: print(message, file=sys.stderr))
+    service = LookupService(db_file, pool_size, cache_size, log)
+    started = time.perf_counter()
+    try:
+        asyncio.run(service.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+        log(f"매핑SEQ 조회 서비스 종료 (실행 {time.perf_counter() - started:.0f}초)")
@@ -0,0 +1,423 @@
+import os
+import sys
+import json
+import time
+import zlib
+import array
+import shutil
+import struct
+import sqlite3
+
+from mgui2 import (
+    BULK_CACHE_SIZE_KB,
+    BULK_PAGE_SIZE,
+    INTERFACE_VIEW_TABLE,
+    SEARCH_INDEX_TABLE,
+    SNAPSHOT_FORMATS,
+    build_interface_view,
+    build_search_index,
+    connect_read_only,
+    load_resolved_schema,
+    replace_database_file,
+    search_index_tokenizer,
+)
+
+try:
+    import pyarrow
+    import pyarrow.parquet as parquet
+except ImportError:  # 없으면 열 청크 형식으로 저장
+    pyarrow = None
+
+try:
+    import zstandard
+except ImportError:  # 없으면 zlib으로 압축
+    zstandard = None
+
+# 스냅샷 메타데이터 파일 이름과 형식 버전
+SNAPSHOT_META_FILE = "snapshot.json"
+SNAPSHOT_VERSION = 1
+
+# 열 청크 파일의 시작 표시와 확장자
+COLUMN_FILE_MAGIC = b"M2COL1\n"
+COLUMN_FILE_SUFFIX = ".m2c"
+
+# 한 청크(Parquet 행 그룹)에 담는 행 수
+SNAPSHOT_CHUNK_ROWS = 65536
+
+# 압축 수준 (zstd, zlib)
+ZSTD_LEVEL = 9
+ZLIB_LEVEL = 6
+
+# 서로 다른 값이 청크 행 수의 이 비율 이하인 열은 사전(dictionary) 인코딩
+DICTIONARY_MAX_RATIO = 0.5
+
+# 열 블록 인코딩 표시: 값 목록 그대로, 사전 + 2바이트 번호, 사전 + 4바이트 번호
+PLAIN_BLOCK = b'P'
+DICTIONARY_BLOCK_16 = b'H'
+DICTIONARY_BLOCK_32 = b'I'
+
+# SQLite 값 타입별 Arrow 타입 (열의 값이 한 가지 타입일 때만 Parquet으로 저장)
+ARROW_TYPES = {
+    'integer': 'int64',
+    'real': 'float64',
+    'text': 'string',
+}
+
+
+def snapshot_codec():
+    """사용할 수 있는 압축 방식 이름을 반환합니다 (zstandard가 있으면 'zstd', 없으면 'zlib')."""
+    return 'zstd' if zstandard is not None else 'zlib'
+
+
+def make_compressor(codec):
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress
+    return lambda data: zlib.compress(data, ZLIB_LEVEL)
+
+
+def make_decompressor(codec):
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축한 스냅샷을 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().decompress
+    return zlib.decompress
+
+
+def encode_column_block(values):
+    """
+    한 청크의 열 값을 블록으로 인코딩합니다.
+    
+    QMGR, DB, 어댑터처럼 같은 값이 반복되는 열은 서로 다른 값 목록(사전)과 값마다의 사전 번호로,
+    나머지 열은 값 목록 그대로 저장합니다. 값은 SQLite 타입(NULL, 정수, 실수, 문자열)을 그대로 유지합니다.
+    
+    Args:
+        values (tuple): 열 값
+    
+    Returns:
+        bytes: 인코딩 표시 1바이트로 시작하는 블록 (압축 전)
+    """
+    # 1과 1.0은 dict 키로 같으므로 타입까지 구분
+    distinct = {}
+    indices = []
+    for value in values:
+        if isinstance(value, bytes):
+            raise ValueError("BLOB 값은 스냅샷에 저장할 수 없습니다.")
+        key = (type(value), value)
+        index = distinct.get(key)
+        if index is None:
+            index = distinct[key] = len(distinct)
+        indices.append(index)
+    
+    if values and len(distinct) <= len(values) * DICTIONARY_MAX_RATIO:
+        dictionary = json.dumps([value for _, value in distinct], ensure_ascii=False).encode('utf-8')
+        block_type, typecode = (DICTIONARY_BLOCK_16, 'H') if len(distinct) <= 0xFFFF else (DICTIONARY_BLOCK_32, 'I')
+        numbers = array.array(typecode, indices)
+        if sys.byteorder != 'little':
+            numbers.byteswap()
+        return block_type + struct.pack('<I', len(dictionary)) + dictionary + numbers.tobytes()
+    return PLAIN_BLOCK + json.dumps(values, ensure_ascii=False).encode('utf-8')
+
+
+def decode_column_block(block):
+    """encode_column_block으로 만든 블록을 열 값 목록으로 되돌립니다."""
+    block_type, body = block[:1], block[1:]
+    if block_type == PLAIN_BLOCK:
+        return json.loads(body)
+    
+    typecode = {DICTIONARY_BLOCK_16: 'H', DICTIONARY_BLOCK_32: 'I'}.get(block_type)
+    if typecode is None:
+        raise ValueError(f"알 수 없는 열 블록 형식입니다: {block_type!r}")
+    (dictionary_size,) = struct.unpack_from('<I', body)
+    dictionary = json.loads(body[4:4 + dictionary_size])
+    numbers = array.array(typecode)
+    numbers.frombytes(body[4 + dictionary_size:])
+    if sys.byteorder != 'little':
+        numbers.byteswap()
+    return [dictionary[index] for index in numbers]
+
+
+def snapshot_tables(cursor):
+    """
+    스냅샷에 저장할 테이블 이름을 반환합니다.
+    
+    검색 인덱스(FTS5와 그 내부 테이블)와 상세 정보 테이블은 book1/book2에서 다시 만들 수 있으므로
+    제외하고, 변환 기록(manifest), 검색 스키마, 헤더 기록 같은 메타데이터 테이블은 포함합니다.
+    """
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\' "
+                   "ORDER BY name")
+    return [name for (name,) in cursor.fetchall()
+            if name != INTERFACE_VIEW_TABLE and name != SEARCH_INDEX_TABLE
+            and not name.startswith(f"{SEARCH_INDEX_TABLE}_")]
+
+
+def column_arrow_type(cursor, table_name, column_name):
+    """열 값이 한 가지 SQLite 타입이면 해당 Arrow 타입 이름을 반환합니다. 여러 타입이 섞였으면 None."""
+    cursor.execute(f"SELECT DISTINCT typeof({column_name}) FROM {table_name}")
+    value_types = {value_type for (value_type,) in cursor.fetchall()} - {'null'}
+    if not value_types:
+        return 'string'
+    if len(value_types) > 1:
+        return None
+    return ARROW_TYPES.get(value_types.pop())
+
+
+def write_parquet_table(cursor, table_name, columns, arrow_types, path, chunk_rows):
+    # 반복 값이 많은 열은 Parquet 사전 인코딩으로, 청크는 행 그룹으로 저장
+    schema = pyarrow.schema([(col, getattr(pyarrow, arrow_type)()) for col, arrow_type in zip(columns, arrow_types)])
+    writer = parquet.ParquetWriter(path, schema, compression='zstd', use_dictionary=True)
+    try:
+        cursor.execute(f"SELECT * FROM {table_name}")
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            writer.write_table(pyarrow.Table.from_arrays(
+                [pyarrow.array(values, type=schema.field(i).type) for i, values in enumerate(zip(*rows))],
+                schema=schema))
+    finally:
+        writer.close()
+
+
+def iter_parquet_rows(path, chunk_rows):
+    for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+        yield list(zip(*(column.to_pylist() for column in batch.columns)))
+
+
+def write_column_table(cursor, table_name, path, chunk_rows, codec):
+    """
+    테이블을 열 청크 파일로 저장합니다.
+    
+    파일은 COLUMN_FILE_MAGIC 뒤에 청크가 이어지며, 청크마다 행 수(4바이트)와 열별 압축 블록
+    (블록 길이 4바이트 + 압축한 encode_column_block 결과)을 담습니다.
+    """
+    compress = make_compressor(codec)
+    with open(path, 'wb') as f:
+        f.write(COLUMN_FILE_MAGIC)
+        cursor.execute(f"SELECT * FROM {table_name}")
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            f.write(struct.pack('<I', len(rows)))
+            for values in zip(*rows):
+                block = compress(encode_column_block(values))
+                f.write(struct.pack('<I', len(block)))
+                f.write(block)
+
+
+def iter_column_rows(path, column_count, codec):
+    # 열 청크 파일을 청크 단위의 행 목록으로 읽음
+    decompress = make_decompressor(codec)
+    with open(path, 'rb') as f:
+        if f.read(len(COLUMN_FILE_MAGIC)) != COLUMN_FILE_MAGIC:
+            raise ValueError(f"열 청크 파일 형식이 아닙니다: {path}")
+        while True:
+            header = f.read(4)
+            if not header:
+                break
+            (row_count,) = struct.unpack('<I', header)
+            columns = []
+            for _ in range(column_count):
+                (block_size,) = struct.unpack('<I', f.read(4))
+                values = decode_column_block(decompress(f.read(block_size)))
+                if len(values) != row_count:
+                    raise ValueError(f"열 청크의 행 수가 맞지 않습니다: {path}")
+                columns.append(values)
+            yield list(zip(*columns))
+
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def export_snapshot(db_file, snapshot_dir, format='auto', chunk_rows=SNAPSHOT_CHUNK_ROWS, log_callback=None):
+    """
+    변환된 데이터베이스를 압축한 열 단위 스냅샷 디렉터리로 내보냅니다.
+    
+    테이블마다 파일 하나를 만들고, 테이블/인덱스 정의와 행 수는 snapshot.json에 기록합니다.
+    format이 'auto'이면 pyarrow가 있을 때 Parquet(zstd, 사전 인코딩)으로, 없거나 열에 여러 타입의
+    값이 섞인 테이블은 열 청크 형식(zstd 또는 zlib)으로 저장합니다. 검색 인덱스와 상세 정보 테이블은
+    저장하지 않고 가져올 때 다시 만듭니다. 임시 디렉터리에 모두 쓴 뒤 교체하므로 중간에 실패해도
+    기존 스냅샷은 그대로 남습니다.
+    
+    Args:
+        db_file (str): 내보낼 데이터베이스 파일
+        snapshot_dir (str): 스냅샷 디렉터리 (있으면 교체)
+        format (str): 'auto', 'parquet', 'columns'
+        chunk_rows (int): 청크(Parquet 행 그룹) 한 개의 행 수
+        log_callback (function): 로그 메시지를 처리할 콜백 함수
+    
+    Returns:
+        dict: {'tables': 테이블 수, 'rows': 전체 행 수, 'bytes': 스냅샷 크기, 'seconds': 걸린 시간}
+    """
+    log = log_callback or print
+    if format not in SNAPSHOT_FORMATS:
+        raise ValueError(f"지원하지 않는 스냅샷 형식입니다: {format}")
+    if format == 'parquet' and pyarrow is None:
+        raise RuntimeError("Parquet 스냅샷을 만들려면 pyarrow 패키지가 필요합니다.")
+    if not os.path.exists(db_file):
+        raise FileNotFoundError(f"데이터베이스 파일({db_file})이 존재하지 않습니다.")
+    
+    started = time.perf_counter()
+    codec = snapshot_codec()
+    work_dir = f"{snapshot_dir.rstrip(os.sep)}.tmp"
+    if os.path.exists(work_dir):
+        shutil.rmtree(work_dir)
+    os.makedirs(work_dir)
+    
+    conn = connect_read_only(db_file)
+    try:
+        cursor = conn.cursor()
+        meta = {
+            'version': SNAPSHOT_VERSION,
+            'codec': codec,
+            'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'search_index': search_index_tokenizer(conn) is not None,
+            'interface_view': load_resolved_schema(cursor).interface_view,
+            'tables': {},
+        }
+        total_rows = 0
+        for table_name in snapshot_tables(cursor):
+            table_started = time.perf_counter()
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,))
+            create_sql = cursor.fetchone()[0]
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                           (table_name,))
+            index_sqls = [sql for (sql,) in cursor.fetchall()]
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            columns = [column[1] for column in cursor.fetchall()]
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            row_count = cursor.fetchone()[0]
+            
+            # Parquet은 열마다 타입이 하나여야 하므로 타입이 섞인 테이블은 열 청크 형식으로 저장
+            arrow_types = None
+            if format != 'columns' and pyarrow is not None:
+                arrow_types = [column_arrow_type(cursor, table_name, col) for col in columns]
+                if None in arrow_types:
+                    if format == 'parquet':
+                        log(f"[{table_name}] 열에 여러 타입의 값이 섞여 있어 열 청크 형식으로 저장합니다.")
+                    arrow_types = None
+            
+            if arrow_types is not None:
+                file_name, table_format = f"{table_name}.parquet", 'parquet'
+                write_parquet_table(cursor, table_name, columns, arrow_types, os.path.join(work_dir, file_name),
+                                    chunk_rows)
+            else:
+                file_name, table_format = f"{table_name}{COLUMN_FILE_SUFFIX}", 'columns'
+                write_column_table(cursor, table_name, os.path.join(work_dir, file_name), chunk_rows, codec)
+            
+            meta['tables'][table_name] = {
+                'file': file_name,
+                'format': table_format,
+                'columns': columns,
+                'rows': row_count,
+                'create_sql': create_sql,
+                'index_sqls': index_sqls,
+            }
+            total_rows += row_count
+            size = os.path.getsize(os.path.join(work_dir, file_name))
+            log(f"[{table_name}] {row_count}행 → {size / 1024:,.1f}KB ({table_format}, "
+                f"{time.perf_counter() - table_started:.1f}초)")
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    finally:
+        conn.close()
+    
+    with open(os.path.join(work_dir, SNAPSHOT_META_FILE), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    
+    # 완성된 스냅샷으로 기존 디렉터리를 교체
+    if os.path.exists(snapshot_dir):
+        shutil.rmtree(snapshot_dir)
+    os.rename(work_dir, snapshot_dir)
+    
+    snapshot_size = directory_size(snapshot_dir)
+    elapsed = time.perf_counter() - started
+    log(f"스냅샷 '{snapshot_dir}' 저장 완료: {len(meta['tables'])}개 테이블, {total_rows}행, "
+        f"{snapshot_size / 1024:,.1f}KB (데이터베이스 {os.path.getsize(db_file) / 1024:,.1f}KB), {elapsed:.1f}초")
+    return {'tables': len(meta['tables']), 'rows': total_rows, 'bytes': snapshot_size, 'seconds': elapsed}
+
+
+def import_snapshot(snapshot_dir, db_file, log_callback=None):
+    """
+    스냅샷 디렉터리에서 데이터베이스를 다시 만듭니다.
+    
+    엑셀을 다시 파싱하지 않고 저장된 열 값을 그대로 적재하므로 변환보다 훨씬 빠릅니다. 대량 적재와
+    같이 작업 파일에 저널 없이 적재한 뒤 인덱스, 검색 인덱스, 상세 정보 테이블을 만들고 원래 파일
+    위치로 교체합니다.
+    
+    Args:
+        snapshot_dir (str): export_snapshot으로 만든 스냅샷 디렉터리
+        db_file (str): 만들 데이터베이스 파일 (있으면 교체)
+        log_callback (function): 로그 메시지를 처리할 콜백 함수
+    
+    Returns:
+        dict: {'tables': 테이블 수, 'rows': 전체 행 수, 'bytes': 데이터베이스 크기, 'seconds': 걸린 시간}
+    """
+    log = log_callback or print
+    with open(os.path.join(snapshot_dir, SNAPSHOT_META_FILE), encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 버전입니다: {meta.get('version')}")
+    
+    started = time.perf_counter()
+    work_file = f"{db_file}.importing"
+    if os.path.exists(work_file):
+        os.remove(work_file)
+    
+    conn = sqlite3.connect(work_file)
+    succeeded = False
+    try:
+        conn.execute(f"PRAGMA page_size = {BULK_PAGE_SIZE}")
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(f"PRAGMA cache_size = -{BULK_CACHE_SIZE_KB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        cursor = conn.cursor()
+        
+        total_rows = 0
+        for table_name, table in meta['tables'].items():
+            table_started = time.perf_counter()
+            path = os.path.join(snapshot_dir, table['file'])
+            if table['format'] == 'parquet':
+                if pyarrow is None:
+                    raise RuntimeError("Parquet 스냅샷을 읽으려면 pyarrow 패키지가 필요합니다.")
+                chunks = iter_parquet_rows(path, SNAPSHOT_CHUNK_ROWS)
+            else:
+                chunks = iter_column_rows(path, len(table['columns']), meta['codec'])
+            
+            cursor.execute(table['create_sql'])
+            insert_sql = f"INSERT INTO {table_name} VALUES ({', '.join('?' * len(table['columns']))})"
+            row_count = 0
+            for rows in chunks:
+                cursor.executemany(insert_sql, rows)
+                row_count += len(rows)
+            if row_count != table['rows']:
+                raise ValueError(f"[{table_name}] 스냅샷 행 수가 맞지 않습니다 ({row_count}/{table['rows']})")
+            
+            # 적재가 끝난 뒤 인덱스 생성
+            for index_sql in table['index_sqls']:
+                cursor.execute(index_sql)
+            total_rows += row_count
+            log(f"[{table_name}] {row_count}행 적재 완료 ({time.perf_counter() - table_started:.1f}초)")
+        
+        # 스냅샷에 저장하지 않은 검색 인덱스와 상세 정보 테이블을 다시 만듦
+        schema = load_resolved_schema(cursor)
+        if meta.get('search_index'):
+            build_search_index(cursor, schema, log)
+        if meta.get('interface_view'):
+            build_interface_view(cursor, schema, log)
+        
+        conn.commit()
+        succeeded = True
+    finally:
+        conn.close()
+        if not succeeded and os.path.exists(work_file):
+            os.remove(work_file)
+    
+    replace_database_file(work_file, db_file)
+    elapsed = time.perf_counter() - started
+    log(f"스냅샷 '{snapshot_dir}'에서 데이터베이스 '{db_file}'를 만들었습니다: {len(meta['tables'])}개 테이블, "
+        f"{total_rows}행, {elapsed:.1f}초")
+    return {'tables': len(meta['tables']), 'rows': total_rows, 'bytes': os.path.getsize(db_file), 'seconds': elapsed}